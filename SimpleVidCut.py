@@ -1,50 +1,33 @@
-import sys, os, shutil, subprocess, math, time
-from typing import Optional, List
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QEvent, QTimer, QRect, QSize
-from PyQt5.QtGui import QImage, QPixmap, QIntValidator, QIcon, QColor, QKeySequence, QPainter, QPen
+import sys, os, subprocess, math, time, threading, collections, weakref
+from typing import Optional, List, Dict
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QEvent, QTimer, QRect, QSize, QPoint, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
+)
+from PyQt5.QtGui import QImage, QPixmap, QIntValidator, QIcon, QColor, QKeySequence, QPainter, QPen, QPalette, QBrush
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QGridLayout,
     QListWidget, QPushButton, QLabel, QSlider, QFileDialog, QGroupBox, QLineEdit,
     QDoubleSpinBox, QSpinBox, QComboBox, QMessageBox, QSizePolicy, QCheckBox, QProgressBar,
-    QRadioButton, QStyle, QDialog, QDialogButtonBox, QAbstractItemView, QShortcut
+    QRadioButton, QStyle, QDialog, QDialogButtonBox, QAbstractItemView, QShortcut,
+    QTableWidget, QTableWidgetItem, QHeaderView, QTableView, QStyledItemDelegate
 )
 
-# Avoid OpenCV python-loader recursion in frozen executables (PyInstaller on Windows).
-if getattr(sys, "frozen", False):
-    os.environ.setdefault("OPENCV_SKIP_PYTHON_LOADER", "1")
-
+# vidcut_core 가 OpenCV 로더 설정과 로그 억제를 먼저 처리한다
+from vidcut_core import (
+    PacketIndex, ExportSettings, ExportMeter, BatchExportRunner, ManifestResults, ProxyCache, ThumbnailStore,
+    BATCH_EXPORT_WORKERS, EXPORT_CHUNKS_MAX, PROXY_MAX_HEIGHT,
+    _export_task, _load_manifest, _validate_manifest, _manifest_tasks, _manifest_results_path, _manifest_files,
+    _find_ffmpeg_tool, _fourcc_tag, _export_profile, _export_speed_model, _export_worker_plan,
+    _run_export_task, _terminate_process, _crop_size_error, _normalize_crop_rect, _validated_crop_rect,
+    _crop_filter, _duration_seconds, _resolve_cut_range, _output_path, _build_cut_command,
+    _build_multi_range_command, _smart_cut_spec, _chunked_encode_spec, _meta_tuple, _video_probe,
+    _proxy_recommended, _video_catalog, _parse_catalog_query, _catalog_match,
+)
 import cv2
 import numpy as np
 
 
-def _quiet_opencv_logging():
-    # Random access on some H.264 files can produce noisy decoder warnings on stderr.
-    try:
-        if hasattr(cv2, "utils") and hasattr(cv2.utils, "logging"):
-            log_api = cv2.utils.logging
-            if hasattr(log_api, "setLogLevel"):
-                level = getattr(log_api, "LOG_LEVEL_SILENT", None)
-                if level is None:
-                    level = getattr(log_api, "LOG_LEVEL_ERROR", None)
-                if level is not None:
-                    log_api.setLogLevel(level)
-                    return
-    except Exception:
-        pass
-    try:
-        if hasattr(cv2, "setLogLevel"):
-            level = getattr(cv2, "LOG_LEVEL_SILENT", None)
-            if level is None:
-                level = getattr(cv2, "LOG_LEVEL_ERROR", None)
-            if level is not None:
-                cv2.setLogLevel(level)
-    except Exception:
-        pass
-
-
-_quiet_opencv_logging()
-
-
 def _resource_base_dir() -> str:
     if getattr(sys, "frozen", False):
         return os.path.dirname(sys.executable)
@@ -56,28 +39,58 @@ def _find_app_icon_path() -> str:
     return cand if os.path.isfile(cand) else ""
 
 
-# ---------------------------- Video worker thread ----------------------------
-class VideoThread(QThread):
-    frameReady = pyqtSignal(QImage, int)   # image, frame_index
-    playbackEnded = pyqtSignal()
+# ------------------------------ Decoder backends ------------------------------
+class DecoderBackend:
+    """Frame source behind VideoThread, used from its decode thread only.
+
+    ``position`` is the presentation-order index of the frame the next ``read()`` or
+    ``grab()`` returns; ``seek()`` must make that exact. Backends with
+    ``applies_filters`` scale and adjust frames themselves (see ``configure``).
+    """
+
+    name = ""
+    label = ""
+    applies_filters = False
 
     def __init__(self, path: str):
-        super().__init__()
         self.path = path
-        self.cap: Optional[cv2.VideoCapture] = None
         self.fps = 30.0
         self.total = 0
         self.width = 0
         self.height = 0
-        self.playing = False
-        self.speed = 1.0
-        self.contrast = 1.0
-        self.brightness = 0.0
-        self.saturation = 1.0
-        self._seek_to: Optional[int] = None
-        self.current_idx = 0
-        self._stop = False
-        self._next_frame_deadline: Optional[float] = None
+        self.codec = ""
+        self.position = 0
+
+    @property
+    def frame_shape(self):
+        return self.height, self.width, 3
+
+    def open(self) -> bool:
+        raise NotImplementedError
+
+    def read(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+    def grab(self) -> bool:
+        return self.read() is not None
+
+    def seek(self, idx: int):
+        raise NotImplementedError
+
+    def configure(self, display_size, adjustments):
+        pass
+
+    def release(self):
+        pass
+
+
+class OpenCVDecoder(DecoderBackend):
+    name = "opencv"
+    label = "OpenCV"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.cap: Optional[cv2.VideoCapture] = None
 
     def open(self) -> bool:
         self.cap = cv2.VideoCapture(self.path)
@@ -88,154 +101,1175 @@ class VideoThread(QThread):
         self.total = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)) or 0
         self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 0
         self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 0
+        self.codec = _fourcc_tag(self.cap)
+        self.position = 0
+        return True
+
+    def read(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        if not ret:
+            return None
+        self.position += 1
+        return frame
+
+    def grab(self) -> bool:
+        # grab() decodes but skips retrieve and the BGR conversion.
+        if not self.cap.grab():
+            return False
+        self.position += 1
+        return True
+
+    def seek(self, idx: int):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+        self.position = idx
+
+    def release(self):
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+
+class FFmpegPipeDecoder(DecoderBackend):
+    """Decodes with an ffmpeg child process writing bgr24 ``rawvideo`` to a pipe.
+
+    ffmpeg decodes multithreaded and applies ``scale`` and the same ``eq`` filter the
+    export uses, so the preview matches the export and none of that work holds the
+    GIL. A seek or a filter change restarts the process at ``position``.
+    """
+
+    name = "ffmpeg"
+    label = "FFmpeg pipe"
+    applies_filters = True
+
+    def __init__(self, path: str, packet_index: Optional[PacketIndex] = None):
+        super().__init__(path)
+        self.packet_index = packet_index
+        self.src_width = 0
+        self.src_height = 0
+        self._filters = ("", (0, 0))
+        self._proc = None
+        self._eof = False
+        self._discard: Optional[np.ndarray] = None
+
+    def open(self) -> bool:
+        ffmpeg = _find_ffmpeg_tool("ffmpeg")
+        meta = _meta_tuple(_video_probe().probe(self.path)) if ffmpeg else None
+        if not meta:
+            return False
+        self.fps, self.total, self.src_width, self.src_height, self.codec = meta
+        self._ffmpeg = ffmpeg
+        self.width, self.height = self.src_width, self.src_height
+        self.position = 0
+        return self.src_width > 0 and self.src_height > 0
+
+    def configure(self, display_size, adjustments):
+        width, height = self.src_width, self.src_height
+        display_w, display_h = display_size
+        if display_w > 0 and display_h > 0:
+            scale = min(1.0, display_w / float(width), display_h / float(height))
+            width = max(2, int(width * scale / 2.0) * 2)
+            height = max(2, int(height * scale / 2.0) * 2)
+        vf = []
+        if (width, height) != (self.src_width, self.src_height):
+            vf.append(f"scale={width}:{height}:flags=area")
+        if not EqAdjuster.is_identity(*adjustments):
+            vf.append("eq=contrast={:.3f}:brightness={:.3f}:saturation={:.3f}".format(*adjustments))
+        filters = (",".join(vf), (width, height))
+        if filters != self._filters:
+            self._filters = filters
+            self.width, self.height = width, height
+            self._close_pipe()
+
+    def _seek_seconds(self, idx: int) -> float:
+        # Aim half a frame early: ffmpeg's accurate seek drops frames before the target time.
+        index = self.packet_index
+        if index is not None and index.ready and 0 <= idx < index.pts.size:
+            t = float(index.pts[idx] - index.pts[0])
+        else:
+            t = idx / self.fps
+        return max(0.0, t - 0.5 / self.fps)
+
+    def _spawn(self):
+        cmd = [self._ffmpeg, "-v", "error", "-nostdin", "-threads", str(os.cpu_count() or 1)]
+        if self.position > 0:
+            cmd += ["-ss", f"{self._seek_seconds(self.position):.6f}"]
+        cmd += ["-i", self.path, "-map", "0:v:0", "-an", "-sn"]
+        if self._filters[0]:
+            cmd += ["-vf", self._filters[0]]
+        cmd += ["-fps_mode", "passthrough", "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self._eof = False
+
+    def read(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        if self._eof:
+            return None
+        if self._proc is None:
+            self._spawn()
+        shape = self.frame_shape
+        buf = out if out is not None and out.shape == shape else np.empty(shape, dtype=np.uint8)
+        view = memoryview(buf).cast("B")
+        got = 0
+        while got < len(view):
+            n = self._proc.stdout.readinto(view[got:])
+            if not n:
+                self._eof = True
+                return None
+            got += n
+        self.position += 1
+        return buf
+
+    def grab(self) -> bool:
+        # The pipe always carries the whole frame; read skipped ones into one reused buffer.
+        if self._discard is None or self._discard.shape != self.frame_shape:
+            self._discard = np.empty(self.frame_shape, dtype=np.uint8)
+        return self.read(self._discard) is not None
+
+    def seek(self, idx: int):
+        if idx != self.position or self._eof:
+            self._close_pipe()
+            self.position = idx
+
+    def _close_pipe(self):
+        proc, self._proc = self._proc, None
+        self._eof = False
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.stdout.close()
+            proc.wait()
+        except Exception:
+            pass
+
+    def release(self):
+        self._close_pipe()
+
+
+DECODER_BACKENDS = (OpenCVDecoder, FFmpegPipeDecoder)
+
+
+# ---------------------------- Video worker thread ----------------------------
+PREVIEW_RING_DEPTH = 8          # decoded frames kept ahead of presentation
+PREVIEW_RING_BUDGET_MB = 256    # upper bound for the ring, whatever the frame size
+PREVIEW_CACHE_BUDGET_MB = 384   # rendered frames kept around the current position
+PREVIEW_CACHE_GOPS = True       # keep every frame of a GOP decoded for a seek
+SCRUB_PREVIEW_MAX_WIDTH = 640   # slider-drag previews are keyframes decoded at this width
+SCRUB_PREVIEW_CACHE_FRAMES = 64
+PLAYBACK_MIN_PRESENT_HZ = 4.0   # even when far behind, show at least this many frames per second
+
+
+class _FrameRing:
+    """Bounded FIFO of ready-to-display frames between the decode and presentation loops.
+
+    Every flush bumps ``generation``; producers tag frames with the generation they
+    were decoded under so frames that straddle a flush are rejected instead of shown.
+    The ring can share its condition variable with its owner, so a ring change and a
+    control command wake the same waiters.
+    """
+
+    def __init__(self, capacity: int, cond: Optional[threading.Condition] = None):
+        self._items = collections.deque()
+        self._cond = cond if cond is not None else threading.Condition()
+        self.capacity = max(1, int(capacity))
+        self.generation = 0
+
+    def set_capacity(self, capacity: int):
+        with self._cond:
+            self.capacity = max(1, int(capacity))
+            self._cond.notify_all()
+
+    def flush(self) -> int:
+        with self._cond:
+            self._items.clear()
+            self.generation += 1
+            self._cond.notify_all()
+            return self.generation
+
+    def has_space(self) -> bool:
+        with self._cond:
+            return len(self._items) < self.capacity
+
+    def put(self, generation: int, item) -> bool:
+        with self._cond:
+            if generation != self.generation:
+                return False
+            self._items.append((generation, item))
+            self._cond.notify_all()
+            return True
+
+    def peek(self):
+        with self._cond:
+            return self._items[0] if self._items else None
+
+    def pop(self):
+        with self._cond:
+            entry = self._items.popleft() if self._items else None
+            self._cond.notify_all()
+            return entry
+
+    def __len__(self):
+        with self._cond:
+            return len(self._items)
+
+
+class EqAdjuster:
+    """Preview counterpart of ffmpeg's ``eq`` filter as 8-bit lookup tables.
+
+    With gamma 1, ffmpeg (libavfilter/vf_eq.c, ``process_c``) keeps each setting as a C
+    float and maps code ``i`` of a plane through ``(i * c >> 12) + b`` clamped to 0..255,
+    with ``c = (int)(gain * 4096)`` and ``b = (int)(100 * offset + 100) * 511 / 200 - 128 - c / 32``;
+    gain/offset are contrast/brightness for luma and saturation/0 for chroma, and a plane
+    with gain 1 and offset 0 is left as it is. It does so on the source's limited-range
+    YUV, while OpenCV gives us full-range YCrCb, so each table is composed as
+    full -> limited -> eq -> full. Tables are rebuilt only when a setting changes;
+    per frame the work is two colour conversions and one in-place LUT.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._lut = None
+
+    @staticmethod
+    def is_identity(contrast: float, brightness: float, saturation: float) -> bool:
+        return abs(contrast - 1.0) <= 1e-6 and abs(brightness) <= 1e-6 and abs(saturation - 1.0) <= 1e-6
+
+    @staticmethod
+    def _eq_table(gain: float, offset: float) -> np.ndarray:
+        gain, offset = float(np.float32(gain)), float(np.float32(offset))   # eq 옵션은 float로 저장된다
+        if gain == 1.0 and offset == 0.0:
+            return np.arange(256, dtype=np.int32)    # ffmpeg은 이 평면을 건드리지 않는다
+        c = int(gain * 4096)
+        b = int(100.0 * offset + 100.0) * 511 // 200 - 128 - int(c / 32)
+        return np.clip((np.arange(256, dtype=np.int64) * c >> 12) + b, 0, 255).astype(np.int32)
+
+    @staticmethod
+    def _through_limited_range(table: np.ndarray, lo: int, span: float) -> np.ndarray:
+        full = np.arange(256, dtype=np.float64)
+        limited = np.clip(np.rint(lo + full * span / 255.0), 0, 255).astype(np.int32)
+        out = (table[limited] - lo) * 255.0 / span
+        return np.clip(np.rint(out), 0, 255).astype(np.uint8)
+
+    def table(self, contrast: float, brightness: float, saturation: float) -> np.ndarray:
+        key = (float(contrast), float(brightness), float(saturation))
+        if key != self._key:
+            luma = self._through_limited_range(self._eq_table(key[0], key[1]), 16, 219.0)
+            chroma = self._through_limited_range(self._eq_table(key[2], 0.0), 16, 224.0)
+            self._lut = np.dstack((luma, chroma, chroma)).reshape(1, 256, 3)
+            self._key = key
+        return self._lut
+
+    def apply(self, frame, contrast: float, brightness: float, saturation: float, scratch=None, out=None):
+        """Return the adjusted frame; ``scratch``/``out`` may be preallocated buffers (``out`` may be ``frame``)."""
+        if self.is_identity(contrast, brightness, saturation):
+            return frame
+        lut = self.table(contrast, brightness, saturation)
+        ycc = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb, dst=scratch)
+        cv2.LUT(ycc, lut, dst=ycc)
+        return cv2.cvtColor(ycc, cv2.COLOR_YCrCb2BGR, dst=out)
+
+
+_QIMAGE_BGR888 = getattr(QImage, "Format_BGR888", None)   # Qt >= 5.14 shows OpenCV BGR as-is
+
+
+class PreviewFrame:
+    """Display-ready frame: a QImage that views a pooled numpy buffer without copying.
+
+    Whoever holds the PreviewFrame owns the pixels (ring, cache, preview widget). When
+    the last reference is dropped the buffer goes back to its pool, so ``image`` must
+    never be kept without the frame that backs it.
+    """
+
+    __slots__ = ("buffer", "image", "__weakref__")
+
+    def __init__(self, buffer: np.ndarray, fmt, pool: Optional["_FramePool"] = None):
+        h, w = buffer.shape[:2]
+        self.buffer = buffer
+        self.image = QImage(buffer.data, w, h, buffer.strides[0], fmt)
+        if pool is not None:
+            weakref.finalize(self, pool.release, buffer)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.buffer.nbytes)
+
+
+class _FramePool:
+    """Free lists of uint8 frame buffers by shape, shared by decode and presentation."""
+
+    def __init__(self, max_free_per_shape: int = 16):
+        self._free = {}
+        self._lock = threading.Lock()
+        self.max_free_per_shape = max(0, int(max_free_per_shape))
+
+    def take(self, shape) -> np.ndarray:
+        shape = tuple(int(v) for v in shape)
+        with self._lock:
+            free = self._free.get(shape)
+            if free:
+                return free.pop()
+        return np.empty(shape, dtype=np.uint8)
+
+    def release(self, buffer: np.ndarray):
+        if buffer is None or not buffer.flags.c_contiguous:
+            return
+        with self._lock:
+            free = self._free.setdefault(buffer.shape, [])
+            if len(free) < self.max_free_per_shape:
+                free.append(buffer)
+
+    def clear(self):
+        with self._lock:
+            self._free.clear()
+
+    def wrap(self, buffer: np.ndarray, fmt) -> PreviewFrame:
+        return PreviewFrame(buffer, fmt, self)
+
+
+class _DecodedFrameCache:
+    """Rendered frames around the current position, bounded by memory.
+
+    Eviction drops the frame farthest from ``center`` first, so the neighbourhood of
+    a cut point survives repeated back-and-forth stepping. ``clear()`` bumps ``epoch``
+    and frames rendered under an older epoch are refused.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self._frames = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.budget_bytes = max(0, int(budget_bytes))
+        self.center = 0
+        self.epoch = 0
+
+    def get(self, idx: int):
+        with self._lock:
+            return self._frames.get(idx)
+
+    def put(self, epoch: int, idx: int, frame: PreviewFrame):
+        if self.budget_bytes <= 0 or frame is None:
+            return
+        with self._lock:
+            if epoch != self.epoch or idx in self._frames:
+                return
+            self._frames[idx] = frame
+            self._bytes += frame.nbytes
+            while self._bytes > self.budget_bytes and len(self._frames) > 1:
+                center = self.center
+                far = max(self._frames, key=lambda k: abs(k - center))
+                self._bytes -= self._frames.pop(far).nbytes
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+            self.epoch += 1
+
+
+class _PresentationClock:
+    """Wall-clock due time of every frame in the current playback run.
+
+    The run is anchored at its first presented frame; it is never re-anchored while
+    playing, so falling behind means dropping frames rather than slowing down.
+    """
+
+    def __init__(self):
+        self._anchor = None     # (frame_idx, wall_time, frames_per_second)
+        self.last_kept_due: Optional[float] = None
+        self.last_kept_wall = 0.0
+
+    def reset(self):
+        self._anchor = None
+        self.last_kept_due = None
+
+    def anchor(self, idx: int, rate: float, now: float):
+        self._anchor = (int(idx), float(now), max(1e-3, float(rate)))
+
+    def due(self, idx: int) -> Optional[float]:
+        anchor = self._anchor
+        if anchor is None:
+            return None
+        idx0, t0, rate = anchor
+        return t0 + (idx - idx0) / rate
+
+
+class VideoThread(QThread):
+    """Preview player: a decode thread fills a frame ring and run() presents it.
+
+    The control slots are called from the GUI thread and only post commands to a
+    queue guarded by one condition variable. run() applies them, so playback state
+    has a single writer, and both loops sleep on the condition until a command, a
+    frame or a presentation deadline is due; an idle player uses no CPU.
+    """
+
+    frameReady = pyqtSignal(object, int)   # PreviewFrame, frame_index
+    playbackEnded = pyqtSignal()
+    playbackStats = pyqtSignal(int, int)   # dropped, late (since play started)
+
+    # Commands where only the newest queued value matters.
+    _LATEST_WINS = ("seek", "speed", "adjust", "display_size", "display_refresh", "scrub")
+
+    def __init__(
+        self,
+        path: str,
+        ring_depth: int = PREVIEW_RING_DEPTH,
+        ring_budget_mb: int = PREVIEW_RING_BUDGET_MB,
+        cache_budget_mb: int = PREVIEW_CACHE_BUDGET_MB,
+        cache_gops: bool = PREVIEW_CACHE_GOPS,
+        backend: str = "opencv",
+        proxy_path: Optional[str] = None,
+    ):
+        super().__init__()
+        self.path = path
+        self.proxy_path = proxy_path    # decoded instead of path when set (see ProxyCache)
+        self.backend = backend
+        self.decoder: Optional[DecoderBackend] = None
+        self.fps = 30.0
+        self.total = 0
+        self.width = 0
+        self.height = 0
+        self.codec = ""
+        # Playback state below is written by run() only, from queued commands.
+        self.playing = False
+        self.speed = 1.0
+        self.adjustments = (1.0, 0.0, 1.0)    # contrast, brightness, saturation
+        self.display_size = (0, 0)            # preview area in device pixels; 0 = full resolution
+        self.display_refresh_hz = 60.0
+        self.scrubbing = False
+        self.ring_depth = max(1, int(ring_depth))
+        self.ring_budget_mb = max(1, int(ring_budget_mb))
+        self.current_idx = 0    # last presented frame
+        self.dropped_frames = 0
+        self.late_frames = 0
+        self._stop = False
+        self._cond = threading.Condition()
+        self._commands = collections.deque()
+        self._clock = _PresentationClock()
+        # Decoder repositioning request: (frame_idx, show_still). A seek shows the
+        # target frame; a resync after a flush only moves the decoder.
+        self._reposition: Optional[tuple] = None
+        self._decode_eof = False
+        self._decoder_dirty = False     # display size/adjustments changed for a filtering backend
+        self._ring = _FrameRing(self.ring_depth, self._cond)
+        self._decoder: Optional[threading.Thread] = None
+        # packet_index describes the decoded file; source_index always the original, for exports
+        self.packet_index = PacketIndex(proxy_path or path)
+        self.source_index = PacketIndex(path) if proxy_path else self.packet_index
+        self.cache_gops = bool(cache_gops)
+        self._cache = _DecodedFrameCache(max(0, int(cache_budget_mb)) * 1024 * 1024)
+        self._scrub_frames = collections.OrderedDict()   # keyframe idx -> low-res preview
+        self._scrub_epoch = 0
+        self._eq = EqAdjuster()
+        self._pool = _FramePool()
+
+    def open(self) -> bool:
+        source = self.proxy_path or self.path
+        if self.backend == FFmpegPipeDecoder.name:
+            decoder = FFmpegPipeDecoder(source, self.packet_index)
+        else:
+            decoder = OpenCVDecoder(source)
+        if not decoder.open():
+            decoder.release()
+            return False
+        self.decoder = decoder
+        self.fps = decoder.fps
+        self.total = decoder.total
+        self.width = decoder.width
+        self.height = decoder.height
+        self.codec = decoder.codec
+        if self.proxy_path:
+            # 프레임 번호, 크롭, 내보내기는 원본 기준이므로 속성은 원본 값을 보고한다
+            meta = _meta_tuple(_video_probe().probe(self.path))
+            if meta:
+                self.fps, self.total, self.width, self.height, self.codec = meta
         self.current_idx = 0
+        self._decoder_dirty = decoder.applies_filters
+        self._ring.set_capacity(self._ring_capacity())
+        self.packet_index.build_async()
+        self.source_index.build_async()
+        return True
+
+    def preload(self, display_size=(0, 0), adjustments=(1.0, 0.0, 1.0)) -> bool:
+        """Open the decoder and render frame 0 into the cache; call before start(), from any thread.
+
+        The first ``seek(0)`` after start() is then served from the cache.
+        """
+        self.display_size = display_size
+        self.adjustments = adjustments
+        if not self.open():
+            return False
+        if self.decoder.applies_filters:
+            self.decoder.configure(self.display_size, self.adjustments)
+            self._decoder_dirty = False
+        self._decode_frame()
         return True
 
+    def discard(self):
+        """Release the decoder of a thread that was opened but never started."""
+        if self.decoder:
+            self.decoder.release()
+            self.decoder = None
+        self._cache.clear()
+
+    def _ring_capacity(self) -> int:
+        frame_bytes = max(1, self.decoder.width * self.decoder.height * 3)
+        by_budget = (self.ring_budget_mb * 1024 * 1024) // frame_bytes
+        return max(2, min(self.ring_depth, int(by_budget)))
+
     def run(self):
         try:
-            if not self.cap:
+            if not self.decoder:
                 ok = self.open()
                 if not ok:
                     self.playbackEnded.emit()
                     return
-            frame_interval_s = lambda: max(0.001, 1.0 / self.fps / max(0.1, self.speed))
-            while not self._stop:
-                if self._seek_to is not None:
-                    idx = max(0, min(self._seek_to, max(0, self.total - 1)))
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-                    self.current_idx = idx
-                    self._seek_to = None
-                    self._reset_playback_timing()
-                    if not self.playing:
-                        ret, frame = self.cap.read()
-                        if ret:
-                            self._emit_frame(frame)
-                        self._sleep_with_stop(1)
-                if self.playing:
-                    ret, frame = self.cap.read()
-                    if not ret:
-                        self.playing = False
-                        self._reset_playback_timing()
-                        self.playbackEnded.emit()
-                        self._sleep_with_stop(20)
+            self._decoder = threading.Thread(target=self._decode_loop, name="VideoThread-decode", daemon=True)
+            self._decoder.start()
+            self._present_loop()
+        finally:
+            with self._cond:
+                self._stop = True
+                self._cond.notify_all()
+            self._ring.flush()
+            if self._decoder is not None:
+                self._decoder.join()
+                self._decoder = None
+            if self.decoder:
+                self.decoder.release()
+                self.decoder = None
+
+    # ------------------------------ commands ------------------------------
+    def _post(self, name: str, value=None):
+        with self._cond:
+            if self._stop:
+                return
+            if name in self._LATEST_WINS:
+                self._commands = collections.deque(c for c in self._commands if c[0] != name)
+            self._commands.append((name, value))
+            self._cond.notify_all()
+
+    def _apply_commands(self):
+        """Apply queued commands; called by run() with the condition held."""
+        while self._commands:
+            name, value = self._commands.popleft()
+            if name == "play":
+                self._reset_playback_timing()
+                self.dropped_frames = 0
+                self.late_frames = 0
+                self.playing = True
+            elif name == "pause":
+                self.playing = False
+                self._flush_ahead()
+            elif name == "speed":
+                self.speed = value
+                self._flush_ahead()
+            elif name == "adjust":
+                if value != self.adjustments:
+                    self.adjustments = value
+                    self._decoder_dirty = True
+                    self._cache.clear()
+                    self._flush_ahead()
+            elif name == "display_size":
+                if value != self.display_size:
+                    self.display_size = value
+                    self._decoder_dirty = True
+                    self._cache.clear()
+                    self._flush_ahead()
+            elif name == "display_refresh":
+                self.display_refresh_hz = value
+            elif name == "scrub":
+                self.scrubbing = value
+            elif name == "seek":
+                self._ring.flush()
+                self._reposition = (value, True)
+                self._reset_playback_timing()
+        self._cond.notify_all()
+
+    def _flush_ahead(self):
+        """Drop frames decoded ahead and let the decoder continue after the shown frame."""
+        self._ring.flush()
+        if self._reposition is None or not self._reposition[1]:
+            self._reposition = (self.current_idx + 1, False)
+        self._reset_playback_timing()
+
+    def _requested_frame(self) -> int:
+        """Newest frame asked for by a seek, whether still queued or not yet decoded."""
+        with self._cond:
+            for name, value in reversed(self._commands):
+                if name == "seek":
+                    return value
+            if self._reposition is not None and self._reposition[1]:
+                return self._reposition[0]
+            return self.current_idx
+
+    def _reposition_pending(self) -> bool:
+        with self._cond:
+            if self._reposition is not None and self._reposition[1]:
+                return True
+            return any(name == "seek" for name, _ in self._commands)
+
+    # Presentation: paces ready frames out of the ring on the presentation clock.
+    def _present_loop(self):
+        stats_sent = (0, 0)
+        stats_time = 0.0
+        while True:
+            out = None
+            with self._cond:
+                while out is None:
+                    if self._stop:
+                        return
+                    if self._commands:
+                        self._apply_commands()
                         continue
-                    self._emit_frame(frame)
-                    self.current_idx += 1
-                    interval_s = frame_interval_s()
                     now = time.perf_counter()
-                    if self._next_frame_deadline is None:
-                        self._next_frame_deadline = now + interval_s
+                    stats = (self.dropped_frames, self.late_frames)
+                    if stats != stats_sent and (now - stats_time >= 0.5 or not self.playing):
+                        stats_sent, stats_time = stats, now
+                        out = ("stats", stats)
+                        break
+                    entry = self._ring.peek()
+                    if entry is None:
+                        self._cond.wait(0.5 if self.playing else None)
+                        continue
+                    _, (kind, idx, rendered) = entry
+                    if kind == "frame":
+                        if not self.playing:
+                            self._ring.pop()
+                            continue
+                        rate = self.fps * max(0.1, self.speed)
+                        due = self._clock.due(idx)
+                        if due is None:
+                            self._clock.anchor(idx, rate, now)
+                        elif due - now > 0.0005:
+                            self._cond.wait(due - now)
+                            continue
+                        elif now - due > 1.0 / max(1e-3, rate):
+                            self.late_frames += 1
+                    self._ring.pop()
+                    if kind == "end":
+                        self.playing = False
+                        self._reset_playback_timing()
+                        out = ("end", None)
                     else:
-                        self._next_frame_deadline += interval_s
-                        if self._next_frame_deadline < now - interval_s:
-                            self._next_frame_deadline = now
-                    remaining_ms = max(0, int((self._next_frame_deadline - time.perf_counter()) * 1000.0))
-                    self._sleep_with_stop(remaining_ms)
+                        self.current_idx = idx
+                        self._cache.center = idx
+                        out = ("frame", (rendered, idx))
+            kind, payload = out
+            if kind == "stats":
+                self.playbackStats.emit(*payload)
+            elif kind == "end":
+                self.playbackEnded.emit()
+            else:
+                self.frameReady.emit(*payload)
+
+    def _should_drop(self, idx: int) -> bool:
+        """Decide before retrieving whether frame ``idx`` can be skipped during playback."""
+        due = self._clock.due(idx)
+        now = time.perf_counter()
+        if due is None or now - self._clock.last_kept_wall >= 1.0 / PLAYBACK_MIN_PRESENT_HZ:
+            keep = True
+        elif due < now:
+            keep = False    # already late: presenting it would only push later frames back
+        else:
+            # Never emit faster than the display can refresh.
+            min_gap = 1.0 / max(1.0, self.display_refresh_hz)
+            last_due = self._clock.last_kept_due
+            keep = last_due is None or due - last_due >= min_gap - 1e-4
+        if keep:
+            self._clock.last_kept_due = due
+            self._clock.last_kept_wall = now
+        return not keep
+
+    # Decoding: keeps the ring topped up while playing and serves seeks.
+    def _decode_loop(self):
+        while True:
+            with self._cond:
+                while not self._stop and self._reposition is None and not (
+                    self.playing and not self._decode_eof and self._ring.has_space()
+                ):
+                    self._cond.wait()
+                if self._stop:
+                    return
+                generation = self._ring.generation
+                reposition, self._reposition = self._reposition, None
+                playing = self.playing
+                scrubbing = self.scrubbing
+                reconfigure, self._decoder_dirty = self._decoder_dirty, False
+                filter_state = (self.display_size, self.adjustments)
+            if reconfigure and self.decoder.applies_filters:
+                self.decoder.configure(*filter_state)
+            if reposition is not None:
+                idx, show = reposition
+                idx = max(0, min(idx, max(0, self.total - 1)))
+                self._decode_eof = False
+                if show and not playing:
+                    rendered = self._cache.get(idx)
+                    if rendered is None and scrubbing:
+                        idx, rendered = self._scrub_preview(idx)
+                    elif rendered is None and self._seek_decoder(idx, keep_frames=self.cache_gops):
+                        rendered = self._decode_frame()
+                    if rendered is not None:
+                        self._ring.put(generation, ("still", idx, rendered))
                 else:
-                    self._reset_playback_timing()
-                    # idle wait
-                    self._sleep_with_stop(15)
-        finally:
-            if self.cap:
-                self.cap.release()
-                self.cap = None
-
-    def _apply_adjustments(self, frame):
-        c = float(self.contrast)
-        b = float(self.brightness)
-        s = float(self.saturation)
-        if abs(c - 1.0) <= 1e-6 and abs(b) <= 1e-6 and abs(s - 1.0) <= 1e-6:
-            return frame
-
-        # Match ffmpeg eq behavior more closely: operate in luminance/chroma space.
-        ycc = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb).astype(np.float32) / 255.0
-        y = ycc[..., 0]
-        cr = ycc[..., 1]
-        cb = ycc[..., 2]
-
-        y = (y - 0.5) * c + 0.5 + b
-        cr = (cr - 0.5) * s + 0.5
-        cb = (cb - 0.5) * s + 0.5
-
-        ycc[..., 0] = np.clip(y, 0.0, 1.0)
-        ycc[..., 1] = np.clip(cr, 0.0, 1.0)
-        ycc[..., 2] = np.clip(cb, 0.0, 1.0)
+                    self._seek_decoder(idx)
+                continue
+            idx = self.decoder.position
+            if self._should_drop(idx) and self._cache.get(idx) is None:
+                # Dropped frames are only grabbed: no retrieve, no conversion.
+                if self.decoder.grab():
+                    self.dropped_frames += 1
+                    continue
+                self._decode_eof = True
+                self._ring.put(generation, ("end", idx, None))
+                continue
+            rendered = self._cache.get(idx)
+            if rendered is not None:
+                self._seek_decoder(idx + 1)
+            else:
+                rendered = self._decode_frame()
+            if rendered is None:
+                self._decode_eof = True
+                self._ring.put(generation, ("end", idx, None))
+                continue
+            self._ring.put(generation, ("frame", idx, rendered))
+
+    def _decode_frame(self) -> Optional[PreviewFrame]:
+        """Read, render and cache the frame at the decoder position."""
+        idx = self.decoder.position
+        epoch = self._cache.epoch
+        frame = self._read_frame()
+        if frame is None:
+            return None
+        rendered = self._render_frame(frame)
+        self._cache.put(epoch, idx, rendered)
+        return rendered
+
+    def _read_frame(self):
+        shape = self.decoder.frame_shape
+        buf = self._pool.take(shape) if shape[0] > 0 and shape[1] > 0 else None
+        frame = self.decoder.read(buf)
+        if frame is None:
+            self._pool.release(buf)
+        return frame
+
+    def _scrub_preview(self, idx: int):
+        """Nearest preceding keyframe at reduced resolution, for slider drags."""
+        epoch = self._cache.epoch
+        if epoch != self._scrub_epoch:
+            self._scrub_frames.clear()
+            self._scrub_epoch = epoch
+        keyframe = self.packet_index.keyframe_at_or_before(idx)
+        target = idx if keyframe is None else keyframe
+        rendered = self._scrub_frames.get(target)
+        if rendered is not None:
+            self._scrub_frames.move_to_end(target)
+            return target, rendered
+        if target != self.decoder.position:
+            self.decoder.seek(target)
+        frame = self._read_frame()
+        if frame is None:
+            return target, None
+        if self._reposition_pending():
+            self._pool.release(frame)
+            return target, None
+        rendered = self._render_frame(frame, max_width=SCRUB_PREVIEW_MAX_WIDTH)
+        if epoch == self._cache.epoch:
+            self._scrub_frames[target] = rendered
+            while len(self._scrub_frames) > SCRUB_PREVIEW_CACHE_FRAMES:
+                self._scrub_frames.popitem(last=False)
+        return target, rendered
+
+    def _seek_decoder(self, idx: int, keep_frames: bool = False) -> bool:
+        """Position the capture so the next read returns frame ``idx``.
+
+        With ``keep_frames`` the frames decoded on the way are rendered into the cache,
+        so stepping back through the same GOP afterwards needs no decoding at all.
+        Returns False when a newer seek arrived first; the latest target wins.
+        """
+        decoder = self.decoder
+        if idx == decoder.position:
+            return True
+        keyframe = self.packet_index.keyframe_at_or_before(idx)
+        if keyframe is None:
+            # No index yet: only a single step forward can skip the container seek.
+            if idx != decoder.position + 1:
+                decoder.seek(idx)
+                return True
+        elif not (keyframe <= decoder.position <= idx):
+            decoder.seek(keyframe)
+        while decoder.position < idx and not self._stop:
+            if self._reposition_pending():
+                return False
+            if keep_frames and self._cache.get(decoder.position) is None:
+                if self._decode_frame() is None:
+                    break
+                continue
+            if not decoder.grab():
+                break
+        return not self._stop
 
-        return cv2.cvtColor((ycc * 255.0).astype(np.uint8), cv2.COLOR_YCrCb2BGR)
+    def _render_frame(self, frame, max_width: int = 0) -> PreviewFrame:
+        """Turn a decoded BGR frame (owned by the caller, consumed here) into a PreviewFrame.
 
-    def _emit_frame(self, frame):
-        adj = self._apply_adjustments(frame)
-        h, w = adj.shape[:2]
-        img = cv2.cvtColor(adj, cv2.COLOR_BGR2RGB)
-        qimg = QImage(img.data, w, h, w * 3, QImage.Format_RGB888)
-        self.frameReady.emit(qimg.copy(), self.current_idx)
+        Every stage writes into a pooled buffer and hands the previous one back, and the
+        final buffer is wrapped as a QImage in place, so no per-frame copy is made.
+        """
+        pool = self._pool
+        contrast, brightness, saturation = self.adjustments
+        display_w, display_h = self.display_size
+        # Shrink to what the preview can show before any per-pixel work.
+        h, w = frame.shape[:2]
+        scale = 1.0
+        if display_w > 0 and display_h > 0:
+            scale = min(scale, display_w / float(w), display_h / float(h))
+        if max_width:
+            scale = min(scale, max_width / float(w))
+        if scale < 1.0:
+            size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+            small = cv2.resize(frame, size, dst=pool.take((size[1], size[0], 3)), interpolation=cv2.INTER_AREA)
+            pool.release(frame)
+            frame = small
+        if not self.decoder.applies_filters and not EqAdjuster.is_identity(contrast, brightness, saturation):
+            scratch = pool.take(frame.shape)
+            self._eq.apply(frame, contrast, brightness, saturation, scratch=scratch, out=frame)
+            pool.release(scratch)
+        if _QIMAGE_BGR888 is not None:
+            return pool.wrap(frame, _QIMAGE_BGR888)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=pool.take(frame.shape))
+        pool.release(frame)
+        return pool.wrap(rgb, QImage.Format_RGB888)
 
     @pyqtSlot()
     def play(self):
-        self._reset_playback_timing()
-        self.playing = True
+        self._post("play")
 
     @pyqtSlot()
     def pause(self):
-        self.playing = False
-        self._reset_playback_timing()
+        self._post("pause")
 
     @pyqtSlot(float)
     def set_speed(self, s: float):
-        self.speed = max(0.1, float(s))
-        self._reset_playback_timing()
+        self._post("speed", max(0.1, float(s)))
 
     @pyqtSlot(float, float, float)
     def set_adjustments(self, contrast: float, brightness: float, saturation: float):
-        self.contrast = max(0.0, float(contrast))
-        self.brightness = max(-1.0, min(1.0, float(brightness)))
-        self.saturation = max(0.0, float(saturation))
+        self._post("adjust", (
+            max(0.0, float(contrast)),
+            max(-1.0, min(1.0, float(brightness))),
+            max(0.0, float(saturation)),
+        ))
 
     @pyqtSlot(int)
     def seek(self, frame_idx: int):
-        self._seek_to = int(frame_idx)
-        self._reset_playback_timing()
+        self._post("seek", int(frame_idx))
+
+    @pyqtSlot(int, int)
+    def set_display_size(self, width: int, height: int):
+        self._post("display_size", (max(0, int(width)), max(0, int(height))))
+
+    @pyqtSlot(float)
+    def set_display_refresh(self, hz: float):
+        self._post("display_refresh", float(hz) if hz and hz > 1.0 else 60.0)
+
+    @pyqtSlot(bool)
+    def set_scrubbing(self, scrubbing: bool):
+        """While a slider drag is in progress, seeks show low-res keyframe previews."""
+        self._post("scrub", bool(scrubbing))
+
+    @pyqtSlot(int)
+    def step(self, delta: int):
+        """Seek relative to the last requested frame so repeated key steps accumulate."""
+        with self._cond:
+            self._post("seek", self._requested_frame() + int(delta))
 
     @pyqtSlot()
     def stop(self):
-        self._stop = True
-        self.playing = False
-        self._seek_to = None
-        self._reset_playback_timing()
+        with self._cond:
+            self._stop = True
+            self._commands.clear()
+            self._reposition = None
+            self._cond.notify_all()
 
     def _reset_playback_timing(self):
-        self._next_frame_deadline = None
+        self._clock.reset()
+
+
+class VideoLoader(QThread):
+    """Runs VideoThread.preload off the GUI thread, for the video to show or the next one in the list."""
 
-    def _sleep_with_stop(self, total_ms: int):
-        remaining = max(0, int(total_ms))
-        while remaining > 0 and not self._stop:
-            step = min(remaining, 20)
-            self.msleep(step)
-            remaining -= step
+    loaded = pyqtSignal(object, bool)   # VideoThread, ok
+
+    def __init__(self, video: VideoThread, display_size, adjustments):
+        super().__init__()
+        self.video = video
+        self.display_size = display_size
+        self.adjustments = adjustments
+
+    def run(self):
+        try:
+            ok = self.video.preload(self.display_size, self.adjustments)
+        except Exception:
+            ok = False
+        self.loaded.emit(self.video, ok)
+
+
+class ProxyBuildThread(QThread):
+    """Builds the preview proxy of one source in the background (see ProxyCache.build)."""
+
+    progressChanged = pyqtSignal(str, int)   # source path, percent
+    built = pyqtSignal(str, str, str)        # source path, proxy path ("" on failure), error text
+
+    def __init__(self, cache: ProxyCache, ffmpeg: str, path: str):
+        super().__init__()
+        self.cache = cache
+        self.ffmpeg = ffmpeg
+        self.path = path
+        self._procs = set()
+        self._lock = threading.Lock()
+        self._last_pct = -1
+        self._stop = False
+
+    def _on_fraction(self, fraction: float):
+        pct = max(0, min(99, int(fraction * 100)))
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progressChanged.emit(self.path, pct)
+
+    def _track(self, proc, running: bool):
+        with self._lock:
+            if running:
+                self._procs.add(proc)
+            else:
+                self._procs.discard(proc)
+        if running and self._stop:
+            _terminate_process(proc)
+
+    def run(self):
+        proxy, err = self.cache.build(self.ffmpeg, self.path, self._on_fraction, lambda: self._stop, self._track)
+        if not self._stop:
+            self.built.emit(self.path, proxy or "", err)
+
+    def stop(self):
+        self._stop = True
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            _terminate_process(proc)
+
+
+class ThumbnailBuildThread(QThread):
+    """Fills a ThumbnailStore in the background, keyframes first; the store is usable while this runs."""
+
+    keyframesReady = pyqtSignal()
+    progressChanged = pyqtSignal(int)   # percent of slots filled
+    failed = pyqtSignal(str)
+
+    def __init__(self, store: ThumbnailStore, ffmpeg: str, decode_path: str, fps: float):
+        super().__init__()
+        self.store = store
+        self.ffmpeg = ffmpeg
+        self.decode_path = decode_path
+        self.fps = fps
+        self._procs = set()
+        self._lock = threading.Lock()
+        self._stop = False
+
+    def _track(self, proc, running: bool):
+        with self._lock:
+            if running:
+                self._procs.add(proc)
+            else:
+                self._procs.discard(proc)
+        if running and self._stop:
+            _terminate_process(proc)
+
+    def run(self):
+        if not self.store.has_keyframes:
+            ok, err = self.store.build_keyframes(self.ffmpeg, self.decode_path, self.fps, lambda: self._stop,
+                                                 self._track)
+            if self._stop:
+                return
+            if ok:
+                self.keyframesReady.emit()
+        ok, err = self.store.build(self.ffmpeg, self.decode_path, lambda: self._stop,
+                                   lambda f: self.progressChanged.emit(int(f * 100)), self._track)
+        if not ok and not self._stop:
+            self.failed.emit(err)
+
+    def stop(self):
+        self._stop = True
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            _terminate_process(proc)
 
 
 class ClickJumpSlider(QSlider):
+    hovered = pyqtSignal(int, QPoint)   # value under the cursor, global cursor position
+    hoverLeft = pyqtSignal()
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.setMouseTracking(True)
+
+    def value_at(self, ev) -> int:
+        if self.orientation() == Qt.Horizontal:
+            pos = ev.x()
+            span = max(1, self.width() - 1)
+        else:
+            pos = max(0, self.height() - 1 - ev.y())
+            span = max(1, self.height() - 1)
+        return QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), pos, span, upsideDown=False)
+
     def mousePressEvent(self, ev):
         if ev.button() == Qt.LeftButton:
-            if self.orientation() == Qt.Horizontal:
-                pos = ev.x()
-                span = max(1, self.width() - 1)
-                val = QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), pos, span, upsideDown=False)
-            else:
-                pos = max(0, self.height() - 1 - ev.y())
-                span = max(1, self.height() - 1)
-                val = QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), pos, span, upsideDown=False)
-            self.setValue(val)
+            self.hoverLeft.emit()
+            self.setValue(self.value_at(ev))
             ev.accept()
         super().mousePressEvent(ev)
 
+    def mouseMoveEvent(self, ev):
+        if not ev.buttons() and self.isEnabled():
+            self.hovered.emit(self.value_at(ev), ev.globalPos())
+        super().mouseMoveEvent(ev)
+
+    def leaveEvent(self, ev):
+        self.hoverLeft.emit()
+        super().leaveEvent(ev)
+
+
+def _thumbnail_qimage(view, eq: EqAdjuster, adjustments) -> QImage:
+    """QImage copy of a ThumbnailStore slot with the preview's image adjustments applied."""
+    frame = np.array(view)    # 메모리맵에서 복사해 보정과 QImage 변환을 한다
+    if not EqAdjuster.is_identity(*adjustments):
+        eq.apply(frame, *adjustments, out=frame)
+    height, width = frame.shape[:2]
+    if _QIMAGE_BGR888 is not None:
+        return QImage(frame.data, width, height, 3 * width, _QIMAGE_BGR888).copy()
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return QImage(rgb.data, width, height, 3 * width, QImage.Format_RGB888).copy()
+
+
+class FilmstripWidget(QWidget):
+    """Row of thumbnails under the timeline slider, drawn from the shown video's ThumbnailStore."""
+
+    frameClicked = pyqtSignal(int)
+    hovered = pyqtSignal(int, QPoint)
+    hoverLeft = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._store: Optional[ThumbnailStore] = None
+        self._total = 0
+        self._adjustments = (1.0, 0.0, 1.0)
+        self._eq = EqAdjuster()
+        self._strip = QPixmap()
+        self._dirty = True
+        self.setFixedHeight(40)
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def set_store(self, store: Optional[ThumbnailStore], total_frames: int = 0):
+        self._store = store
+        self._total = max(0, int(total_frames))
+        self.refresh()
+
+    def set_adjustments(self, contrast: float, brightness: float, saturation: float):
+        if (contrast, brightness, saturation) != self._adjustments:
+            self._adjustments = (contrast, brightness, saturation)
+            self.refresh()
+
+    def refresh(self):
+        self._dirty = True
+        self.update()
+
+    def frame_at(self, x: int) -> int:
+        span = max(1, self.width() - 1)
+        return QStyle.sliderValueFromPosition(0, max(0, self._total - 1), x, span, upsideDown=False)
+
+    def _render(self):
+        dpr = self.devicePixelRatioF()
+        strip = QPixmap(max(1, int(self.width() * dpr)), max(1, int(self.height() * dpr)))
+        strip.setDevicePixelRatio(dpr)
+        strip.fill(QColor("#1b1f27"))
+        store = self._store
+        if store is not None and self._total > 0:
+            painter = QPainter(strip)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            tile_h = self.height()
+            tile_w = max(8, int(round(tile_h * store.width / float(store.height))))
+            for left in range(0, self.width(), tile_w):
+                # 칸 가운데 위치의 프레임을 슬라이더와 같은 눈금으로 고른다
+                hit = store.frame_at(self.frame_at(min(self.width() - 1, left + tile_w // 2)), nearest=True)
+                if hit is not None:
+                    painter.drawImage(QRect(left, 0, tile_w - 1, tile_h), _thumbnail_qimage(hit[1], self._eq, self._adjustments))
+            painter.end()
+        self._strip = strip
+        self._dirty = False
+
+    def paintEvent(self, ev):
+        if self._dirty or self._strip.size() != self.size() * self.devicePixelRatioF():
+            self._render()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._strip)
+
+    def mousePressEvent(self, ev):
+        if ev.button() == Qt.LeftButton and self._total > 0:
+            self.hoverLeft.emit()
+            self.frameClicked.emit(self.frame_at(ev.x()))
+            ev.accept()
+            return
+        super().mousePressEvent(ev)
+
+    def mouseMoveEvent(self, ev):
+        if not ev.buttons() and self._total > 0:
+            self.hovered.emit(self.frame_at(ev.x()), ev.globalPos())
+        super().mouseMoveEvent(ev)
+
+    def leaveEvent(self, ev):
+        self.hoverLeft.emit()
+        super().leaveEvent(ev)
+
+
+class ThumbnailPopup(QWidget):
+    """Tooltip-style window showing one thumbnail and its frame number/time above the cursor."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setStyleSheet("background:#111; color:#e5e9f0;")
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(2, 2, 2, 2)
+        lay.setSpacing(1)
+        self.lbl_image = QLabel()
+        self.lbl_caption = QLabel()
+        self.lbl_caption.setAlignment(Qt.AlignCenter)
+        lay.addWidget(self.lbl_image)
+        lay.addWidget(self.lbl_caption)
+
+    def show_at(self, image: QImage, caption: str, global_pos: QPoint):
+        self.lbl_image.setPixmap(QPixmap.fromImage(image))
+        self.lbl_caption.setText(caption)
+        self.adjustSize()
+        pos = global_pos - QPoint(self.width() // 2, self.height() + 12)
+        screen = QApplication.screenAt(global_pos)
+        if screen is not None:
+            area = screen.availableGeometry()
+            pos.setX(max(area.left(), min(pos.x(), area.right() - self.width())))
+            if pos.y() < area.top():
+                pos.setY(global_pos.y() + 20)
+        self.move(pos)
+        self.show()
+
 
 class CropPreviewWidget(QWidget):
     cropSelectionFinished = pyqtSignal(object)
+    displaySizeChanged = pyqtSignal(int, int)   # device pixels available for the frame
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._frame = QImage()
+        self._frame_owner: Optional[PreviewFrame] = None
+        self._placeholder = "No video"
         self._crop_state = "off"
         self._crop_rect = None
         self._fixed_crop_norm_size = None
@@ -251,11 +1285,32 @@ class CropPreviewWidget(QWidget):
     def sizeHint(self):
         return QSize(640, 360)
 
-    def set_frame(self, image: QImage):
-        self._frame = image.copy() if image and not image.isNull() else QImage()
+    def display_pixel_size(self):
+        ratio = self.devicePixelRatioF()
+        return int(round(self.width() * ratio)), int(round(self.height() * ratio))
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        self.displaySizeChanged.emit(*self.display_pixel_size())
+
+    def set_frame(self, frame):
+        # Takes a reference, not a copy: a PreviewFrame keeps its pooled buffer alive
+        # for as long as it is on screen and recycles it once replaced.
+        if isinstance(frame, PreviewFrame):
+            self._frame_owner = frame
+            self._frame = frame.image
+        else:
+            self._frame_owner = None
+            self._frame = frame if frame is not None and not frame.isNull() else QImage()
+        self.update()
+
+    def set_placeholder(self, text: str):
+        """Text shown while there is no frame."""
+        self._placeholder = text
         self.update()
 
     def clear_frame(self):
+        self._frame_owner = None
         self._frame = QImage()
         self._clear_drag()
         self.update()
@@ -381,7 +1436,7 @@ class CropPreviewWidget(QWidget):
             painter.drawImage(content, self._frame)
         else:
             painter.setPen(QColor("#bbbbbb"))
-            painter.drawText(self.rect(), Qt.AlignCenter, "No video")
+            painter.drawText(self.rect(), Qt.AlignCenter, self._placeholder)
 
         overlay = self._current_overlay_rect()
         if content.isValid() and overlay:
@@ -440,164 +1495,515 @@ class CropPreviewWidget(QWidget):
 
 class ExportThread(QThread):
     progressChanged = pyqtSignal(int)
+    statsChanged = pyqtSignal(dict)  # ExportMeter totals: speed, fps, bitrate_kbps, total_size
     finishedOk = pyqtSignal(str)
     failed = pyqtSignal(str)
 
-    def __init__(self, cmd: List[str], out_path: str, duration_sec: float):
+    def __init__(self, cmd: List[str], out_path: str, duration_sec: float, plan: Optional[dict] = None):
         super().__init__()
         self.cmd = list(cmd)
         self.out_path = out_path
         self.duration_us = max(1, int(max(0.001, float(duration_sec)) * 1_000_000.0))
-        self.proc = None
+        # 추가 task 키: smart / chunked 계획, 또는 progress_frames (see _run_export_task)
+        self.plan = dict(plan or {})
+        self._procs = set()
+        self._lock = threading.Lock()
+        self._meter = ExportMeter()
+        self._last_pct = -1
+        self._stop = False
+
+    def _on_fraction(self, fraction: float):
+        pct = max(0, min(99, int(fraction * 100)))
+        with self._lock:
+            if pct == self._last_pct:
+                return
+            self._last_pct = pct
+        self.progressChanged.emit(pct)
+
+    def _on_stats(self, proc, snap: dict):
+        totals = self._meter.update(proc.pid, snap)
+        if totals is not None:
+            self.statsChanged.emit(totals)
+
+    def _track(self, proc, running: bool):
+        with self._lock:
+            if running:
+                self._procs.add(proc)
+            else:
+                self._procs.discard(proc)
+        if not running:
+            self._meter.drop(proc.pid)
+        if running and self._stop:
+            _terminate_process(proc)
+
+    def run(self):
+        self.progressChanged.emit(0)
+        task = dict(self.plan, cmd=self.cmd, out_path=self.out_path, duration_us=self.duration_us)
+        task.setdefault("label", os.path.basename(self.out_path))
+        ok, err = _run_export_task(task, self._on_fraction, lambda: self._stop, self._track, self._on_stats)
+        if self._stop:
+            return
+        if not ok:
+            self.failed.emit(err)
+            return
+        self.progressChanged.emit(100)
+        self.finishedOk.emit(self.out_path)
+
+    def stop(self):
+        self._stop = True
+        self._terminate_procs()
+
+    def _terminate_procs(self):
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            _terminate_process(proc)
+
+
+VIDEO_QUERY_HELP = (
+    "Words match anywhere in the file path. Also:\n"
+    "  1080p, >=720p, <1080p   frame height\n"
+    "  under:subject_12        inside a folder of that name (any depth) or a relative path\n"
+    "  codec:hevc, ext:mkv     codec / file extension\n"
+    "  exported, unexported    export history of the file")
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024.0
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+
+
+def _video_meta_text(meta: dict) -> str:
+    seconds = int(round(meta.get("duration", 0)))
+    parts = [
+        f"{meta['width']}x{meta['height']}",
+        f"{meta['fps']:.3g} fps",
+        f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d} ({meta['frames']} frames)",
+    ]
+    if meta.get("codec"):
+        parts.append(meta["codec"])
+    if meta.get("keyframe_interval"):
+        parts.append(f"keyframe every {meta['keyframe_interval']} frames")
+    return "\n".join(parts)
+
+
+class MetaProbeThread(QThread):
+    """Reads metadata of many videos through the shared cached VideoProbe without blocking the GUI."""
+
+    probed = pyqtSignal(str, object)         # path, metadata dict or None
+    progressChanged = pyqtSignal(int, int)   # resolved, total
+    done = pyqtSignal(dict)                  # path -> metadata dict or None; not sent when stopped
+
+    def __init__(self, paths: List[str]):
+        super().__init__()
+        self.paths = list(dict.fromkeys(paths))
+        self._resolved = 0
         self._stop = False
 
+    def _on_result(self, path: str, meta):
+        self._resolved += 1
+        self.probed.emit(path, meta)
+        self.progressChanged.emit(self._resolved, len(self.paths))
+
     def run(self):
-        err_tail: List[str] = []
+        metas = _video_probe().probe_many(self.paths, self._on_result, lambda: self._stop)
+        if not self._stop:
+            self.done.emit(metas)
+
+    def stop(self):
+        self._stop = True
+
+
+class FolderScanThread(QThread):
+    """Brings the VideoCatalog up to date for a folder (and its subfolders), lists it and reads new metadata.
+
+    A folder opened for the first time is handed over in batches while it is scanned; a
+    folder already in the catalog is rescanned first (unchanged folders are not listed
+    again, so that is quick) and then sent from the catalog. Names are paths relative to
+    ``folder``.
+    """
+
+    found = pyqtSignal(list)          # [(name, size, mtime), ...]
+    metaFound = pyqtSignal(dict)      # name -> metadata dict or None, for files probed before
+    exportedFound = pyqtSignal(list)  # names with a successful export on record
+    listed = pyqtSignal(int)          # number of files, once all were sent
+    probed = pyqtSignal(str, object)  # path, metadata dict or None
+    failed = pyqtSignal(str)
+
+    BATCH_SIZE = 5000
+    BATCH_SEC = 0.2
+
+    def __init__(self, folder: str, recursive: bool = False):
+        super().__init__()
+        self.folder = folder
+        self.recursive = recursive
+        self._stop = False
+
+    def run(self):
+        catalog = _video_catalog()
+        root = os.path.abspath(self.folder)
         try:
-            self.proc = subprocess.Popen(
-                self.cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
-                errors="replace",
-                bufsize=1,
-            )
-            self.progressChanged.emit(0)
-            if self.proc.stderr:
-                for raw in self.proc.stderr:
-                    if self._stop:
-                        self._terminate_proc()
-                        break
-                    line = (raw or "").strip()
-                    if not line:
-                        continue
-                    if "=" in line:
-                        k, v = line.split("=", 1)
-                        if k == "out_time_ms":
-                            try:
-                                cur = max(0, int(v))
-                                pct = max(0, min(99, int(cur * 100 / self.duration_us)))
-                                self.progressChanged.emit(pct)
-                            except Exception:
-                                pass
-                        elif k == "progress" and v == "end":
-                            self.progressChanged.emit(100)
-                    else:
-                        err_tail.append(line)
-                        if len(err_tail) > 120:
-                            err_tail = err_tail[-120:]
-            rc = self.proc.wait()
-            if self._stop:
-                return
-            if rc != 0:
-                msg = "\n".join(err_tail[-60:]) if err_tail else f"ffmpeg exited with code {rc}"
-                self.failed.emit(msg)
-                return
-            self.progressChanged.emit(100)
-            self.finishedOk.emit(self.out_path)
+            if catalog.is_indexed(root):
+                catalog.scan(root, self.recursive, should_stop=lambda: self._stop)
+                if self._stop:
+                    return
+                files = catalog.files(root, self.recursive)
+                for i in range(0, len(files), self.BATCH_SIZE):
+                    self.found.emit([(f["rel"], f["size"], f["mtime"]) for f in files[i:i + self.BATCH_SIZE]])
+            else:
+                self._scan_streaming(catalog, root)
+                if self._stop:
+                    return
+                files = catalog.files(root, self.recursive)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.metaFound.emit({f["rel"]: f["meta"] for f in files if f["probed"]})
+        self.exportedFound.emit([f["rel"] for f in files if f["exported"]])
+        self.listed.emit(len(files))
+        try:
+            catalog.probe_missing(self.folder, self.recursive, self.probed.emit, lambda: self._stop)
         except Exception as e:
             if not self._stop:
-                self.failed.emit(f"Failed to run ffmpeg: {e}")
-        finally:
-            self.proc = None
+                self.failed.emit(str(e))
+
+    def _scan_streaming(self, catalog, root: str):
+        batch = []
+        last_emit = [time.monotonic()]
+
+        def take(folder: str, entries: list):
+            batch.extend((os.path.relpath(path, root), size, mtime_ns / 1e9) for path, size, mtime_ns in entries)
+            if len(batch) >= self.BATCH_SIZE or time.monotonic() - last_emit[0] >= self.BATCH_SEC:
+                self.found.emit(list(batch))
+                batch.clear()
+                last_emit[0] = time.monotonic()
+
+        catalog.scan(root, self.recursive, should_stop=lambda: self._stop, on_files=take)
+        if batch and not self._stop:
+            self.found.emit(batch)
 
     def stop(self):
         self._stop = True
-        self._terminate_proc()
 
-    def _terminate_proc(self):
-        proc = self.proc
-        if proc is None:
+
+class VideoListModel(QAbstractTableModel):
+    """Video files of the open folder with size, date and (cached) metadata columns.
+
+    Rows are appended while a FolderScanThread runs and sorted here with plain list sorts,
+    so tens of thousands of files stay cheap; views filter through their own VideoFilterProxy.
+    """
+
+    COLUMNS = ("Name", "Size", "Modified", "Duration", "Resolution")
+    COL_NAME, COL_SIZE, COL_MTIME, COL_DURATION, COL_RESOLUTION = range(5)
+    LoadedRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[tuple] = []          # (name, size, mtime)
+        self._row_of: Dict[str, int] = {}
+        self._meta: Dict[str, Optional[dict]] = {}
+        self._exported: set = set()
+        self._sort_column = self.COL_NAME
+        self._sort_order = Qt.AscendingOrder
+        self.loaded_name: Optional[str] = None
+        self._resort_timer = QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(300)
+        self._resort_timer.timeout.connect(lambda: self.sort(self._sort_column, self._sort_order))
+
+    # ---- contents
+    def clear(self):
+        self.beginResetModel()
+        self._entries = []
+        self._row_of = {}
+        self._meta = {}
+        self._exported = set()
+        self.endResetModel()
+
+    def add_entries(self, entries: List[tuple]):
+        # 스캔 중에는 끝에 붙이기만 하고, 정렬은 스캔이 끝난 뒤 한 번에 한다
+        entries = [e for e in entries if e[0] not in self._row_of]
+        if not entries:
             return
-        if proc.poll() is not None:
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for i, entry in enumerate(entries, first):
+            self._entries.append(entry)
+            self._row_of[entry[0]] = i
+        self.endInsertRows()
+
+    def set_meta(self, name: str, meta: Optional[dict]):
+        row = self._row_of.get(name)
+        if row is None:
             return
-        try:
-            proc.terminate()
-        except Exception:
-            pass
+        self._meta[name] = meta
+        self.dataChanged.emit(self.index(row, self.COL_DURATION), self.index(row, self.COL_RESOLUTION))
+        if self._sort_column in (self.COL_DURATION, self.COL_RESOLUTION):
+            self._resort_timer.start()
+
+    def set_metas(self, metas: Dict[str, Optional[dict]]):
+        rows = [self._row_of[name] for name in metas if name in self._row_of]
+        if not rows:
+            return
+        self._meta.update((name, meta) for name, meta in metas.items() if name in self._row_of)
+        self.dataChanged.emit(self.index(min(rows), self.COL_DURATION), self.index(max(rows), self.COL_RESOLUTION))
+        if self._sort_column in (self.COL_DURATION, self.COL_RESOLUTION):
+            self._resort_timer.start()
+
+    def set_exported(self, names):
+        exported = {n for n in names if n in self._row_of}
+        rows = [self._row_of[n] for n in exported ^ self._exported]
+        self._exported = exported
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0))
+
+    def meta(self, name: str) -> Optional[dict]:
+        return self._meta.get(name)
+
+    def is_exported(self, name: str) -> bool:
+        return name in self._exported
+
+    def set_loaded_name(self, name: Optional[str]):
+        rows = [self._row_of.get(n) for n in (self.loaded_name, name)]
+        self.loaded_name = name
+        for row in rows:
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1), [self.LoadedRole])
+
+    def name(self, row: int) -> str:
+        return self._entries[row][0]
+
+    def names(self) -> List[str]:
+        return [e[0] for e in self._entries]
+
+    def row_of(self, name: Optional[str]) -> int:
+        return self._row_of.get(name or "", -1)
+
+    # ---- Qt model
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name, size, mtime = self._entries[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            meta = self._meta.get(name)
+            if col == self.COL_NAME:
+                return name
+            if col == self.COL_SIZE:
+                return _format_bytes(size)
+            if col == self.COL_MTIME:
+                return time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
+            if col == self.COL_DURATION:
+                if not meta:
+                    return ""
+                seconds = int(round(meta.get("duration", 0)))
+                return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+            if col == self.COL_RESOLUTION:
+                return f"{meta['width']}x{meta['height']}" if meta else ""
+        elif role == Qt.ToolTipRole:
+            if name not in self._meta:
+                return None
+            meta = self._meta[name]
+            text = _video_meta_text(meta) if meta else "Cannot read this video."
+            return text + ("\nExported before" if name in self._exported else "")
+        elif role == Qt.TextAlignmentRole and col != self.COL_NAME:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == self.LoadedRole:
+            return name == self.loaded_name
+        return None
+
+    def _sort_key(self, column: int):
+        if column == self.COL_SIZE:
+            return lambda e: e[1]
+        if column == self.COL_MTIME:
+            return lambda e: e[2]
+        if column == self.COL_DURATION:
+            return lambda e: self._meta[e[0]].get("duration", 0.0)
+        if column == self.COL_RESOLUTION:
+            return lambda e: self._meta[e[0]]["width"] * self._meta[e[0]]["height"]
+        return lambda e: e[0]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column, self._sort_order = column, order
+        key = self._sort_key(column)
+        entries = self._entries
+        if column in (self.COL_DURATION, self.COL_RESOLUTION):
+            # 아직 메타데이터가 없는 파일은 방향과 상관없이 뒤로 보낸다
+            known = [e for e in entries if self._meta.get(e[0])]
+            unknown = sorted((e for e in entries if not self._meta.get(e[0])), key=lambda e: e[0])
+            ordered = sorted(known, key=key, reverse=order == Qt.DescendingOrder) + unknown
+        else:
+            ordered = sorted(entries, key=key, reverse=order == Qt.DescendingOrder)
+        self.layoutAboutToBeChanged.emit()
+        old_names = [e[0] for e in entries]
+        self._entries = ordered
+        self._row_of = {e[0]: i for i, e in enumerate(ordered)}
+        old = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old, [self.index(self._row_of[old_names[i.row()]], i.column()) for i in old])
+        self.layoutChanged.emit()
+
+    def resort(self):
+        self.sort(self._sort_column, self._sort_order)
+
+
+class VideoFilterProxy(QSortFilterProxyModel):
+    """Per-view catalog query filter (see ``_parse_catalog_query``) over a shared VideoListModel.
+
+    Sorting is left to the source model.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = _parse_catalog_query("")
+        self._plain = True
+
+    def set_filter_text(self, text: str):
+        self._query = _parse_catalog_query(text)
+        # 이름 검색만 있을 때는 메타데이터를 보지 않는 빠른 길로 간다
+        self._plain = not any(self._query[k] for k in ("height", "under", "codec", "ext")) \
+            and self._query["exported"] is None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        name = model.name(source_row)
+        if self._plain:
+            if not self._query["words"]:
+                return True
+            low = name.lower().replace("\\", "/")
+            return all(word in low for word in self._query["words"])
+        return _catalog_match(self._query, name, model.meta(name), model.is_exported(name))
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
+class VideoListDelegate(QStyledItemDelegate):
+    """Marks the row of the loaded video, also while it is selected."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        loaded = bool(index.data(VideoListModel.LoadedRole))
+        selected = bool(option.state & QStyle.State_Selected)
+        if loaded and selected:
+            option.palette.setColor(QPalette.Highlight, QColor("#356bb3"))  # darker blue-gray overlay state
+            option.palette.setColor(QPalette.HighlightedText, QColor("white"))
+        elif loaded:
+            option.backgroundBrush = QBrush(QColor("#4a90ff"))
+            option.palette.setColor(QPalette.Text, QColor("white"))
+        elif selected:
+            option.palette.setColor(QPalette.Highlight, QColor("#d9dee6"))
+            option.palette.setColor(QPalette.HighlightedText, QColor("#111111"))
+
+
+class VideoListView(QTableView):
+    """Table of a shared VideoListModel through its own filter; rows are named by file name."""
+
+    def __init__(self, model: VideoListModel, parent=None, multi_select: bool = False):
+        super().__init__(parent)
+        self.proxy = VideoFilterProxy(self)
+        self.proxy.setSourceModel(model)
+        self.setModel(self.proxy)
+        self.setItemDelegate(VideoListDelegate(self))
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection if multi_select
+                              else QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setAlternatingRowColors(False)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # 고정 행 높이: 수만 행이어도 스크롤 계산이 행 수에 비례하지 않는다
+        vh = self.verticalHeader()
+        vh.hide()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(self.fontMetrics().height() + 6)
+        hh = self.horizontalHeader()
+        hh.setSectionResizeMode(QHeaderView.Interactive)
+        hh.setSectionResizeMode(VideoListModel.COL_NAME, QHeaderView.Stretch)
+        hh.setHighlightSections(False)
+        for col in range(1, len(VideoListModel.COLUMNS)):
+            hh.resizeSection(col, 76)
+        hh.setSortIndicator(model._sort_column, model._sort_order)
+        self.setSortingEnabled(True)
+
+    def source(self) -> VideoListModel:
+        return self.proxy.sourceModel()
+
+    def count(self) -> int:
+        return self.proxy.rowCount()
+
+    def name_at(self, row: int) -> Optional[str]:
+        if not 0 <= row < self.proxy.rowCount():
+            return None
+        return self.source().name(self.proxy.mapToSource(self.proxy.index(row, 0)).row())
+
+    def row_of(self, name: Optional[str]) -> int:
+        src = self.source().row_of(name)
+        if src < 0:
+            return -1
+        return self.proxy.mapFromSource(self.source().index(src, 0)).row()
+
+    def current_row(self) -> int:
+        return self.currentIndex().row() if self.currentIndex().isValid() else -1
+
+    def set_current_row(self, row: int):
+        index = self.proxy.index(row, 0)
+        self.setCurrentIndex(index)
+        self.scrollTo(index)
+
+    def current_name(self) -> Optional[str]:
+        return self.name_at(self.current_row())
+
+    def selected_names(self) -> List[str]:
+        rows = sorted(i.row() for i in self.selectionModel().selectedRows())
+        return [self.name_at(r) for r in rows]
 
 
 class BatchExportThread(QThread):
     progressChanged = pyqtSignal(int)
+    statsChanged = pyqtSignal(dict)  # ExportMeter totals over all running jobs
     itemChanged = pyqtSignal(int, int, str)  # current_index(1-based), total, label
     done = pyqtSignal(str, bool)  # summary, has_errors
 
-    def __init__(self, tasks: List[dict]):
+    def __init__(self, tasks: List[dict], workers: int = 1, on_result=None):
         super().__init__()
-        self.tasks = list(tasks)
-        self.proc = None
-        self._stop = False
-
-    def _run_one(self, cmd: List[str], duration_us: int):
-        err_tail: List[str] = []
-        try:
-            self.proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
-                errors="replace",
-                bufsize=1,
-            )
-            self.progressChanged.emit(0)
-            if self.proc.stderr:
-                for raw in self.proc.stderr:
-                    if self._stop:
-                        self._terminate_proc()
-                        return False, ""
-                    line = (raw or "").strip()
-                    if not line:
-                        continue
-                    if "=" in line:
-                        k, v = line.split("=", 1)
-                        if k == "out_time_ms":
-                            try:
-                                cur = max(0, int(v))
-                                pct = max(0, min(99, int(cur * 100 / max(1, duration_us))))
-                                self.progressChanged.emit(pct)
-                            except Exception:
-                                pass
-                        elif k == "progress" and v == "end":
-                            self.progressChanged.emit(100)
-                    else:
-                        err_tail.append(line)
-                        if len(err_tail) > 120:
-                            err_tail = err_tail[-120:]
-            rc = self.proc.wait()
-            if self._stop:
-                return False, ""
-            if rc != 0:
-                msg = "\n".join(err_tail[-60:]) if err_tail else f"ffmpeg exited with code {rc}"
-                return False, msg
-            self.progressChanged.emit(100)
-            return True, ""
-        except Exception as e:
-            if self._stop:
-                return False, ""
-            return False, f"Failed to run ffmpeg: {e}"
-        finally:
-            self.proc = None
+        self.runner = BatchExportRunner(
+            tasks, workers,
+            on_progress=self.progressChanged.emit,
+            on_item=self.itemChanged.emit,
+            on_stats=self.statsChanged.emit,
+            on_result=on_result,
+        )
 
     def run(self):
-        total = len(self.tasks)
+        total = len(self.runner.tasks)
         if total <= 0:
             self.done.emit("No batch tasks to run.", True)
             return
 
-        failures: List[str] = []
-        for i, task in enumerate(self.tasks, start=1):
-            if self._stop:
-                return
-            label = task.get("label", f"item {i}")
-            self.itemChanged.emit(i, total, label)
-            ok, err = self._run_one(task["cmd"], int(task["duration_us"]))
-            if self._stop:
-                return
-            if not ok:
-                failures.append(f"[{label}] {err}")
+        self.progressChanged.emit(0)
+        results = self.runner.run()
+        if self.runner.stopped:
+            return
 
+        failures = [r for r in results if r]
         if failures:
             summary = (
                 f"Batch export completed with errors: {total - len(failures)}/{total} succeeded.\n\n"
@@ -609,19 +2015,7 @@ class BatchExportThread(QThread):
         self.done.emit(f"Batch export completed: {total}/{total} succeeded.", False)
 
     def stop(self):
-        self._stop = True
-        self._terminate_proc()
-
-    def _terminate_proc(self):
-        proc = self.proc
-        if proc is None:
-            return
-        if proc.poll() is not None:
-            return
-        try:
-            proc.terminate()
-        except Exception:
-            pass
+        self.runner.stop()
 
 
 # ------------------------------ Main Window ------------------------------
@@ -639,8 +2033,20 @@ class Cutter(QMainWindow):
         self.total_frames = 0
         self.video_width = 0
         self.video_height = 0
+        self.video_codec = ""
         self.current_frame = 0
         self.thread: Optional[VideoThread] = None
+        self._loading_video: Optional[VideoThread] = None        # opening on a VideoLoader, to be shown
+        self._preloaded_videos: Dict[str, VideoThread] = {}      # path -> opened ahead, not started
+        self._video_loaders: set = set()
+        self._retired_video_threads: set = set()                 # stopped players still winding down
+        self._swap_video: Optional[VideoThread] = None           # same video reopened from/without its proxy
+        self._proxy_cache = ProxyCache()
+        self._proxy_queue: List[str] = []
+        self.proxy_thread: Optional[ProxyBuildThread] = None
+        self._thumbs: Optional[ThumbnailStore] = None            # filmstrip/hover/scrub frames of the shown video
+        self.thumb_thread: Optional[ThumbnailBuildThread] = None
+        self._thumb_eq = EqAdjuster()
         self.is_playing = False
         self.scrub_was_playing = False
         self.duration_warning_text = "Warning: The requested duration may not be obtained, resulting in shorter image length"
@@ -653,6 +2059,9 @@ class Cutter(QMainWindow):
         self.loaded_video_name: Optional[str] = None
         self.export_thread: Optional[ExportThread] = None
         self.batch_export_thread: Optional[BatchExportThread] = None
+        self._manifest_results: Optional[ManifestResults] = None
+        self.export_probe_thread: Optional[MetaProbeThread] = None   # metadata for a batch about to start
+        self.folder_scan_thread: Optional[FolderScanThread] = None   # catalogs, lists and probes the open folder
         self._closing = False
         self._close_retry_scheduled = False
         self._close_retry_count = 0
@@ -664,8 +2073,11 @@ class Cutter(QMainWindow):
         G = QGridLayout(root); G.setContentsMargins(8,8,8,8); G.setSpacing(8)
 
         self.video_preview = CropPreviewWidget(self)
-        # (row=0, col=0) 2사분면
-        G.addWidget(self.video_preview, 0, 0)
+        # (row=0, col=0) 2사분면: 미리보기 아래에 필름스트립
+        preview_box = QWidget()
+        pvl = QVBoxLayout(preview_box); pvl.setContentsMargins(0, 0, 0, 0); pvl.setSpacing(4)
+        pvl.addWidget(self.video_preview, 1)
+        G.addWidget(preview_box, 0, 0)
 
         # playback panel
         play_group = QGroupBox("Playback")
@@ -679,15 +2091,60 @@ class Cutter(QMainWindow):
         self.slider = ClickJumpSlider(Qt.Horizontal); self.slider.setEnabled(False)
         self.lbl_frame = QLabel("Frame: 0 / 0")
         self.lbl_time  = QLabel("Time: 00:00.000 / 00:00.000")
+        self.lbl_playback_stats = QLabel("Dropped: 0  Late: 0")
+        self.lbl_playback_stats.setStyleSheet("color: #4c566a;")
+        self.lbl_playback_stats.setToolTip("Frames skipped to keep real-time speed, and frames shown later than scheduled.")
         self.speed = QDoubleSpinBox(); self.speed.setRange(0.25, 3.0); self.speed.setSingleStep(0.25); self.speed.setValue(1.0)
         self.speed.setSuffix("×")
-
-        gp.addWidget(self.slider, 0, 0, 1, 6)
+        self.combo_decoder = QComboBox()
+        for backend in DECODER_BACKENDS:
+            self.combo_decoder.addItem(backend.label, backend.name)
+        if not _find_ffmpeg_tool("ffmpeg"):
+            self.combo_decoder.model().item(self.combo_decoder.findData(FFmpegPipeDecoder.name)).setEnabled(False)
+        self.combo_decoder.setToolTip("Preview decoder. FFmpeg pipe decodes, scales and adjusts in a separate process.\n"
+                                      "Takes effect for the next loaded video.")
+        self.combo_decoder.currentIndexChanged.connect(self.on_decoder_changed)
+        self.chk_proxy = QCheckBox("Proxy for heavy videos")
+        self.chk_proxy.setChecked(True)
+        self.chk_proxy.setToolTip(
+            f"Play and scrub 4K, HEVC or very high bitrate videos from a {PROXY_MAX_HEIGHT}p copy built in the\n"
+            "background. Frame numbers, crop and exports always use the original file.")
+        self.chk_proxy.toggled.connect(self.on_proxy_toggled)
+        self.lbl_proxy = QLabel("")
+        self.lbl_proxy.setStyleSheet("color: #4c566a;")
+        self.chk_thumbs = QCheckBox("Thumbnails")
+        self.chk_thumbs.setChecked(True)
+        self.chk_thumbs.setToolTip(
+            "Decode the video once, keyframes first, at low priority in the background into small frames\n"
+            "kept on disk. They feed the filmstrip, the slider hover preview and slider drags (no decoder).")
+        self.chk_thumbs.toggled.connect(self._update_thumbnail_store)
+        self.filmstrip = FilmstripWidget()
+        self.filmstrip.setVisible(False)
+        pvl.addWidget(self.filmstrip)
+        # 필름스트립 자리만큼 미리보기 최소 높이를 줄여 상단 영역의 최소 높이는 그대로 둔다
+        self.video_preview.setMinimumHeight(
+            self.video_preview.minimumHeight() - self.filmstrip.height() - pvl.spacing())
+        self.filmstrip.frameClicked.connect(self._jump_to_frame)
+        self.thumb_popup = ThumbnailPopup(self)
+        for src in (self.slider, self.filmstrip):
+            src.hovered.connect(self._on_timeline_hover)
+            src.hoverLeft.connect(self.thumb_popup.hide)
+
+        gp.addWidget(self.slider, 0, 0, 1, 7)
         gp.addWidget(QLabel("Speed:"), 1, 0)
         gp.addWidget(self.speed, 1, 1)
         gp.addWidget(self.btn_play, 1, 2, 1, 2)
         gp.addWidget(self.lbl_frame, 1, 4)
         gp.addWidget(self.lbl_time,  1, 5)
+        gp.addWidget(self.lbl_playback_stats, 1, 6)
+        gp.addWidget(QLabel("Decoder:"), 2, 0)
+        gp.addWidget(self.combo_decoder, 2, 1)
+        gp.addWidget(self.chk_proxy, 2, 2, 1, 2)
+        preview_opts = QWidget()
+        pol = QHBoxLayout(preview_opts); pol.setContentsMargins(0, 0, 0, 0); pol.setSpacing(8)
+        pol.addWidget(self.chk_thumbs)
+        pol.addWidget(self.lbl_proxy, 1)
+        gp.addWidget(preview_opts, 2, 4, 1, 3)
         gp.setColumnStretch(2, 1)
         gp.setColumnStretch(3, 1)
 
@@ -771,9 +2228,22 @@ class Cutter(QMainWindow):
         file_group.setMinimumWidth(330)
         gf = QVBoxLayout(file_group)
         self.btn_open = QPushButton("Open Folder")
-        self.list_videos = QListWidget()
+        self.chk_recursive = QCheckBox("Include subfolders")
+        self.chk_recursive.setToolTip("List the videos of every subfolder too. Folders are indexed in a catalog kept\n"
+                                      "between sessions, so only folders that changed are listed again.")
+        self.chk_recursive.toggled.connect(self.on_recursive_toggled)
+        self.video_model = VideoListModel(self)
+        self.ed_video_filter = QLineEdit()
+        self.ed_video_filter.setPlaceholderText("Filter, e.g. under:subject_12 1080p unexported")
+        self.ed_video_filter.setToolTip(VIDEO_QUERY_HELP)
+        self.ed_video_filter.setClearButtonEnabled(True)
+        self.list_videos = VideoListView(self.video_model)
+        self.ed_video_filter.textChanged.connect(self.list_videos.proxy.set_filter_text)
         self.btn_load = QPushButton("Load Video")
-        gf.addWidget(self.btn_open); gf.addWidget(self.list_videos); gf.addWidget(self.btn_load)
+        open_row = QHBoxLayout()
+        open_row.addWidget(self.btn_open, 1); open_row.addWidget(self.chk_recursive)
+        gf.addLayout(open_row); gf.addWidget(self.ed_video_filter); gf.addWidget(self.list_videos)
+        gf.addWidget(self.btn_load)
         G.addWidget(file_group, 0, 1)
 
         cut_group = QGroupBox("Clip Parameters")
@@ -834,19 +2304,32 @@ class Cutter(QMainWindow):
         self.ed_suffix = QLineEdit("cut")
         self.btn_cut = QPushButton("Save Current Video")
         self.btn_cut_multi = QPushButton("Save Videos...")
+        self.btn_cut_clips = QPushButton("Save Clips...")
+        self.btn_cut_clips.setToolTip("Export several ranges of the current video in one ffmpeg pass\n"
+                                      "(ranges from bookmark pairs or typed in).")
         self.btn_export_dir = QPushButton("Save at")
         self.lbl_export_dir = QLabel("-")
         self.lbl_export_dir.setStyleSheet("color: #4c566a;")
         self.lbl_export_dir.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.rad_accurate = QRadioButton("accurate (re-encode)")
-        self.rad_fast = QRadioButton("fast (stream copy)")
+        self.rad_accurate = QRadioButton("accurate")
+        self.rad_fast = QRadioButton("fast")
+        self.rad_smart = QRadioButton("smart")
         self.rad_accurate.setChecked(True)
+        self.spn_chunks = QSpinBox()
+        self.spn_chunks.setRange(1, EXPORT_CHUNKS_MAX)
+        self.spn_chunks.setSpecialValueText("Off")
+        self.spn_chunks.setValue(1)
+        self.spn_chunks.setToolTip(
+            "Accurate export of the current video: split the range at keyframes into this many chunks,\n"
+            "encode them in parallel and join them without re-encoding. Short ranges are encoded in one piece."
+        )
         mode_row = QWidget()
         mode_row_l = QHBoxLayout(mode_row)
         mode_row_l.setContentsMargins(0, 0, 0, 0)
         mode_row_l.setSpacing(12)
         mode_row_l.addWidget(self.rad_accurate)
         mode_row_l.addWidget(self.rad_fast)
+        mode_row_l.addWidget(self.rad_smart)
         mode_row_l.addStretch(1)
         self._apply_cut_mode_tooltips()
         dir_row = QWidget()
@@ -861,13 +2344,22 @@ class Cutter(QMainWindow):
         ge.addWidget(QLabel("Suffix:"), 1, 2)
         ge.addWidget(self.ed_suffix,    1, 3)
         ge.addWidget(mode_row,          2, 0, 1, 4)
+        chunks_row = QWidget()
+        chunks_row_l = QHBoxLayout(chunks_row)
+        chunks_row_l.setContentsMargins(0, 0, 0, 0)
+        chunks_row_l.setSpacing(6)
+        chunks_row_l.addWidget(QLabel("Parallel chunks:"))
+        chunks_row_l.addWidget(self.spn_chunks)
+        chunks_row_l.addStretch(1)
+        ge.addWidget(chunks_row,        3, 0, 1, 4)
         export_btn_row = QWidget()
         export_btn_row_l = QHBoxLayout(export_btn_row)
         export_btn_row_l.setContentsMargins(0, 0, 0, 0)
         export_btn_row_l.setSpacing(8)
         export_btn_row_l.addWidget(self.btn_cut)
         export_btn_row_l.addWidget(self.btn_cut_multi)
-        ge.addWidget(export_btn_row, 3, 0, 1, 4)
+        ge.addWidget(export_btn_row, 4, 0, 1, 4)
+        ge.addWidget(self.btn_cut_clips, 5, 0, 1, 4)
 
         # 3사분면: Playback + Bookmarks
         bottom_left = QWidget(); bl = QVBoxLayout(bottom_left); bl.setContentsMargins(0,0,0,0); bl.setSpacing(8)
@@ -918,8 +2410,7 @@ class Cutter(QMainWindow):
         # ---------- connections ----------
         self.btn_open.clicked.connect(self.open_folder)
         self.btn_load.clicked.connect(self.load_video)
-        self.list_videos.itemDoubleClicked.connect(self.load_video)
-        self.list_videos.itemSelectionChanged.connect(self._refresh_loaded_video_highlight)
+        self.list_videos.doubleClicked.connect(self.load_video)
         self.btn_play.clicked.connect(self.toggle_play)
 
         self.slider.sliderPressed.connect(self.on_slider_pressed)
@@ -932,6 +2423,11 @@ class Cutter(QMainWindow):
         self.btn_bm_go.clicked.connect(self.goto_bookmark)
         self.btn_bm_del.clicked.connect(self.del_bookmark)
         self.video_preview.cropSelectionFinished.connect(self._on_crop_selection_finished)
+        self._preview_size_timer = QTimer(self)
+        self._preview_size_timer.setSingleShot(True)
+        self._preview_size_timer.setInterval(120)
+        self._preview_size_timer.timeout.connect(self._apply_preview_size)
+        self.video_preview.displaySizeChanged.connect(lambda *_: self._preview_size_timer.start())
         self.sld_contrast.valueChanged.connect(self.spn_contrast.setValue)
         self.spn_contrast.valueChanged.connect(self.sld_contrast.setValue)
         self.sld_brightness.valueChanged.connect(self.spn_brightness.setValue)
@@ -964,9 +2460,11 @@ class Cutter(QMainWindow):
         # cut
         self.btn_cut.clicked.connect(self.cut_video)
         self.btn_cut_multi.clicked.connect(self.open_batch_export_dialog)
+        self.btn_cut_clips.clicked.connect(self.open_multi_range_dialog)
         self.rad_accurate.toggled.connect(lambda _: self._update_reencode_eta_status())
         self.rad_accurate.toggled.connect(lambda _: self._update_cut_mode_tooltip())
         self.rad_fast.toggled.connect(lambda _: self._update_cut_mode_tooltip())
+        self.rad_smart.toggled.connect(lambda _: self._update_cut_mode_tooltip())
         # initial state
         self.update_enable_state(folder_loaded=False, video_loaded=False)
 
@@ -1002,6 +2500,10 @@ class Cutter(QMainWindow):
         self.status_progress_info.setStyleSheet("color: #2f3a4a;")
         self.status_progress_info.setVisible(False)
         self.statusBar().addPermanentWidget(self.status_progress_info)
+        self.status_progress_rate = QLabel("")
+        self.status_progress_rate.setStyleSheet("color: #5a6577;")
+        self.status_progress_rate.setVisible(False)
+        self.statusBar().addPermanentWidget(self.status_progress_rate)
 
     # 비차단 상태 메시지 표시 유틸 (하단 status bar + Export 라벨 동시 갱신)
     def _set_export_status(self, text: str, tooltip: str = None, auto_clear_ms: int = 0):
@@ -1011,7 +2513,7 @@ class Cutter(QMainWindow):
 
     def _apply_no_focus(self):
         # 대부분 위젯은 NoFocus, 텍스트 입력/리스트는 ClickFocus 유지
-        keep_click = {QLineEdit, QDoubleSpinBox, QSpinBox, QComboBox, QListWidget}
+        keep_click = {QLineEdit, QDoubleSpinBox, QSpinBox, QComboBox, QListWidget, QTableView}
         for w in self.findChildren(QWidget):
             if any(isinstance(w, k) for k in keep_click):
                 w.setFocusPolicy(Qt.ClickFocus)
@@ -1035,11 +2537,18 @@ class Cutter(QMainWindow):
                 "Fast mode: uses stream copy without re-encoding. Much faster and keeps original streams, "
                 "but cut points can shift to nearby keyframes."
             )
+        if index == 2:
+            return (
+                "Smart mode: frame-accurate like Accurate, but only the partial GOPs at the start and end are "
+                "re-encoded and everything between keyframes is stream-copied. H.264 sources only; "
+                "other sources, crop and image adjustments fall back to a full re-encode."
+            )
         return ""
 
     def _apply_cut_mode_tooltips(self):
         self.rad_accurate.setToolTip(self._cut_mode_tooltip_text(0))
         self.rad_fast.setToolTip(self._cut_mode_tooltip_text(1))
+        self.rad_smart.setToolTip(self._cut_mode_tooltip_text(2))
         self._update_cut_mode_tooltip()
 
     def _update_cut_mode_tooltip(self):
@@ -1090,26 +2599,10 @@ class Cutter(QMainWindow):
             s.setStyleSheet(style)
 
     def _apply_video_list_styles(self):
-        self.list_videos.setStyleSheet("QListWidget::item { padding: 2px 4px; }")
+        self.list_videos.setStyleSheet("QTableView::item { padding: 2px 4px; }")
 
     def _refresh_loaded_video_highlight(self):
-        selected_rows = {idx.row() for idx in self.list_videos.selectedIndexes()}
-        for i in range(self.list_videos.count()):
-            it = self.list_videos.item(i)
-            is_loaded = bool(self.loaded_video_name and it.text() == self.loaded_video_name)
-            is_selected = i in selected_rows
-            if is_loaded and is_selected:
-                it.setBackground(QColor("#356bb3"))  # darker blue-gray overlay state
-                it.setForeground(QColor("white"))
-            elif is_loaded:
-                it.setBackground(QColor("#4a90ff"))
-                it.setForeground(QColor("white"))
-            elif is_selected:
-                it.setBackground(QColor("#d9dee6"))
-                it.setForeground(QColor("#111111"))
-            else:
-                it.setBackground(QColor("white"))
-                it.setForeground(QColor("black"))
+        self.video_model.set_loaded_name(self.loaded_video_name)
 
     def _apply_adjustment_focus_rules(self):
         for sp in (self.spn_contrast, self.spn_brightness, self.spn_saturation):
@@ -1159,19 +2652,7 @@ class Cutter(QMainWindow):
         return int(self.spn_crop_width.value()), int(self.spn_crop_height.value())
 
     def _fixed_crop_size_error(self, video_width: int, video_height: int):
-        fixed_size = self._requested_fixed_crop_size()
-        if fixed_size is None:
-            return None
-        width, height = fixed_size
-        if width < 4 or height < 4:
-            return 'Fixed crop width and height must be at least 4 pixels.'
-        if width % 2 or height % 2:
-            return 'Fixed crop width and height must be even for video compatibility.'
-        if video_width <= 0 or video_height <= 0:
-            return 'Fixed crop size cannot be checked until the video dimensions are available.'
-        if width > int(video_width) or height > int(video_height):
-            return f'Fixed crop {width}x{height} is larger than the video ({video_width}x{video_height}).'
-        return None
+        return _crop_size_error(self._requested_fixed_crop_size(), video_width, video_height)
 
     def _crop_rect_to_norm(self, crop_rect, video_width: int, video_height: int):
         if not crop_rect or video_width <= 0 or video_height <= 0:
@@ -1183,68 +2664,12 @@ class Cutter(QMainWindow):
             (crop_rect['y'] + crop_rect['h']) / float(video_height),
         )
 
-    def _normalize_crop_rect(self, rect_norm):
-        if not rect_norm:
-            return None
-        left = max(0.0, min(1.0, min(float(rect_norm[0]), float(rect_norm[2]))))
-        top = max(0.0, min(1.0, min(float(rect_norm[1]), float(rect_norm[3]))))
-        right = max(0.0, min(1.0, max(float(rect_norm[0]), float(rect_norm[2]))))
-        bottom = max(0.0, min(1.0, max(float(rect_norm[1]), float(rect_norm[3]))))
-        if right - left <= 1e-6 or bottom - top <= 1e-6:
-            return None
-        return (left, top, right, bottom)
-
     def _validated_crop_rect_for_size(self, video_width: int, video_height: int, rect_norm=None):
-        rect_norm = self._normalize_crop_rect(rect_norm if rect_norm is not None else self.crop_norm_rect)
-        if rect_norm is None:
-            return None, "Crop canceled: invalid selection."
-        video_width = int(video_width)
-        video_height = int(video_height)
-        if video_width <= 1 or video_height <= 1:
-            return None, "Crop canceled: video size is unavailable."
+        rect_norm = rect_norm if rect_norm is not None else self.crop_norm_rect
+        return _validated_crop_rect(rect_norm, self._requested_fixed_crop_size(), video_width, video_height)
 
-        fixed_size = self._requested_fixed_crop_size()
-        if fixed_size is not None:
-            fixed_error = self._fixed_crop_size_error(video_width, video_height)
-            if fixed_error:
-                return None, fixed_error
-            width, height = fixed_size
-            center_x = ((rect_norm[0] + rect_norm[2]) / 2.0) * video_width
-            center_y = ((rect_norm[1] + rect_norm[3]) / 2.0) * video_height
-            left = int(round(center_x - width / 2.0))
-            top = int(round(center_y - height / 2.0))
-            left = max(0, min(left, video_width - width))
-            top = max(0, min(top, video_height - height))
-            left -= left % 2
-            top -= top % 2
-            return {'x': left, 'y': top, 'w': width, 'h': height}, None
-
-        left = max(0, min(int(round(rect_norm[0] * video_width)), video_width - 1))
-        top = max(0, min(int(round(rect_norm[1] * video_height)), video_height - 1))
-        right = max(left + 1, min(int(round(rect_norm[2] * video_width)), video_width))
-        bottom = max(top + 1, min(int(round(rect_norm[3] * video_height)), video_height))
-
-        if right - left < 4 or bottom - top < 4:
-            return None, "Crop canceled: selection is too small."
-
-        left_even = left + (left % 2)
-        top_even = top + (top % 2)
-        right_even = right - (right % 2)
-        bottom_even = bottom - (bottom % 2)
-        width = right_even - left_even
-        height = bottom_even - top_even
-        if width < 4 or height < 4:
-            return None, "Crop canceled: selection is too small."
-
-        return {"x": left_even, "y": top_even, "w": width, "h": height}, None
-
-    def _crop_filter_for_size(self, video_width: int, video_height: int):
-        if not self._crop_active():
-            return "", None
-        crop_rect, err = self._validated_crop_rect_for_size(video_width, video_height)
-        if err:
-            return "", err
-        return f"crop={crop_rect['w']}:{crop_rect['h']}:{crop_rect['x']}:{crop_rect['y']}", None
+    def _crop_filter_for_size(self, video_width: int, video_height: int):
+        return _crop_filter(self._export_settings(), video_width, video_height)
 
     def _update_crop_button(self):
         if self.crop_state == "armed":
@@ -1292,7 +2717,7 @@ class Cutter(QMainWindow):
             self._set_export_status(status_text, auto_clear_ms=auto_clear_ms)
 
     def _activate_crop_selection(self, rect_norm, status_text: str = ""):
-        rect_norm = self._normalize_crop_rect(rect_norm)
+        rect_norm = _normalize_crop_rect(rect_norm)
         if rect_norm is None:
             return
         self.crop_norm_rect = rect_norm
@@ -1372,24 +2797,24 @@ class Cutter(QMainWindow):
     def _visual_filters_active(self) -> bool:
         return self._adjustments_active() or self._crop_active()
 
-    def _ffmpeg_eq_filter(self) -> str:
-        contrast, brightness, saturation = self._current_adjustments()
-        return f"eq=contrast={contrast:.3f}:brightness={brightness:.3f}:saturation={saturation:.3f}"
-
     def _sync_export_mode_for_adjustments(self):
         if not self.video_path:
             self.rad_accurate.setEnabled(False)
             self.rad_fast.setEnabled(False)
+            self.rad_smart.setEnabled(False)
             return
+        self.rad_smart.setEnabled(True)
         if self._visual_filters_active():
-            if not self.rad_accurate.isChecked():
+            if self.rad_fast.isChecked():
                 self.rad_accurate.setChecked(True)
             self.rad_fast.setEnabled(False)
             self.rad_fast.setToolTip("When image adjustments or crop are enabled, only Accurate mode is available.")
+            self.rad_smart.setToolTip("Image adjustments or crop are enabled: Smart mode re-encodes the whole clip.")
         else:
             self.rad_accurate.setEnabled(True)
             self.rad_fast.setEnabled(True)
             self.rad_fast.setToolTip(self._cut_mode_tooltip_text(1))
+            self.rad_smart.setToolTip(self._cut_mode_tooltip_text(2))
             self._update_cut_mode_tooltip()
 
     def _on_adjustment_changed(self, _=None):
@@ -1397,6 +2822,7 @@ class Cutter(QMainWindow):
         if not self.thread:
             return
         self.thread.set_adjustments(*self._current_adjustments())
+        self.filmstrip.set_adjustments(*self._current_adjustments())
         if not self.is_playing:
             self.thread.seek(self.current_frame)
 
@@ -1430,15 +2856,7 @@ class Cutter(QMainWindow):
         return self.total_frames / self.fps
 
     def _duration_input_seconds_for_fps(self, fps: float) -> Optional[float]:
-        dur_val = float(self.ed_dur.value())
-        unit = self.unit_dur.currentText()
-        if unit == "seconds":
-            return dur_val
-        if unit == "minutes":
-            return dur_val * 60.0
-        if fps <= 1e-6:
-            return None
-        return dur_val / fps
+        return _duration_seconds(self._export_settings(), fps)
 
     def _duration_input_seconds(self) -> Optional[float]:
         return self._duration_input_seconds_for_fps(self.fps)
@@ -1496,23 +2914,55 @@ class Cutter(QMainWindow):
         h, m = divmod(m, 60)
         return f"{h}h {m}m {s}s"
 
-    def _estimate_cut_walltime(self, clip_seconds: float):
-        clip = max(0.0, float(clip_seconds))
-        if clip <= 1e-6:
-            return 0.0, 0.0, 1.0
-        width = max(1, int(self.video_width) if self.video_width else 1920)
-        height = max(1, int(self.video_height) if self.video_height else 1080)
-        fps = self.fps if self.fps > 1e-6 else 30.0
+    def _export_mode_profile(self, mode: str) -> str:
+        """Mode part of an export speed profile for the current settings ("accurate-chunks4", ...)."""
+        if mode.startswith("accurate") and self.spn_chunks.value() > 1:
+            return f"{mode}-chunks{self.spn_chunks.value()}"
+        return mode
 
+    def _heuristic_speed_rt(self, mode: str, width: int, height: int, fps: float) -> float:
+        # 측정 기록이 없을 때만 쓰는 대략적인 값
         complexity = (width * height) / (1920.0 * 1080.0)
         complexity *= max(0.5, fps / 30.0)
         encode_speed_rt = max(0.25, 1.8 / max(0.2, complexity))
         copy_speed_rt = max(8.0, 35.0 / math.sqrt(max(1.0, complexity)))
+        if mode.endswith("fast"):
+            return copy_speed_rt
+        return encode_speed_rt
+
+    def _estimate_export_walltime(self, clip_seconds: float, mode: str, width: int = 0, height: int = 0,
+                                  fps: float = 0.0, codec: Optional[str] = None):
+        """Return (seconds, measured) for exporting ``clip_seconds`` with the given mode profile."""
+        clip = max(0.0, float(clip_seconds))
+        width = max(1, int(width or self.video_width or 1920))
+        height = max(1, int(height or self.video_height or 1080))
+        fps = fps if fps > 1e-6 else (self.fps if self.fps > 1e-6 else 30.0)
+        codec = self.video_codec if codec is None else codec
+        speed = _export_speed_model().speed(_export_profile(mode, codec, width, height, fps))
+        if speed is not None and speed > 1e-6:
+            return clip / speed, True
+        if mode == "smart":
+            # 양 끝 GOP 재인코딩(대략 4초) + 나머지 복사
+            edges = min(clip, 4.0)
+            return (edges / self._heuristic_speed_rt("accurate", width, height, fps)
+                    + (clip - edges) / self._heuristic_speed_rt("fast", width, height, fps)), False
+        return clip / self._heuristic_speed_rt(mode, width, height, fps), False
 
-        encode_time = clip / encode_speed_rt
-        copy_time = clip / copy_speed_rt
+    def _estimate_cut_walltime(self, clip_seconds: float):
+        """Return (copy_time, encode_time, slowdown, measured) for the current video."""
+        clip = max(0.0, float(clip_seconds))
+        if clip <= 1e-6:
+            return 0.0, 0.0, 1.0, False
+        copy_time, _ = self._estimate_export_walltime(clip, "fast")
+        encode_time, measured = self._estimate_export_walltime(clip, self._export_mode_profile("accurate"))
         slowdown = encode_time / max(copy_time, 1e-6)
-        return copy_time, encode_time, slowdown
+        return copy_time, encode_time, slowdown, measured
+
+    def _reencode_eta_text(self, clip_seconds: float) -> str:
+        _, encode_time, slowdown, measured = self._estimate_cut_walltime(clip_seconds)
+        basis = "measured on this PC" if measured else "rough guess until an export has been measured"
+        return (f"Estimated re-encode time: {self._fmt_eta(encode_time)} "
+                f"(about {slowdown:.0f}x slower than fast copy, {basis}).")
 
     def _update_reencode_eta_status(self):
         if not self.rad_accurate.isChecked():
@@ -1520,10 +2970,7 @@ class Cutter(QMainWindow):
         res, err = self._resolve_cut_params()
         if err:
             return
-        _, encode_time, slowdown = self._estimate_cut_walltime(res["dur_sec"])
-        self._set_export_status(
-            f"Estimated re-encode time: {self._fmt_eta(encode_time)} (about {slowdown:.0f}x slower than fast copy)."
-        )
+        self._set_export_status(self._reencode_eta_text(res["dur_sec"]))
 
     def _on_cut_param_changed(self):
         self.update_labels()
@@ -1534,13 +2981,15 @@ class Cutter(QMainWindow):
         # defaults
         self.btn_open.setEnabled(True)
         self.list_videos.setEnabled(folder_loaded)
+        self.ed_video_filter.setEnabled(folder_loaded)
         self.btn_load.setEnabled(folder_loaded)
 
         # right side panels
         enable_right = video_loaded
         for w in (self.ed_start, self.btn_start_from_cur, self.ed_dur, self.unit_dur,
                   self.ed_end, self.btn_end_from_cur, self.ed_prefix, self.ed_suffix, self.btn_cut, self.btn_cut_multi,
-                  self.rad_accurate, self.rad_fast,
+                  self.btn_cut_clips,
+                  self.rad_accurate, self.rad_fast, self.rad_smart,
                   self.combo_mode):
             w.setEnabled(enable_right)
         self.btn_export_dir.setEnabled(folder_loaded)
@@ -1566,6 +3015,7 @@ class Cutter(QMainWindow):
         else:
             self.rad_accurate.setEnabled(False)
             self.rad_fast.setEnabled(False)
+            self.rad_smart.setEnabled(False)
         self._update_export_dir_label()
 
     # ----------------------------- file ops -----------------------------
@@ -1574,16 +3024,68 @@ class Cutter(QMainWindow):
         if not path:
             return
         self.video_folder = path
-        self.list_videos.clear()
-        # list video files
-        exts = (".mp4",".mkv",".avi",".mov",".m4v",".webm")
-        files = [f for f in os.listdir(path) if f.lower().endswith(exts)]
-        files.sort()
-        self.list_videos.addItems(files)
+        for video in self._preloaded_videos.values():
+            self._drop_video(video)
+        self._preloaded_videos.clear()
+        self._scan_folder(path)
         self._refresh_loaded_video_highlight()
         self.update_enable_state(folder_loaded=True, video_loaded=False)
         self._update_export_dir_label()
 
+    def _scan_folder(self, path: str):
+        # 큰 폴더도 창이 멈추지 않도록 카탈로그 갱신과 목록, 메타데이터 읽기는 백그라운드에서 한다
+        if self.folder_scan_thread:
+            self.folder_scan_thread.stop()
+            for signal in (self.folder_scan_thread.found, self.folder_scan_thread.metaFound,
+                           self.folder_scan_thread.exportedFound, self.folder_scan_thread.listed,
+                           self.folder_scan_thread.probed, self.folder_scan_thread.failed):
+                signal.disconnect()
+        self.video_model.clear()
+        thread = FolderScanThread(path, self.chk_recursive.isChecked())
+        thread.found.connect(self.video_model.add_entries)
+        thread.metaFound.connect(self.video_model.set_metas)
+        thread.exportedFound.connect(self.video_model.set_exported)
+        thread.listed.connect(self._on_folder_listed)
+        thread.probed.connect(self._on_folder_file_probed)
+        thread.failed.connect(lambda err: QMessageBox.warning(self, "Open Folder", f"Cannot list the folder:\n{err}"))
+        thread.finished.connect(self._on_folder_scan_finished)
+        self.folder_scan_thread = thread
+        self.statusBar().showMessage("Listing videos...")
+        thread.start()
+
+    def on_recursive_toggled(self, _=None):
+        if self.video_folder:
+            self._scan_folder(self.video_folder)
+
+    def _on_folder_listed(self, count: int):
+        self.video_model.resort()
+        self.statusBar().showMessage(f"{count} videos", 3000)
+        self._refresh_loaded_video_highlight()
+
+    def _on_folder_file_probed(self, path: str, meta):
+        if not self.video_folder:
+            return
+        name = os.path.relpath(path, os.path.abspath(self.video_folder))
+        self.video_model.set_meta(name, meta)
+
+    def _on_folder_scan_finished(self):
+        thread = self.sender()
+        if thread is not None and thread is self.folder_scan_thread:
+            self.folder_scan_thread = None
+        if thread is not None:
+            thread.deleteLater()
+
+    def _refresh_exported(self):
+        """Reload the export history marks of the listed files from the catalog."""
+        if not self.video_folder:
+            return
+        try:
+            paths = _video_catalog().exported_under(self.video_folder)
+        except Exception:
+            return
+        root = os.path.abspath(self.video_folder)
+        self.video_model.set_exported(os.path.relpath(p, root) for p in paths)
+
     def _apply_mode_values_on_video_load(self):
         last_frame = max(0, self.total_frames - 1)
         state = getattr(self, "_param_state", 0)
@@ -1607,27 +3109,133 @@ class Cutter(QMainWindow):
                 self.ed_end.setText(str(last_frame))
 
     def load_video(self):
-        item = self.list_videos.currentItem()
-        if not item:
+        name = self.list_videos.current_name()
+        if not name:
             return
-        self.video_path = os.path.join(self.video_folder, item.text())
-        # stop existing thread
-        if self.thread:
-            self.thread.stop()
-            self.thread.wait()
-            self.thread = None
+        self._open_video(os.path.join(self.video_folder, name))
+
+    def _open_video(self, path: str):
+        """Show ``path``: take the pre-opened player if there is one, else open it on a VideoLoader."""
+        # 이전 플레이어는 기다리지 않고 정리를 맡긴다
+        self._retire_video_thread(self.thread)
+        self.thread = None
+        self.video_path = None
+        self.is_playing = False
+        self.btn_play.setText("Play")
+        backend = self.combo_decoder.currentData()
+        if self._swap_video is not None:
+            self._drop_video(self._swap_video)
+            self._swap_video = None
+        self._stop_thumbnail_build()
+        self._set_thumbnail_store(None)
+        video = self._preloaded_videos.pop(path, None)
+        if video is None and self._loading_video is not None and self._loading_video.path == path:
+            video = self._loading_video
+        if video is not None and video.backend != backend:
+            self._drop_video(video)
+            video = None
+        if self._loading_video is not None and self._loading_video is not video:
+            self._drop_video(self._loading_video)
+        self._loading_video = video or self._start_video_loader(path, backend)
+        if getattr(self._loading_video, "preload_ok", None) is not None:
+            self._finish_video_load(self._loading_video)
+            return
+        self.video_preview.clear_frame()
+        self.video_preview.set_placeholder(f"Loading {os.path.basename(path)}...")
+        self.update_enable_state(folder_loaded=True, video_loaded=False)
 
-        self.thread = VideoThread(self.video_path)
-        if not self.thread.open():
-            QMessageBox.warning(self, "Error", "Failed to open video.")
-            self.thread = None
-            self.video_path = None
+    def _start_video_loader(self, path: str, backend: str) -> VideoThread:
+        proxy = self._proxy_cache.ready_path(path) if self.chk_proxy.isChecked() else None
+        video = VideoThread(path, backend=backend, proxy_path=proxy)
+        video.preload_ok = None     # set on the GUI thread once the loader reports
+        loader = VideoLoader(video, self.video_preview.display_pixel_size(), self._current_adjustments())
+        loader.loaded.connect(self._on_video_preloaded)
+        loader.finished.connect(self._on_video_loader_finished)
+        self._video_loaders.add(loader)
+        loader.start()
+        return video
+
+    def _on_video_preloaded(self, video: VideoThread, ok: bool):
+        video.preload_ok = ok
+        if self._closing:
+            video.discard()
+        elif video is self._loading_video:
+            self._finish_video_load(video)
+        elif video is self._swap_video:
+            self._finish_video_swap(video)
+        elif self._preloaded_videos.get(video.path) is not video:
+            video.discard()
+        elif not ok:
+            self._preloaded_videos.pop(video.path, None)
+            video.discard()
+
+    def _on_video_loader_finished(self):
+        loader = self.sender()
+        self._video_loaders.discard(loader)
+        if loader is not None:
+            loader.deleteLater()
+
+    def _drop_video(self, video: VideoThread):
+        # 아직 로더가 여는 중이면 결과가 왔을 때 _on_video_preloaded 가 정리한다
+        if getattr(video, "preload_ok", None) is not None:
+            video.discard()
+
+    def _retire_video_thread(self, thread: Optional[VideoThread]):
+        if thread is None:
+            return
+        if not thread.isRunning():
+            thread.deleteLater()
+            return
+        # finished 를 먼저 연결해야 stop 직후 끝나는 스레드도 놓치지 않는다
+        self._retired_video_threads.add(thread)
+        thread.finished.connect(self._on_retired_video_thread_finished)
+        thread.stop()
+
+    def _on_retired_video_thread_finished(self):
+        thread = self.sender()
+        self._retired_video_threads.discard(thread)
+        if thread is not None:
+            thread.deleteLater()
+
+    def _preload_next_video(self):
+        """Open the item after the loaded one ahead of time, so stepping through a folder is quick."""
+        row = self.list_videos.row_of(self.loaded_video_name)
+        nxt = self.list_videos.name_at(row + 1) if row >= 0 else None
+        path = os.path.join(self.video_folder, nxt) if nxt else None
+        for other in [p for p in self._preloaded_videos if p != path]:
+            self._drop_video(self._preloaded_videos.pop(other))
+        if path and path not in self._preloaded_videos:
+            self._preloaded_videos[path] = self._start_video_loader(path, self.combo_decoder.currentData())
+
+    def _load_adjacent_video(self, delta: int):
+        # 연달아 누르면 아직 로딩 중인 항목을 기준으로 이어서 움직인다
+        row = self.list_videos.current_row()
+        if row < 0:
+            row = self.list_videos.row_of(self.loaded_video_name)
+        row += delta
+        if 0 <= row < self.list_videos.count():
+            self.list_videos.set_current_row(row)
+            self.load_video()
+
+    def _finish_video_load(self, video: VideoThread):
+        self._loading_video = None
+        if not video.preload_ok:
+            video.discard()
+            self.video_preview.set_placeholder("No video")
+            self.loaded_video_name = None
+            self._refresh_loaded_video_highlight()
+            self.update_enable_state(folder_loaded=True, video_loaded=False)
+            QMessageBox.warning(self, "Error", f"Failed to open video.\n\n{video.path}")
             return
+        self.thread = video
+        self.video_path = video.path
+        self.video_preview.set_placeholder("No video")
 
         self.fps = self.thread.fps
         self.total_frames = self.thread.total
         self.video_width = self.thread.width
         self.video_height = self.thread.height
+        self.video_codec = self.thread.codec
         if not self.chk_crop_fixed.isChecked():
             even_width = max(4, self.video_width - (self.video_width % 2))
             even_height = max(4, self.video_height - (self.video_height % 2))
@@ -1644,40 +3252,183 @@ class Cutter(QMainWindow):
         else:
             self._revalidate_crop_for_current_video("Crop canceled: selection is too small for this video.")
 
-        # connect signals
-        self.thread.frameReady.connect(self.on_frame)
-        self.thread.playbackEnded.connect(self.on_video_finished)
-        self.thread.start()
-        self.thread.set_adjustments(*self._current_adjustments())
-
         # auto show first frame
-        self.thread.seek(0)
-        self.thread.pause()
+        self._start_video_thread(0)
 
         self.update_labels()
-        self.loaded_video_name = os.path.basename(self.video_path)
+        # 하위 폴더까지 나열할 때는 목록 이름이 폴더 기준 상대 경로다
+        self.loaded_video_name = (os.path.relpath(self.video_path, self.video_folder) if self.video_folder
+                                  else os.path.basename(self.video_path))
         self._refresh_loaded_video_highlight()
         self.update_enable_state(folder_loaded=True, video_loaded=True)
         self._on_cut_param_changed()
+        self._update_proxy_state()
+        self._update_thumbnail_store()
+        self._preload_next_video()
+
+    def _start_video_thread(self, frame: int):
+        self.thread.frameReady.connect(self.on_frame)
+        self.thread.playbackEnded.connect(self.on_video_finished)
+        self.thread.playbackStats.connect(self._on_playback_stats)
+        self.lbl_playback_stats.setText("Dropped: 0  Late: 0")
+        self.thread.start()
+        self.thread.set_adjustments(*self._current_adjustments())
+        self.thread.set_display_size(*self.video_preview.display_pixel_size())
+        self.thread.set_display_refresh(self._display_refresh_hz())
+        self.thread.seek(frame)
+        self.thread.pause()
+
+    # ------------------------------ proxies ------------------------------
+    def _switch_video_source(self):
+        """Reopen the shown video from its proxy, or from the original, keeping frame and cut settings."""
+        if not self.thread or self._loading_video is not None:
+            return
+        if self._swap_video is not None:
+            self._drop_video(self._swap_video)
+        self._swap_video = self._start_video_loader(self.video_path, self.thread.backend)
+
+    def _finish_video_swap(self, video: VideoThread):
+        self._swap_video = None
+        if not video.preload_ok or not self.thread or video.path != self.video_path:
+            video.discard()
+            return
+        self._retire_video_thread(self.thread)
+        self.thread = video
+        self.is_playing = False
+        self.btn_play.setText("Play")
+        self._start_video_thread(self.current_frame)
+        self._update_proxy_state()
+
+    def _update_proxy_state(self):
+        """Queue a proxy build for the shown video when it needs one, and show the proxy status."""
+        path = self.video_path
+        text, tip = "", ""
+        if not path or not self.thread or not self.chk_proxy.isChecked():
+            pass
+        elif self.thread.proxy_path:
+            decoder = self.thread.decoder
+            size = f" ({decoder.width}x{decoder.height})" if decoder else ""
+            text, tip = f"Proxy: in use{size}", self.thread.proxy_path
+        elif self._swap_video is not None:
+            text = "Proxy: switching..."
+        elif self.proxy_thread is not None and self.proxy_thread.path == path:
+            text = "Proxy: building..."
+        elif path in self._proxy_queue:
+            text = "Proxy: queued"
+        elif _proxy_recommended(path, {"width": self.video_width, "height": self.video_height, "fps": self.fps,
+                                       "codec": self.video_codec, "duration": self.total_frames / self.fps}):
+            self._queue_proxy(path)
+            text = "Proxy: building..." if self.proxy_thread is not None and self.proxy_thread.path == path \
+                else "Proxy: queued"
+        self.lbl_proxy.setText(text)
+        self.lbl_proxy.setToolTip(tip)
+
+    def _queue_proxy(self, path: str):
+        if path in self._proxy_queue or (self.proxy_thread is not None and self.proxy_thread.path == path):
+            return
+        # 지금 보고 있는 영상이 먼저 만들어지도록 앞에 넣는다
+        self._proxy_queue.insert(0, path)
+        self._start_next_proxy()
+
+    def _start_next_proxy(self):
+        if self.proxy_thread is not None or not self._proxy_queue or self._closing:
+            return
+        ffmpeg = self._find_ffmpeg()
+        if not ffmpeg:
+            self._proxy_queue.clear()
+            self.lbl_proxy.setText("Proxy: ffmpeg not found")
+            return
+        thread = ProxyBuildThread(self._proxy_cache, ffmpeg, self._proxy_queue.pop(0))
+        thread.progressChanged.connect(self._on_proxy_progress)
+        thread.built.connect(self._on_proxy_built)
+        thread.finished.connect(self._on_proxy_thread_finished)
+        self.proxy_thread = thread
+        thread.start()
+
+    def _on_proxy_progress(self, path: str, pct: int):
+        if path == self.video_path and self.chk_proxy.isChecked() and self.thread and not self.thread.proxy_path:
+            self.lbl_proxy.setText(f"Proxy: building {pct}%")
+
+    def _on_proxy_built(self, path: str, proxy_path: str, err: str):
+        if path != self.video_path or not self.chk_proxy.isChecked():
+            return
+        if proxy_path:
+            self.lbl_proxy.setText("Proxy: ready")
+            self._switch_video_source()
+        else:
+            self.lbl_proxy.setText("Proxy: failed")
+            self.lbl_proxy.setToolTip(err[-2000:])
+
+    def _on_proxy_thread_finished(self):
+        thread = self.sender()
+        if thread is not None and thread is self.proxy_thread:
+            self.proxy_thread = None
+            self._start_next_proxy()
+        if thread is not None:
+            thread.deleteLater()
+
+    def on_proxy_toggled(self, checked: bool):
+        for video in self._preloaded_videos.values():
+            self._drop_video(video)
+        self._preloaded_videos.clear()
+        if not checked:
+            self._proxy_queue.clear()
+            if self.proxy_thread is not None:
+                self.proxy_thread.stop()
+        if self.thread:
+            wanted = self._proxy_cache.ready_path(self.video_path) if checked else None
+            if wanted != self.thread.proxy_path:
+                self._switch_video_source()
+            if not wanted:
+                self._update_proxy_state()
+            else:
+                self.lbl_proxy.setText("Proxy: switching...")
+            self._preload_next_video()
 
     # --------------------------- playback handlers ---------------------------
-    @pyqtSlot(QImage, int)
-    def on_frame(self, qimg: QImage, idx: int):
+    @pyqtSlot(object, int)
+    def on_frame(self, frame, idx: int):
+        if self.sender() is not self.thread:
+            return  # queued from a player that was replaced
         if self.slider.isSliderDown():
-            self.video_preview.set_frame(qimg)
+            self.video_preview.set_frame(frame)
             return
         self.current_frame = idx
         self.slider.blockSignals(True)
         self.slider.setValue(idx)
         self.slider.blockSignals(False)
-        self.video_preview.set_frame(qimg)
+        self.video_preview.set_frame(frame)
         self.update_labels()
 
     def resizeEvent(self, e):
         self.video_preview.update()
         super().resizeEvent(e)
 
+    def _apply_preview_size(self):
+        # Debounced: re-render the preview at the new size once resizing settles.
+        if not self.thread:
+            return
+        self.thread.set_display_size(*self.video_preview.display_pixel_size())
+        if not self.is_playing:
+            self.thread.seek(self.current_frame)
+
+    def _display_refresh_hz(self) -> float:
+        handle = self.windowHandle()
+        screen = handle.screen() if handle is not None else None
+        screen = screen or QApplication.primaryScreen()
+        return float(screen.refreshRate()) if screen is not None else 60.0
+
+    def _on_playback_stats(self, dropped: int, late: int):
+        self.lbl_playback_stats.setText(f"Dropped: {dropped}  Late: {late}")
+
+    def on_decoder_changed(self, _index: int):
+        if self.thread:
+            self._set_export_status(f"Decoder: {self.combo_decoder.currentText()} (applies to the next loaded video)",
+                                    auto_clear_ms=4000)
+
     def on_video_finished(self):
+        if self.sender() is not self.thread:
+            return
         self.is_playing = False
         self.btn_play.setText("Play")
 
@@ -1701,8 +3452,10 @@ class Cutter(QMainWindow):
             self.thread.set_speed(float(s))
 
     def on_slider_pressed(self):
+        self.thumb_popup.hide()
         if not self.thread: return
         self.scrub_was_playing = self.is_playing
+        self.thread.set_scrubbing(True)
         if self.is_playing:
             self.thread.pause()
             self.is_playing = False
@@ -1712,10 +3465,106 @@ class Cutter(QMainWindow):
         if not self.thread: return
         self.current_frame = int(pos)
         self.update_labels()
+        if self._show_scrub_thumbnail(int(pos)):
+            return
         self.thread.seek(int(pos))
 
+    # ------------------------------ thumbnails ------------------------------
+    def _show_scrub_thumbnail(self, frame_idx: int) -> bool:
+        """Show the stored thumbnail at or before ``frame_idx``; False when the store has none yet."""
+        hit = self._thumbs.frame_at(frame_idx) if self._thumbs is not None else None
+        if hit is None:
+            return False
+        self.video_preview.set_frame(_thumbnail_qimage(hit[1], self._thumb_eq, self._current_adjustments()))
+        return True
+
+    def _on_timeline_hover(self, frame_idx: int, global_pos):
+        hit = self._thumbs.frame_at(frame_idx, nearest=True) if self._thumbs is not None and self.thread else None
+        if hit is None:
+            self.thumb_popup.hide()
+            return
+        image = _thumbnail_qimage(hit[1], self._thumb_eq, self._current_adjustments())
+        seconds = frame_idx / self.fps if self.fps else 0.0
+        self.thumb_popup.show_at(image, f"{frame_idx}  ({self.fmt_time(seconds)})", global_pos)
+
+    def _jump_to_frame(self, frame_idx: int):
+        if not self.thread: return
+        self.thread.pause(); self.is_playing = False; self.btn_play.setText("Play")
+        self.current_frame = max(0, min(int(frame_idx), max(0, self.total_frames-1)))
+        self.update_labels()
+        self.thread.seek(self.current_frame)
+
+    def _set_thumbnail_store(self, store: Optional[ThumbnailStore]):
+        self._thumbs = store
+        self.thumb_popup.hide()
+        self.filmstrip.set_adjustments(*self._current_adjustments())
+        self.filmstrip.set_store(store, self.total_frames)
+        self.filmstrip.setVisible(store is not None)
+
+    def _update_thumbnail_store(self, *_):
+        """Open the thumbnail store of the shown video and keep building it while the option is on."""
+        if self._closing:
+            return
+        if not self.chk_thumbs.isChecked() or not self.thread:
+            self._stop_thumbnail_build()
+            self._set_thumbnail_store(None)
+            self.chk_thumbs.setText("Thumbnails")
+            return
+        if self._thumbs is None:
+            try:
+                self._set_thumbnail_store(
+                    ThumbnailStore(self.video_path, self.total_frames, self.video_width, self.video_height))
+            except (OSError, ValueError) as e:
+                self.chk_thumbs.setText("Thumbnails (unavailable)")
+                self.chk_thumbs.setToolTip(str(e))
+                return
+        if self._thumbs.complete:
+            self.chk_thumbs.setText("Thumbnails")
+            return
+        if self.thumb_thread is not None:
+            return
+        ffmpeg = self._find_ffmpeg()
+        if not ffmpeg:
+            self.chk_thumbs.setText("Thumbnails (ffmpeg not found)")
+            return
+        # 프록시가 있으면 같은 프레임을 훨씬 싸게 디코딩할 수 있다
+        thread = ThumbnailBuildThread(self._thumbs, ffmpeg, self.thread.proxy_path or self.video_path, self.fps)
+        thread.keyframesReady.connect(self.filmstrip.refresh)
+        thread.progressChanged.connect(self._on_thumbnail_progress)
+        thread.failed.connect(self._on_thumbnail_failed)
+        thread.finished.connect(self._on_thumbnail_thread_finished)
+        self.thumb_thread = thread
+        self._on_thumbnail_progress(int(self._thumbs.fraction * 100))
+        thread.start(QThread.LowPriority)   # 재생/탐색용 디코더보다 뒤로 양보한다
+
+    def _stop_thumbnail_build(self):
+        if self.thumb_thread is not None and not self.thumb_thread._stop:
+            self.thumb_thread.stop()
+            self.thumb_thread.keyframesReady.disconnect()
+            self.thumb_thread.progressChanged.disconnect()
+            self.thumb_thread.failed.disconnect()
+
+    def _on_thumbnail_progress(self, pct: int):
+        self.chk_thumbs.setText(f"Thumbnails ({pct}%)" if pct < 100 else "Thumbnails")
+        self.filmstrip.refresh()
+
+    def _on_thumbnail_failed(self, err: str):
+        self.chk_thumbs.setText("Thumbnails (failed)")
+        self.chk_thumbs.setToolTip(err[-2000:])
+
+    def _on_thumbnail_thread_finished(self):
+        thread = self.sender()
+        if thread is not None and thread is self.thumb_thread:
+            self.thumb_thread = None
+            if thread.store is not self._thumbs:
+                # 다른 영상으로 넘어가며 멈춘 빌드: 지금 영상의 저장소를 이어서 만든다
+                self._update_thumbnail_store()
+        if thread is not None:
+            thread.deleteLater()
+
     def on_slider_released(self):
         if not self.thread: return
+        self.thread.set_scrubbing(False)
         self.current_frame = int(self.slider.value())
         self.update_labels()
         self.thread.seek(int(self.slider.value()))
@@ -1727,6 +3576,9 @@ class Cutter(QMainWindow):
 
     # ---------------------------- keyboard nav ----------------------------
     def keyPressEvent(self, ev):
+        if ev.key() in (Qt.Key_PageDown, Qt.Key_PageUp) and self.list_videos.count() > 0:
+            self._load_adjacent_video(1 if ev.key() == Qt.Key_PageDown else -1)
+            return
         if not self.thread:
             return super().keyPressEvent(ev)
         key = ev.key()
@@ -1735,10 +3587,10 @@ class Cutter(QMainWindow):
         if key == Qt.Key_Right:
             # step +1
             self.thread.pause(); self.is_playing = False; self.btn_play.setText("Play")
-            self.thread.seek(min(self.current_frame + 1, max(0, self.total_frames-1))); return
+            self.thread.step(1); return
         if key == Qt.Key_Left:
             self.thread.pause(); self.is_playing = False; self.btn_play.setText("Play")
-            self.thread.seek(max(self.current_frame - 1, 0)); return
+            self.thread.step(-1); return
         return super().keyPressEvent(ev)
 
     # ------------------------------ bookmarks ------------------------------
@@ -1751,10 +3603,12 @@ class Cutter(QMainWindow):
     def current_bm_frame(self) -> Optional[int]:
         it = self.bm_list.currentItem()
         if not it: return None
+        return self._parse_bm_frame(it.text())
+
+    def _parse_bm_frame(self, s: str) -> Optional[int]:
         # parse "Frame X  (..)"
         try:
             prefix = "Frame "
-            s = it.text()
             pos = s.find(prefix)
             if pos >= 0:
                 rest = s[pos+len(prefix):].strip().split()[0]
@@ -1763,6 +3617,10 @@ class Cutter(QMainWindow):
             return None
         return None
 
+    def bookmark_frames(self) -> List[int]:
+        frames = (self._parse_bm_frame(self.bm_list.item(i).text()) for i in range(self.bm_list.count()))
+        return sorted(f for f in frames if f is not None)
+
     def goto_bookmark(self):
         f = self.current_bm_frame()
         if f is None: return
@@ -1836,90 +3694,33 @@ class Cutter(QMainWindow):
         self._on_cut_param_changed()
 
     # ------------------------------- cutter -------------------------------
+    def _export_settings(self) -> ExportSettings:
+        """Current widget state as an ExportSettings for the vidcut_core builders."""
+        if self.rad_accurate.isChecked():
+            mode = "accurate"
+        else:
+            mode = "smart" if self.rad_smart.isChecked() else "fast"
+        contrast, brightness, saturation = self._current_adjustments()
+        return ExportSettings(
+            mode=mode,
+            range_state=getattr(self, "_param_state", 0),
+            start_frame=self.ed_start.text(),
+            end_frame=self.ed_end.text(),
+            duration=float(self.ed_dur.value()),
+            duration_unit=self.unit_dur.currentText(),
+            crop_rect=self.crop_norm_rect if self._crop_active() else None,
+            crop_size=self._requested_fixed_crop_size(),
+            contrast=contrast,
+            brightness=brightness,
+            saturation=saturation,
+            prefix=self.ed_prefix.text(),
+            suffix=self.ed_suffix.text(),
+            out_dir=self.export_folder_override,
+        )
+
     def _resolve_cut_params_for_video(self, fps: float, total_frames: int):
         """Return ({start_sec, dur_sec, duration_truncated}, None) or (None, error_text)."""
-        state = getattr(self, "_param_state", 0)  # 0=off, 1=S+D, 2=D+E, 3=S+E
-        have_s = state in (1, 3)
-        have_d = state in (1, 2)
-        have_e = state in (2, 3)
-        if fps <= 1e-6 or total_frames <= 0:
-            return None, "Video duration is not available."
-        total_sec = total_frames / fps
-        if total_sec <= 0:
-            return None, "Video duration is not available."
-        if state == 0:
-            return {
-                "start_sec": 0.0,
-                "dur_sec": total_sec,
-                "requested_dur_sec": total_sec,
-                "duration_truncated": False,
-            }, None
-
-        # read inputs
-        try:
-            sf = int(self.ed_start.text()) if (self.ed_start.text() and have_s) else None
-            ef = int(self.ed_end.text()) if (self.ed_end.text() and have_e) else None
-        except ValueError:
-            return None, "Start/End must be valid frame numbers."
-
-        requested_dur_sec = None
-        if have_d:
-            requested_dur_sec = self._duration_input_seconds_for_fps(fps)
-            if requested_dur_sec is None:
-                return None, "FPS information is missing for frame-based duration."
-            if requested_dur_sec <= 0:
-                return None, "Duration must be larger than 0."
-
-        # compute missing
-        try:
-            if have_s and have_e:
-                if sf is None or ef is None:
-                    return None, "Start/End must be provided."
-                if ef <= sf:
-                    return None, "End must be larger than Start."
-                start_sec = max(0.0, min(sf / fps, total_sec))
-                end_sec = max(0.0, min(ef / fps, total_sec))
-                dur_sec = end_sec - start_sec
-                if dur_sec <= 0:
-                    return None, "Invalid range after clamp."
-                return {
-                    "start_sec": start_sec,
-                    "dur_sec": dur_sec,
-                    "requested_dur_sec": dur_sec,
-                    "duration_truncated": False,
-                }, None
-            elif have_s and have_d:
-                if sf is None or requested_dur_sec is None:
-                    return None, "Start/Duration must be provided."
-                start_sec = max(0.0, min(sf / fps, total_sec))
-                available = max(0.0, total_sec - start_sec)
-                dur_sec = min(requested_dur_sec, available)
-                if dur_sec <= 0:
-                    return None, "Requested range starts at or beyond the video end."
-                return {
-                    "start_sec": start_sec,
-                    "dur_sec": dur_sec,
-                    "requested_dur_sec": requested_dur_sec,
-                    "duration_truncated": requested_dur_sec - dur_sec > 1e-6,
-                }, None
-            elif have_d and have_e:
-                if requested_dur_sec is None or ef is None:
-                    return None, "Duration/End must be provided."
-                end_sec = max(0.0, min(ef / fps, total_sec))
-                start_sec = max(0.0, end_sec - requested_dur_sec)
-                dur_sec = end_sec - start_sec
-                if dur_sec <= 0:
-                    return None, "Requested range ends at or before the video start."
-                return {
-                    "start_sec": start_sec,
-                    "dur_sec": dur_sec,
-                    "requested_dur_sec": requested_dur_sec,
-                    "duration_truncated": requested_dur_sec - dur_sec > 1e-6,
-                }, None
-            else:
-                return None, "Exactly two parameters must be selected."
-        except Exception as e:
-            return None, f"Invalid input: {e}"
+        return _resolve_cut_range(self._export_settings(), fps, total_frames)
 
     def _resolve_cut_params(self):
         return self._resolve_cut_params_for_video(self.fps, self.total_frames)
@@ -1932,92 +3733,22 @@ class Cutter(QMainWindow):
         2) PATH에서 ffmpeg 검색
         찾지 못하면 빈 문자열 반환
         """
-        try:
-            base = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else os.path.dirname(__file__)
-            cand = os.path.join(base, "ffmpeg.exe" if os.name == "nt" else "ffmpeg")
-            if os.path.isfile(cand):
-                return cand
-        except Exception:
-            pass
-        found = shutil.which("ffmpeg")
-        return found or ""
+        return _find_ffmpeg_tool("ffmpeg")
 
     def _is_export_running(self) -> bool:
         return bool(
             (self.export_thread and self.export_thread.isRunning())
             or (self.batch_export_thread and self.batch_export_thread.isRunning())
+            or (self.export_probe_thread and self.export_probe_thread.isRunning())
         )
 
     def _make_output_path(self, video_path: str) -> str:
-        folder = self._effective_export_folder(video_path) or os.path.dirname(video_path)
-        base, ext = os.path.splitext(os.path.basename(video_path))
-        prefix = self.ed_prefix.text().strip().strip("_")
-        suffix = self.ed_suffix.text().strip().strip("_")
-        prefix_part = f"{prefix}_" if prefix else ""
-        suffix_part = f"_{suffix}" if suffix else ""
-        out_name = f"{prefix_part}{base}{suffix_part}{ext}"
-        return os.path.join(folder, out_name)
-
-    def _build_export_command(self, ffmpeg: str, video_path: str, out_path: str, start_sec: float, dur_sec: float, video_width: int, video_height: int):
-        adjustments_active = self._adjustments_active()
-        crop_filter, _ = self._crop_filter_for_size(video_width, video_height)
-        vf_parts = []
-        if crop_filter:
-            vf_parts.append(crop_filter)
-        if adjustments_active:
-            vf_parts.append(self._ffmpeg_eq_filter())
-        filters_active = bool(vf_parts)
-        progress_args = ["-progress", "pipe:2", "-nostats"]
-
-        fast_cmd = [
-            ffmpeg,
-            "-y",
-            "-ss", f"{start_sec:.6f}",
-            "-i", video_path,
-            "-t", f"{dur_sec:.6f}",
-            "-c", "copy",
-            *progress_args,
-            out_path
-        ]
-
-        accurate_cmd = [
-            ffmpeg,
-            "-y",
-            "-ss", f"{start_sec:.6f}",
-            "-i", video_path,
-            "-t", f"{dur_sec:.6f}",
-        ]
-        if filters_active:
-            accurate_cmd.extend(["-vf", ",".join(vf_parts)])
-        accurate_cmd.extend([
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "18",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-movflags", "+faststart",
-            *progress_args,
-            out_path
-        ])
-
-        mode = "accurate" if self.rad_accurate.isChecked() else "fast"
-        if filters_active and mode.startswith("fast"):
-            mode = "accurate"
-        return (accurate_cmd if mode.startswith("accurate") else fast_cmd), mode
+        return _output_path(self._export_settings(), video_path, self.video_folder)
 
-    def _read_video_meta(self, video_path: str):
-        cap = cv2.VideoCapture(video_path)
-        if not cap or not cap.isOpened():
-            return None
-        try:
-            fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
-            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or 0
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 0
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 0
-            fps = float(fps) if fps > 1e-3 else 30.0
-            return fps, total, width, height
-        finally:
-            cap.release()
+    def _build_export_command(self, ffmpeg: str, video_path: str, out_path: str, start_sec: float, dur_sec: float, video_width: int, video_height: int,
+                              x264_threads: int = 0):
+        return _build_cut_command(self._export_settings(), ffmpeg, video_path, out_path, start_sec, dur_sec,
+                                  video_width, video_height, x264_threads)
 
     def _set_progress_context(self, text: str):
         if text:
@@ -2030,15 +3761,32 @@ class Cutter(QMainWindow):
     def _set_export_running(self, running: bool):
         self.btn_cut.setEnabled((self.video_path is not None) and (not running))
         self.btn_cut_multi.setEnabled((self.video_path is not None) and (not running))
+        self.btn_cut_clips.setEnabled((self.video_path is not None) and (not running))
         self.status_progress.setVisible(running)
         if not running:
             self.status_progress.setValue(0)
             self._set_progress_context("")
+            self.status_progress_rate.setText("")
+            self.status_progress_rate.setVisible(False)
 
     def _on_export_progress(self, pct: int):
         self.status_progress.setVisible(True)
         self.status_progress.setValue(max(0, min(100, int(pct))))
 
+    def _on_export_stats(self, totals: dict):
+        parts = []
+        if totals.get("speed"):
+            parts.append(f"{totals['speed']:.2f}x")
+        if totals.get("fps"):
+            parts.append(f"{totals['fps']:.0f} fps")
+        if totals.get("total_size"):
+            parts.append(f"{totals['total_size'] / (1024 * 1024):.1f} MB")
+        self.status_progress_rate.setText("  ".join(parts))
+        self.status_progress_rate.setVisible(bool(parts))
+        self.status_progress_rate.setToolTip(
+            f"{totals.get('processes', 0)} ffmpeg process(es), {totals.get('bitrate_kbps') or 0:.0f} kbit/s"
+        )
+
     def _on_export_finished(self, out_path: str):
         if self._closing:
             return
@@ -2073,18 +3821,20 @@ class Cutter(QMainWindow):
         thread = self.sender()
         if thread is self.export_thread:
             self.export_thread = None
+            self._refresh_exported()
             QTimer.singleShot(0, self._finalize_export_thread_state)
         if thread is not None:
             thread.deleteLater()
 
-    def _start_export_thread(self, cmd: List[str], out_path: str, dur_sec: float):
+    def _start_export_thread(self, cmd: List[str], out_path: str, dur_sec: float, plan: Optional[dict] = None):
         self._set_export_running(True)
         self.status_progress.setValue(0)
         self._set_export_status("Processing video...")
         self._set_progress_context(f"1/1  {os.path.basename(self.video_path or out_path)}")
         self._export_result_received = False
-        self.export_thread = ExportThread(cmd, out_path, dur_sec)
+        self.export_thread = ExportThread(cmd, out_path, dur_sec, plan)
         self.export_thread.progressChanged.connect(self._on_export_progress)
+        self.export_thread.statsChanged.connect(self._on_export_stats)
         self.export_thread.finishedOk.connect(self._on_export_finished)
         self.export_thread.failed.connect(self._on_export_failed)
         self.export_thread.finished.connect(self._on_export_thread_finished)
@@ -2093,11 +3843,18 @@ class Cutter(QMainWindow):
     def _on_batch_item_changed(self, idx: int, total: int, label: str):
         self._set_progress_context(f"{idx}/{total}  {label}")
 
+    def _close_manifest_results(self):
+        results, self._manifest_results = self._manifest_results, None
+        if results is not None:
+            results.close()
+
     def _on_batch_done(self, summary: str, has_errors: bool):
         if self._closing:
             return
         self._set_export_running(False)
         self._batch_result_received = True
+        if self._manifest_results is not None:
+            summary += ("\n\n" if has_errors else " ") + f"Results: {self._manifest_results.path}"
         if has_errors:
             QMessageBox.warning(self, "Batch export", summary[-8000:])
             self._set_export_status("Batch export completed with errors.", auto_clear_ms=8000)
@@ -2123,18 +3880,26 @@ class Cutter(QMainWindow):
         thread = self.sender()
         if thread is self.batch_export_thread:
             self.batch_export_thread = None
+            self._close_manifest_results()
+            self._refresh_exported()
             QTimer.singleShot(0, self._finalize_batch_thread_state)
         if thread is not None:
             thread.deleteLater()
 
-    def _start_batch_export_thread(self, tasks: List[dict]):
+    def _start_batch_export_thread(self, tasks: List[dict], workers: int = 1,
+                                   results: Optional[ManifestResults] = None):
         self._set_export_running(True)
         self.status_progress.setValue(0)
-        self._set_export_status("Processing selected videos...")
+        if workers > 1:
+            self._set_export_status(f"Processing selected videos ({workers} at a time)...")
+        else:
+            self._set_export_status("Processing selected videos...")
         self._batch_result_received = False
-        self.batch_export_thread = BatchExportThread(tasks)
+        self._manifest_results = results
+        self.batch_export_thread = BatchExportThread(tasks, workers, results.on_result if results else None)
         self.batch_export_thread.itemChanged.connect(self._on_batch_item_changed)
         self.batch_export_thread.progressChanged.connect(self._on_export_progress)
+        self.batch_export_thread.statsChanged.connect(self._on_export_stats)
         self.batch_export_thread.done.connect(self._on_batch_done)
         self.batch_export_thread.finished.connect(self._on_batch_thread_finished)
         self.batch_export_thread.start()
@@ -2143,7 +3908,7 @@ class Cutter(QMainWindow):
         if self._is_export_running():
             QMessageBox.information(self, "Export in progress", "Another export is already running.")
             return
-        if self.list_videos.count() <= 0:
+        if self.video_model.rowCount() <= 0:
             QMessageBox.information(self, "Save Videos", "No videos in list.")
             return
 
@@ -2153,23 +3918,51 @@ class Cutter(QMainWindow):
         v = QVBoxLayout(dlg)
         v.addWidget(QLabel("Select videos to export (Shift/Ctrl multi-select, Ctrl+A select all)."))
 
-        lw = QListWidget(dlg)
-        lw.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        for i in range(self.list_videos.count()):
-            lw.addItem(self.list_videos.item(i).text())
+        # 메인 목록과 같은 모델을 쓰고, 필터만 대화상자마다 따로 둔다
+        ed_filter = QLineEdit(dlg)
+        ed_filter.setPlaceholderText("Filter, e.g. under:subject_12 1080p unexported")
+        ed_filter.setToolTip(VIDEO_QUERY_HELP)
+        ed_filter.setClearButtonEnabled(True)
+        lw = VideoListView(self.video_model, dlg, multi_select=True)
+        ed_filter.textChanged.connect(lw.proxy.set_filter_text)
+        v.addWidget(ed_filter)
         v.addWidget(lw)
 
         QShortcut(QKeySequence.SelectAll, lw, activated=lw.selectAll)
 
+        workers_row = QHBoxLayout()
+        workers_row.addWidget(QLabel("Parallel jobs:"))
+        spn_workers = QSpinBox(dlg)
+        spn_workers.setRange(0, max(1, os.cpu_count() or 1))
+        spn_workers.setSpecialValueText("Auto")
+        spn_workers.setValue(BATCH_EXPORT_WORKERS)
+        spn_workers.setToolTip("Number of ffmpeg processes to run at once.\n"
+                               "Auto: a few for stream copy, about one per 4 CPU threads for re-encoding.")
+        workers_row.addWidget(spn_workers)
+        workers_row.addStretch(1)
+        v.addLayout(workers_row)
+
         box = QDialogButtonBox(dlg)
         run_btn = box.addButton("Run", QDialogButtonBox.AcceptRole)
+        manifest_btn = box.addButton("Manifest...", QDialogButtonBox.ActionRole)
+        manifest_btn.setToolTip("Export the rows of a CSV/JSON manifest, each with its own file and cut settings.\n"
+                                "Missing columns fall back to the current settings.")
         box.addButton("Cancel", QDialogButtonBox.RejectRole)
         v.addWidget(box)
 
         selected_names: List[str] = []
+        manifest_path: List[str] = []
+
+        def on_manifest():
+            path, _ = QFileDialog.getOpenFileName(
+                dlg, "Open manifest", self.video_folder or "", "Manifest (*.csv *.json);;All files (*)")
+            if not path:
+                return
+            manifest_path[:] = [path]
+            dlg.accept()
 
         def on_run():
-            names = [it.text() for it in lw.selectedItems()]
+            names = lw.selected_names()
             if not names:
                 QMessageBox.information(dlg, "Save Videos", "Select at least one video.")
                 return
@@ -2178,15 +3971,148 @@ class Cutter(QMainWindow):
             dlg.accept()
 
         run_btn.clicked.connect(on_run)
+        manifest_btn.clicked.connect(on_manifest)
         box.rejected.connect(dlg.reject)
 
         if dlg.exec_() != QDialog.Accepted:
             return
+        if manifest_path:
+            self.cut_manifest_batch(manifest_path[0], spn_workers.value())
+            return
         if not selected_names:
             return
-        self.cut_videos_batch(selected_names)
+        self.cut_videos_batch(selected_names, spn_workers.value())
+
+    def open_multi_range_dialog(self):
+        if self._is_export_running():
+            QMessageBox.information(self, "Export in progress", "Another export is already running.")
+            return
+        if not self.video_path or self.total_frames <= 0:
+            QMessageBox.information(self, "Save Clips", "No video loaded.")
+            return
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Save Clips")
+        dlg.setMinimumSize(420, 380)
+        v = QVBoxLayout(dlg)
+        v.addWidget(QLabel("Ranges to export in one pass (frames, end is exclusive)."))
+
+        table = QTableWidget(0, 2, dlg)
+        table.setHorizontalHeaderLabels(["Start frame", "End frame"])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        v.addWidget(table)
+
+        def add_row(start: int = 0, end: int = 0):
+            row = table.rowCount()
+            table.insertRow(row)
+            table.setItem(row, 0, QTableWidgetItem(str(start)))
+            table.setItem(row, 1, QTableWidgetItem(str(end)))
+
+        def fill_from_bookmarks():
+            frames = self.bookmark_frames()
+            if len(frames) < 2:
+                QMessageBox.information(dlg, "Save Clips", "Add at least two bookmarks: each pair (1-2, 3-4, ...) is a range.")
+                return
+            table.setRowCount(0)
+            for i in range(0, len(frames) - 1, 2):
+                add_row(frames[i], frames[i + 1])
+
+        row_btns = QHBoxLayout()
+        btn_bm = QPushButton("From bookmarks"); btn_bm.clicked.connect(fill_from_bookmarks)
+        btn_add = QPushButton("Add"); btn_add.clicked.connect(lambda: add_row(self.current_frame, self.current_frame + 1))
+        btn_del = QPushButton("Delete"); btn_del.clicked.connect(lambda: table.removeRow(table.currentRow()))
+        for b in (btn_bm, btn_add, btn_del):
+            row_btns.addWidget(b)
+        row_btns.addStretch(1)
+        v.addLayout(row_btns)
+
+        box = QDialogButtonBox(dlg)
+        run_btn = box.addButton("Run", QDialogButtonBox.AcceptRole)
+        box.addButton("Cancel", QDialogButtonBox.RejectRole)
+        v.addWidget(box)
+
+        frames = self.bookmark_frames()
+        for i in range(0, len(frames) - 1, 2):
+            add_row(frames[i], frames[i + 1])
+
+        ranges: List[tuple] = []
+
+        def on_run():
+            parsed = []
+            for row in range(table.rowCount()):
+                try:
+                    sf = int((table.item(row, 0) or QTableWidgetItem("")).text())
+                    ef = int((table.item(row, 1) or QTableWidgetItem("")).text())
+                except ValueError:
+                    QMessageBox.warning(dlg, "Save Clips", f"Row {row + 1}: Start/End must be valid frame numbers.")
+                    return
+                ef = min(ef, self.total_frames)
+                if sf < 0 or ef <= sf:
+                    QMessageBox.warning(dlg, "Save Clips", f"Row {row + 1}: End must be larger than Start.")
+                    return
+                parsed.append((sf, ef))
+            if not parsed:
+                QMessageBox.information(dlg, "Save Clips", "Add at least one range.")
+                return
+            ranges.clear()
+            ranges.extend(parsed)
+            dlg.accept()
+
+        run_btn.clicked.connect(on_run)
+        box.rejected.connect(dlg.reject)
+
+        if dlg.exec_() != QDialog.Accepted or not ranges:
+            return
+        self.cut_video_ranges(ranges)
+
+    def cut_video_ranges(self, frame_ranges: List[tuple]):
+        if self._is_export_running():
+            self._set_export_status("Another export is already running.")
+            return
+        ffmpeg = self._find_ffmpeg()
+        if not ffmpeg:
+            QMessageBox.warning(
+                self, "ffmpeg not found",
+                "ffmpeg is required to cut videos.\n\n"
+                "If you ran it as an exe file: Check if the ffmpeg.exe file exists.\n\n"
+                "If you ran it as a python file: Add ffmpeg to your system PATH."
+            )
+            return
+        if self._crop_active():
+            _, crop_err = self._crop_filter_for_size(self.video_width, self.video_height)
+            if crop_err:
+                QMessageBox.warning(self, 'Invalid crop', crop_err)
+                return
 
-    def cut_videos_batch(self, selected_names: List[str]):
+        base, ext = os.path.splitext(self._make_output_path(self.video_path))
+        width = max(2, len(str(len(frame_ranges))))
+        out_paths = [f"{base}_{i:0{width}d}{ext}" for i in range(1, len(frame_ranges) + 1)]
+        existing = [p for p in out_paths if os.path.exists(p)]
+        if existing:
+            r = QMessageBox.question(
+                self, "Overwrite files?",
+                f"{len(existing)} output file(s) already exist.\n\nOverwrite all?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if r != QMessageBox.Yes:
+                self._set_export_status("Export canceled (file exists).", auto_clear_ms=6000)
+                return
+
+        ranges = [(sf / self.fps, ef / self.fps) for sf, ef in frame_ranges]
+        packet_index = self.thread.source_index if self.thread else None
+        cmd, mode, pass_sec = _build_multi_range_command(
+            self._export_settings(), ffmpeg, self.video_path, ranges, out_paths,
+            self.video_width, self.video_height, self.fps, packet_index,
+        )
+        self._start_export_thread(cmd, os.path.dirname(out_paths[0]), pass_sec, {
+            "progress_frames": max(1, int(round(pass_sec * self.fps))),
+            "input_path": self.video_path,
+            "out_paths": list(out_paths),
+            "profile": _export_profile(f"clips-{mode}", self.video_codec, self.video_width, self.video_height, self.fps),
+        })
+        self._set_progress_context(f"{len(out_paths)} clips  {os.path.basename(self.video_path)}")
+
+    def cut_videos_batch(self, selected_names: List[str], workers: int = BATCH_EXPORT_WORKERS):
         if self._is_export_running():
             self._set_export_status("Another export is already running.")
             return
@@ -2199,7 +4125,42 @@ class Cutter(QMainWindow):
                 "If you ran it as a python file: Add ffmpeg to your system PATH."
             )
             return
+        paths = [os.path.join(self.video_folder, name) for name in selected_names]
+        self._probe_before_export(
+            paths, lambda metas: self._prepare_batch_export(selected_names, workers, ffmpeg, metas))
+
+    def _probe_before_export(self, paths: List[str], on_ready):
+        """Read metadata of ``paths`` on a MetaProbeThread, then call ``on_ready(metas)`` on the GUI thread."""
+        self._set_export_running(True)
+        self.status_progress.setValue(0)
+        self._set_export_status("Reading video metadata...")
+        thread = MetaProbeThread(paths)
+
+        def on_progress(done: int, total: int):
+            self.status_progress.setValue(int(done * 100 / max(1, total)))
+            self._set_export_status(f"Reading video metadata {done}/{total}...")
+
+        def on_done(metas: dict):
+            if self._closing:
+                return
+            self._set_export_running(False)
+            self._set_export_status("")
+            on_ready(metas)
 
+        thread.progressChanged.connect(on_progress)
+        thread.done.connect(on_done)
+        thread.finished.connect(self._on_export_probe_finished)
+        self.export_probe_thread = thread
+        thread.start()
+
+    def _on_export_probe_finished(self):
+        thread = self.sender()
+        if thread is self.export_probe_thread:
+            self.export_probe_thread = None
+        if thread is not None:
+            thread.deleteLater()
+
+    def _prepare_batch_export(self, selected_names: List[str], workers: int, ffmpeg: str, metas: dict):
         tasks: List[dict] = []
         prepared_items: List[dict] = []
         prep_errors: List[str] = []
@@ -2211,11 +4172,11 @@ class Cutter(QMainWindow):
             if not os.path.isfile(video_path):
                 prep_errors.append(f"{name}: file not found.")
                 continue
-            meta = self._read_video_meta(video_path)
+            meta = _meta_tuple(metas.get(video_path))
             if not meta:
                 prep_errors.append(f"{name}: failed to read video metadata.")
                 continue
-            fps, total_frames, video_width, video_height = meta
+            fps, total_frames, video_width, video_height, codec = meta
             res, err = self._resolve_cut_params_for_video(fps, total_frames)
             if err:
                 prep_errors.append(f"{name}: {err}")
@@ -2229,6 +4190,8 @@ class Cutter(QMainWindow):
                 "video_path": video_path,
                 "video_width": video_width,
                 "video_height": video_height,
+                "fps": fps,
+                "codec": codec,
                 "start_sec": start_sec,
                 "dur_sec": dur_sec,
                 "out_path": out_path,
@@ -2253,8 +4216,21 @@ class Cutter(QMainWindow):
                     )
                     return
 
+        # fast/accurate is the same choice for every item, so probe it once for the worker plan
+        first = prepared_items[0]
+        _, mode = self._build_export_command(
+            ffmpeg, first["video_path"], first["out_path"], first["start_sec"], first["dur_sec"],
+            first["video_width"], first["video_height"],
+        )
+        reencode_count = len(prepared_items) if mode != "fast" else 0
+        workers, x264_threads = _export_worker_plan(len(prepared_items), reencode_count, workers)
+
+        eta_total = 0.0
+        eta_measured = True
+        settings = self._export_settings()
         for item in prepared_items:
-            cmd, _ = self._build_export_command(
+            tasks.append(_export_task(
+                settings,
                 ffmpeg,
                 item["video_path"],
                 item["out_path"],
@@ -2262,13 +4238,14 @@ class Cutter(QMainWindow):
                 item["dur_sec"],
                 item["video_width"],
                 item["video_height"],
-            )
-            tasks.append({
-                "cmd": cmd,
-                "out_path": item["out_path"],
-                "duration_us": max(1, int(max(0.001, float(item["dur_sec"])) * 1_000_000.0)),
-                "label": item["label"],
-            })
+                item["fps"],
+                item["codec"],
+                x264_threads,
+            ))
+            eta, measured = self._estimate_export_walltime(
+                item["dur_sec"], mode, item["video_width"], item["video_height"], item["fps"], item["codec"])
+            eta_total += eta
+            eta_measured = eta_measured and measured
 
         if prep_errors:
             details = "\n".join(prep_errors[:8])
@@ -2293,7 +4270,79 @@ class Cutter(QMainWindow):
 
         if any_truncated:
             self._set_export_status(self.duration_warning_text)
-        self._start_batch_export_thread(tasks)
+        self._start_batch_export_thread(tasks, workers)
+        if not any_truncated:
+            basis = "measured" if eta_measured else "rough guess"
+            self._set_export_status(
+                f"Processing selected videos ({workers} at a time), estimated "
+                f"{self._fmt_eta(eta_total / max(1, workers))} ({basis})..."
+            )
+
+    def cut_manifest_batch(self, manifest_path: str, workers: int = BATCH_EXPORT_WORKERS):
+        """Export every row of a CSV/JSON manifest; columns a row leaves out use the current settings."""
+        if self._is_export_running():
+            self._set_export_status("Another export is already running.")
+            return
+        ffmpeg = self._find_ffmpeg()
+        if not ffmpeg:
+            QMessageBox.warning(
+                self, "ffmpeg not found",
+                "ffmpeg is required to cut videos.\n\n"
+                "If you ran it as an exe file: Check if the ffmpeg.exe file exists.\n\n"
+                "If you ran it as a python file: Add ffmpeg to your system PATH."
+            )
+            return
+        try:
+            rows = _load_manifest(manifest_path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Manifest", f"Cannot read {os.path.basename(manifest_path)}:\n{e}")
+            return
+        if not rows:
+            QMessageBox.information(self, "Manifest", "The manifest has no rows.")
+            return
+
+        manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+        # 메타데이터를 먼저 백그라운드에서 읽어 두면 검증은 캐시만 본다
+        self._probe_before_export(
+            [f for f in _manifest_files(rows, manifest_dir) if f],
+            lambda _metas: self._prepare_manifest_export(manifest_path, rows, workers, ffmpeg))
+
+    def _prepare_manifest_export(self, manifest_path: str, rows: List[dict], workers: int, ffmpeg: str):
+        items, invalid = _validate_manifest(
+            rows, self._export_settings(), os.path.dirname(os.path.abspath(manifest_path)), overwrite=True)
+        if not items:
+            details = "\n".join(f"row {row}: {err}" for row, _, err in invalid[:10])
+            QMessageBox.warning(self, "Manifest", f"No valid rows to process.\n\n{details}")
+            return
+        if invalid:
+            details = "\n".join(f"row {row}: {err}" for row, _, err in invalid[:8])
+            r = QMessageBox.question(
+                self, "Manifest",
+                f"{len(invalid)} row(s) cannot be processed.\n\n{details}\n\nContinue with {len(items)} valid row(s)?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
+            if r != QMessageBox.Yes:
+                self._set_export_status("Batch export canceled.", auto_clear_ms=5000)
+                return
+        existing = sum(1 for it in items if os.path.exists(it["out_path"]))
+        if existing:
+            r = QMessageBox.question(
+                self, "Overwrite files?",
+                f"{existing} output file(s) already exist.\n\nOverwrite all?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if r != QMessageBox.Yes:
+                self._set_export_status("Batch export canceled (file exists).", auto_clear_ms=5000)
+                return
+
+        tasks, workers = _manifest_tasks(items, ffmpeg, workers)
+        try:
+            results = ManifestResults(_manifest_results_path(manifest_path), tasks, invalid)
+        except OSError as e:
+            QMessageBox.warning(self, "Manifest", f"Cannot write the results file:\n{e}")
+            return
+        self._start_batch_export_thread(tasks, workers, results)
+        self._set_export_status(f"Processing {len(tasks)} manifest row(s) ({workers} at a time)...")
 
     # ------------------------------ cutting ------------------------------
     def cut_video(self):
@@ -2355,12 +4404,19 @@ class Cutter(QMainWindow):
             self.video_width,
             self.video_height,
         )
-        if mode.startswith("accurate"):
-            _, encode_time, slowdown = self._estimate_cut_walltime(dur_sec)
-            self._set_export_status(
-                f"Estimated re-encode time: {self._fmt_eta(encode_time)} (about {slowdown:.0f}x slower than fast copy)."
-            )
-        self._start_export_thread(cmd, out_path, dur_sec)
+        plan = None
+        if mode == "smart":
+            plan = {"smart": _smart_cut_spec(ffmpeg, self.video_path, start_sec, dur_sec)}
+        elif mode.startswith("accurate"):
+            self._set_export_status(self._reencode_eta_text(dur_sec))
+            chunks = self.spn_chunks.value()
+            if chunks > 1:
+                plan = {"chunked": _chunked_encode_spec(self._export_settings(), ffmpeg, self.video_path, start_sec,
+                                                        dur_sec, self.video_width, self.video_height, chunks)}
+        profile = _export_profile(self._export_mode_profile(mode), self.video_codec,
+                                  self.video_width, self.video_height, self.fps)
+        plan = dict(plan or {}, input_path=self.video_path, profile=profile)
+        self._start_export_thread(cmd, out_path, dur_sec, plan)
 
     # ------------------------------ close ------------------------------
     def _request_background_stop(self):
@@ -2368,12 +4424,25 @@ class Cutter(QMainWindow):
             self.export_thread.stop()
         if self.batch_export_thread:
             self.batch_export_thread.stop()
+        for probe in (self.export_probe_thread, self.folder_scan_thread):
+            if probe:
+                probe.stop()
         if self.thread:
             self.thread.stop()
+        for thread in self._retired_video_threads:
+            thread.stop()
+        self._proxy_queue.clear()
+        if self.proxy_thread:
+            self.proxy_thread.stop()
+        if self.thumb_thread:
+            self.thumb_thread.stop()
 
     def _background_threads_stopped(self) -> bool:
         alive = False
-        for thread in (self.export_thread, self.batch_export_thread, self.thread):
+        for thread in (self.export_thread, self.batch_export_thread, self.export_probe_thread,
+                       self.folder_scan_thread, self.proxy_thread, self.thumb_thread, self.thread,
+                       *self._video_loaders,
+                       *self._retired_video_threads):
             if thread and thread.isRunning():
                 thread.wait(50)
                 if thread.isRunning():
@@ -2382,8 +4451,21 @@ class Cutter(QMainWindow):
             self.export_thread = None
         if self.batch_export_thread and not self.batch_export_thread.isRunning():
             self.batch_export_thread = None
+            self._close_manifest_results()
+        if self.export_probe_thread and not self.export_probe_thread.isRunning():
+            self.export_probe_thread = None
+        if self.folder_scan_thread and not self.folder_scan_thread.isRunning():
+            self.folder_scan_thread = None
         if self.thread and not self.thread.isRunning():
             self.thread = None
+        if self.proxy_thread and not self.proxy_thread.isRunning():
+            self.proxy_thread = None
+        if self.thumb_thread and not self.thumb_thread.isRunning():
+            self.thumb_thread = None
+        if not alive:
+            for video in self._preloaded_videos.values():
+                video.discard()
+            self._preloaded_videos.clear()
         return not alive
 
     def _alive_background_task_names(self) -> List[str]:
@@ -2392,8 +4474,18 @@ class Cutter(QMainWindow):
             names.append("export")
         if self.batch_export_thread and self.batch_export_thread.isRunning():
             names.append("batch export")
+        if self.export_probe_thread and self.export_probe_thread.isRunning():
+            names.append("metadata probe")
+        if self.folder_scan_thread and self.folder_scan_thread.isRunning():
+            names.append("folder indexing")
         if self.thread and self.thread.isRunning():
             names.append("video preview")
+        if any(t.isRunning() for t in (*self._video_loaders, *self._retired_video_threads)):
+            names.append("video loading")
+        if self.proxy_thread and self.proxy_thread.isRunning():
+            names.append("proxy build")
+        if self.thumb_thread and self.thumb_thread.isRunning():
+            names.append("thumbnail build")
         return names
 
     def _retry_close(self):
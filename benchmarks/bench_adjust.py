@@ -0,0 +1,56 @@
+"""Cost of the preview contrast/brightness/saturation adjustment per frame.
+
+Compares EqAdjuster (lookup tables, preallocated buffers) with the float32 YCrCb arithmetic
+it replaced, on random frames of a few sizes.
+
+    python benchmarks/bench_adjust.py [--repeat 20]
+"""
+
+import argparse
+import time
+
+from common import summary
+
+import cv2
+import numpy as np
+
+from SimpleVidCut import EqAdjuster
+
+SIZES = {"720p": (1280, 720), "1080p": (1920, 1080), "4K": (3840, 2160)}
+SETTINGS = (1.5, 0.1, 1.4)
+
+
+def float_path(frame, contrast, brightness, saturation):
+    # 이전 미리보기 방식 (비교용)
+    ycc = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb).astype(np.float32) / 255.0
+    ycc[..., 0] = np.clip((ycc[..., 0] - 0.5) * contrast + 0.5 + brightness, 0.0, 1.0)
+    ycc[..., 1:] = np.clip((ycc[..., 1:] - 0.5) * saturation + 0.5, 0.0, 1.0)
+    return cv2.cvtColor((ycc * 255.0).astype(np.uint8), cv2.COLOR_YCrCb2BGR)
+
+
+def _time(fn, repeat: int):
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    adjuster = EqAdjuster()
+    for label, (w, h) in SIZES.items():
+        frame = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+        work, scratch = frame.copy(), np.empty_like(frame)
+        lut = lambda: adjuster.apply(work, *SETTINGS, scratch=scratch, out=work)
+        print(f"{label:5s} float  {summary(_time(lambda: float_path(frame, *SETTINGS), args.repeat))}")
+        print(f"{label:5s} lut    {summary(_time(lut, args.repeat))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Decode throughput of the preview backends, and playback drops at high speed.
+
+"decode" reads the whole video through each DecoderBackend. It does so at full
+resolution, and at a preview size with an adjustment: OpenCV frames are resized and
+adjusted in Python, as VideoThread does, while the FFmpeg pipe does both inside
+ffmpeg. "playback" plays the video in VideoThread at ``--speed`` and counts the
+frames shown and dropped. CPU time is that of this process (an ffmpeg child is not counted).
+Without a video argument a 1080p test clip is generated.
+
+    python benchmarks/bench_decode.py [video] [--speed 3] [--preview 640x360]
+"""
+
+import argparse
+import time
+
+from common import make_clip
+
+import cv2
+
+from PyQt5.QtWidgets import QApplication
+
+from SimpleVidCut import DECODER_BACKENDS, EqAdjuster, VideoThread
+
+ADJUSTMENTS = (1.2, 0.05, 1.3)
+
+
+def decode_rate(backend, path: str, preview=None) -> tuple:
+    decoder = backend(path)
+    if not decoder.open():
+        raise SystemExit(f"cannot open {path} with {backend.label}")
+    eq = EqAdjuster()
+    if preview and decoder.applies_filters:
+        decoder.configure(preview, ADJUSTMENTS)
+    frames = 0
+    t0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        while True:
+            frame = decoder.read()
+            if frame is None:
+                break
+            if preview and not decoder.applies_filters:
+                frame = eq.apply(cv2.resize(frame, preview, interpolation=cv2.INTER_AREA), *ADJUSTMENTS)
+            frames += 1
+    finally:
+        decoder.release()
+    wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    return frames, frames / max(wall, 1e-9), cpu
+
+
+def playback(app, backend: str, path: str, speed: float, preview=None) -> tuple:
+    thread = VideoThread(path, backend=backend)
+    if not thread.open():
+        raise SystemExit(f"cannot open {path} with {backend}")
+    shown, ended = [0], []
+    thread.frameReady.connect(lambda frame, idx: shown.__setitem__(0, shown[0] + 1))
+    thread.playbackEnded.connect(lambda: ended.append(True))
+    if preview:
+        thread.set_display_size(*preview)
+        thread.set_adjustments(*ADJUSTMENTS)
+    thread.set_speed(speed)
+    thread.set_display_refresh(1000.0)
+    thread.start()
+    t0 = time.perf_counter()
+    thread.play()
+    try:
+        while not ended and time.perf_counter() - t0 < 600:
+            app.processEvents()
+            time.sleep(0.001)
+    finally:
+        thread.stop()
+        thread.wait()
+    return shown[0], thread.dropped_frames, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", nargs="?")
+    parser.add_argument("--speed", type=float, default=3.0)
+    parser.add_argument("--preview", default="640x360", help="preview size WxH")
+    args = parser.parse_args()
+    path = args.video or make_clip(seconds=10)
+    preview = tuple(int(v) for v in args.preview.lower().split("x"))
+    app = QApplication.instance() or QApplication([])
+    print(path)
+    for backend in DECODER_BACKENDS:
+        for size, label in ((None, "full size"), (preview, f"{args.preview} + eq")):
+            frames, rate, cpu = decode_rate(backend, path, size)
+            print(f"decode    {backend.name:7s} {label:16s} {frames:5d} frames  {rate:7.1f} fps  python cpu {cpu:6.2f} s")
+    for backend in DECODER_BACKENDS:
+        for size, label in ((None, "full size"), (preview, f"{args.preview} + eq")):
+            shown, dropped, wall = playback(app, backend.name, path, args.speed, size)
+            print(f"playback  {backend.name:7s} {label:16s} x{args.speed:g}: {shown} shown, {dropped} dropped, {wall:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
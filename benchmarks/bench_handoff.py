@@ -0,0 +1,81 @@
+"""Memory traffic of handing a decoded frame to the preview widget, at 1080p and 4K.
+
+"copy" is the old path: cvtColor BGR->RGB into a new array, ``QImage.copy()`` for the
+signal, and ``image.copy()`` again in the widget. "pool" is the current one: the decoder
+writes into a _FramePool buffer that is wrapped as a PreviewFrame, and the widget keeps
+that frame. Bytes copied are counted per step; the rate is handoffs per second, leaving
+out the decode itself. Test clips are generated with ffmpeg.
+
+    python benchmarks/bench_handoff.py [--frames 120] [--size 1920x1080 --size 3840x2160]
+"""
+
+import argparse
+import time
+
+from common import make_clip, summary
+
+import cv2
+
+from PyQt5.QtGui import QImage
+
+from SimpleVidCut import _QIMAGE_BGR888, _FramePool
+
+SIZES = ("1920x1080", "3840x2160")
+
+
+def copy_path(frame):
+    # 이전 전달 방식 (비교용): 변환 배열, 신호용 QImage 복사, 위젯의 QImage 복사
+    h, w = frame.shape[:2]
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    qimg = QImage(rgb.data, w, h, 3 * w, QImage.Format_RGB888).copy()
+    return qimg.copy(), 3 * frame.nbytes
+
+
+def pool_path(pool, frame):
+    if _QIMAGE_BGR888 is not None:
+        return pool.wrap(frame, _QIMAGE_BGR888), 0
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=pool.take(frame.shape))
+    pool.release(frame)
+    return pool.wrap(rgb, QImage.Format_RGB888), frame.nbytes
+
+
+def _run(path: str, frames: int, pooled: bool) -> tuple:
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise SystemExit(f"cannot open {path}")
+    shape = (int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), 3)
+    pool = _FramePool()
+    shown, samples, copied = None, [], 0
+    try:
+        while len(samples) < frames:
+            ok, frame = cap.read(pool.take(shape)) if pooled else cap.read()
+            if not ok:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                continue
+            t0 = time.perf_counter()
+            shown, nbytes = pool_path(pool, frame) if pooled else copy_path(frame)
+            samples.append((time.perf_counter() - t0) * 1000.0)
+            copied += nbytes
+            del frame
+    finally:
+        cap.release()
+    del shown
+    return samples, copied / max(1, len(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--size", action="append", help="WxH, may be repeated (default: 1080p and 4K)")
+    args = parser.parse_args()
+    for size in args.size or SIZES:
+        path = make_clip(size=size, seconds=2)
+        for label, pooled in (("copy", False), ("pool", True)):
+            samples, per_frame = _run(path, args.frames, pooled)
+            rate = len(samples) / max(sum(samples) / 1000.0, 1e-9)
+            print(f"{size:9s} {label}  {per_frame / 2**20:6.1f} MiB copied/frame   "
+                  f"{rate:8.0f} handoffs/s   {summary(samples)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Seek and step latency of the preview player, per decoder backend.
+
+Times ``VideoThread.seek()``/``step()`` until the frame is delivered, with the rendered-frame
+cache on (as in the app) and off (every request decodes). Without a video argument a 1080p
+test clip is generated.
+
+    python benchmarks/bench_seek.py [video] [--seeks 40] [--backend opencv --backend ffmpeg]
+"""
+
+import argparse
+import random
+import time
+
+from common import make_clip, summary
+
+from PyQt5.QtWidgets import QApplication
+
+from SimpleVidCut import DECODER_BACKENDS, VideoThread
+
+
+def _measure(app, path: str, backend: str, cache_mb: int, seeks: int, seed: int):
+    thread = VideoThread(path, backend=backend, cache_budget_mb=cache_mb)
+    if not thread.open():
+        raise SystemExit(f"cannot open {path} with {backend}")
+    thread.packet_index.wait(120)
+    shown = {}
+    thread.frameReady.connect(lambda frame, idx: shown.setdefault(idx, time.perf_counter()))
+    thread.start()
+
+    def timed(request, idx) -> float:
+        shown.clear()
+        t0 = time.perf_counter()
+        request()
+        while idx not in shown:
+            app.processEvents()
+            time.sleep(0.0002)
+        return (shown[idx] - t0) * 1000.0
+
+    rng = random.Random(seed)
+    seek_ms, step_ms = [], []
+    try:
+        timed(lambda: thread.seek(0), 0)
+        for _ in range(seeks):
+            target = rng.randrange(thread.total - 2)
+            seek_ms.append(timed(lambda: thread.seek(target), target))
+            step_ms.append(timed(lambda: thread.step(1), target + 1))
+            step_ms.append(timed(lambda: thread.step(-1), target))
+    finally:
+        thread.stop()
+        thread.wait()
+    return seek_ms, step_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", nargs="?")
+    parser.add_argument("--seeks", type=int, default=40)
+    parser.add_argument("--backend", action="append", choices=[b.name for b in DECODER_BACKENDS])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    path = args.video or make_clip()
+    app = QApplication.instance() or QApplication([])
+    print(path)
+    for backend in args.backend or [b.name for b in DECODER_BACKENDS]:
+        for cache_mb, label in ((384, "cache on "), (0, "cache off")):
+            seek_ms, step_ms = _measure(app, path, backend, cache_mb, args.seeks, args.seed)
+            print(f"{backend:7s} {label}  seek  {summary(seek_ms)}")
+            print(f"{backend:7s} {label}  step  {summary(step_ms)}")
+
+
+if __name__ == "__main__":
+    main()
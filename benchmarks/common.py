@@ -0,0 +1,32 @@
+"""Shared helpers for the benchmark scripts: test clips and timing summaries."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def make_clip(size: str = "1920x1080", seconds: int = 20, fps: int = 30, gop: int = 60) -> str:
+    """Generate an H.264 test clip in a temp folder and return its path (needs ffmpeg on PATH)."""
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        sys.exit("ffmpeg not found; pass a video file instead")
+    path = os.path.join(tempfile.mkdtemp(prefix="svc_bench_"), f"clip_{size}_{seconds}s.mp4")
+    subprocess.run([ffmpeg, "-hide_banner", "-v", "error", "-y", "-f", "lavfi",
+                    "-i", f"testsrc2=size={size}:rate={fps}:duration={seconds}",
+                    "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", "-g", str(gop), path], check=True)
+    return path
+
+
+def summary(samples_ms) -> str:
+    values = sorted(samples_ms)
+    if not values:
+        return "no samples"
+    pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+    return f"median {pick(0.5):7.1f} ms   p95 {pick(0.95):7.1f} ms   max {values[-1]:7.1f} ms   (n={len(values)})"
@@ -0,0 +1,47 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _ffmpeg():
+    return shutil.which("ffmpeg")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    # 인덱스/메타 캐시가 사용자 캐시 폴더를 건드리지 않게
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture(scope="session")
+def ffmpeg():
+    path = _ffmpeg()
+    if not path:
+        pytest.skip("ffmpeg not found")
+    return path
+
+
+@pytest.fixture(scope="session")
+def numbered_clip(tmp_path_factory, ffmpeg):
+    """3 s, 30 fps H.264 clip (testsrc2, every frame differs) with a keyframe every 30 frames."""
+    path = str(tmp_path_factory.mktemp("clips") / "numbered.mp4")
+    subprocess.run(
+        [ffmpeg, "-hide_banner", "-v", "error", "-y",
+         "-f", "lavfi", "-i", "testsrc2=size=160x120:rate=30:duration=3",
+         "-c:v", "libx264", "-pix_fmt", "yuv420p", "-g", "30", "-bf", "2", path],
+        check=True)
+    return path
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,104 @@
+import os
+import sqlite3
+
+import vidcut_core
+from vidcut_core import CATALOG_WRITE_BATCH, VideoCatalog
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"\0")
+
+
+def _tree(root, flat=1200):
+    for i in range(flat):
+        _touch(os.path.join(root, f"clip_{i:04d}.mp4"))
+    _touch(os.path.join(root, "day1", "a.mkv"))
+    _touch(os.path.join(root, "day1", "notes.txt"))
+    _touch(os.path.join(root, "day1", "s1", "b.mov"))
+
+
+def _scan(catalog, root, **kwargs):
+    batches = []
+    stats = catalog.scan(root, on_files=lambda folder, entries: batches.append((folder, entries)), **kwargs)
+    return stats, batches
+
+
+def test_first_scan_hands_over_files_in_batches(tmp_path):
+    root = str(tmp_path / "videos")
+    _tree(root)
+    catalog = VideoCatalog(str(tmp_path / "catalog.sqlite3"))
+    stats, batches = _scan(catalog, root)
+    assert stats["added"] == 1202 and stats["listed"] == 3
+    assert all(0 < len(entries) <= CATALOG_WRITE_BATCH for _, entries in batches)
+    handed = sorted(os.path.relpath(path, root) for _, entries in batches for path, _, _ in entries)
+    assert handed == sorted(f["rel"] for f in catalog.files(root))
+    assert catalog.is_indexed(root)
+
+
+def test_rescan_skips_unchanged_folders_but_still_hands_over_their_files(tmp_path):
+    root = str(tmp_path / "videos")
+    _tree(root, flat=10)
+    catalog = VideoCatalog(str(tmp_path / "catalog.sqlite3"))
+    catalog.scan(root)
+    os.remove(os.path.join(root, "day1", "a.mkv"))
+    _touch(os.path.join(root, "day1", "c.mp4"))
+    stats, batches = _scan(catalog, root)
+    assert stats["skipped"] == 2 and stats["listed"] == 1
+    assert stats["added"] == 1 and stats["removed"] == 1
+    assert sum(len(entries) for _, entries in batches) == 12
+
+
+def test_stopped_scan_relists_the_unfinished_folder(tmp_path):
+    root = str(tmp_path / "videos")
+    _tree(root, flat=CATALOG_WRITE_BATCH * 2 + 10)
+    catalog = VideoCatalog(str(tmp_path / "catalog.sqlite3"))
+    seen = []
+    catalog.scan(root, recursive=False, should_stop=lambda: bool(seen),
+                 on_files=lambda folder, entries: seen.append(len(entries)))
+    assert seen == [CATALOG_WRITE_BATCH]
+    assert not catalog.is_indexed(root)
+    stats = catalog.scan(root, recursive=False)
+    assert stats["listed"] == 1 and len(catalog.files(root, recursive=False)) == CATALOG_WRITE_BATCH * 2 + 10
+
+
+def test_export_history_marks_files(tmp_path):
+    root = str(tmp_path / "videos")
+    _tree(root, flat=2)
+    catalog = VideoCatalog(str(tmp_path / "catalog.sqlite3"))
+    catalog.scan(root)
+    source = os.path.join(root, "clip_0001.mp4")
+    catalog.record_export({"input": source, "output": "x.mp4", "mode": "fast", "time": "t", "status": "ok"})
+    assert catalog.exported_under(root) == {source}
+    assert [f["rel"] for f in catalog.query(root, "exported")] == ["clip_0001.mp4"]
+
+
+def test_probe_commits_in_batches_so_other_connections_can_write(tmp_path, monkeypatch):
+    root = str(tmp_path / "videos")
+    _tree(root, flat=CATALOG_WRITE_BATCH + 20)
+    db_path = str(tmp_path / "catalog.sqlite3")
+    catalog = VideoCatalog(db_path)
+    catalog.scan(root)
+    meta = {"width": 1920, "height": 1080, "fps": 30.0, "frames": 90, "duration": 3.0, "codec": "h264"}
+    seen = {}
+
+    class SlowProbe:
+        def probe_many(self, paths, on_result=None, should_stop=None):
+            for i, path in enumerate(paths):
+                on_result(path, meta)
+                if i == CATALOG_WRITE_BATCH + 1:
+                    # 프로브 도중 다른 연결에서 읽고 쓴다
+                    other = sqlite3.connect(db_path, timeout=0.2)
+                    try:
+                        with other:
+                            other.execute("INSERT INTO exports (input, output, mode, time, status)"
+                                          " VALUES ('a', 'b', 'fast', 't', 'ok')")
+                        seen["probed"] = other.execute("SELECT COUNT(*) FROM videos WHERE probed = 1").fetchone()[0]
+                    finally:
+                        other.close()
+
+    monkeypatch.setattr(vidcut_core, "_video_probe", SlowProbe)
+    assert catalog.probe_missing(root) == CATALOG_WRITE_BATCH + 22
+    assert seen["probed"] == CATALOG_WRITE_BATCH
+    assert all(f["meta"] for f in catalog.files(root))
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from SimpleVidCut import DECODER_BACKENDS, FFmpegPipeDecoder, OpenCVDecoder
+
+BACKENDS = {b.name: b for b in DECODER_BACKENDS}
+
+
+def _open(name, path):
+    decoder = BACKENDS[name](path)
+    assert decoder.open()
+    return decoder
+
+
+def _read_all(decoder):
+    frames = []
+    while True:
+        frame = decoder.read()
+        if frame is None:
+            return frames
+        frames.append(frame.copy())
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def decoder(request, ffmpeg, numbered_clip):
+    decoder = _open(request.param, numbered_clip)
+    yield decoder
+    decoder.release()
+
+
+def test_properties(decoder):
+    assert (decoder.width, decoder.height, decoder.total) == (160, 120, 90)
+    assert abs(decoder.fps - 30.0) < 1e-3
+    assert decoder.codec in ("h264", "avc1")
+
+
+def test_sequential_read_counts_positions(decoder):
+    frames = _read_all(decoder)
+    assert len(frames) == 90 and decoder.position == 90
+    assert all(f.shape == decoder.frame_shape for f in frames)
+
+
+@pytest.mark.parametrize("target", [0, 29, 30, 47, 89])
+def test_seek_is_exact(ffmpeg, numbered_clip, decoder, target):
+    reference = _read_all(_open(decoder.name, numbered_clip))
+    decoder.seek(target)
+    assert decoder.position == target
+    assert np.array_equal(decoder.read(), reference[target])
+    assert decoder.position == target + 1
+
+
+def test_grab_and_read_into_buffer(decoder):
+    assert decoder.grab() and decoder.position == 1
+    out = np.empty(decoder.frame_shape, np.uint8)
+    assert decoder.read(out) is out and decoder.position == 2
+
+
+def test_backends_decode_the_same_frames(ffmpeg, numbered_clip):
+    opencv = _read_all(_open("opencv", numbered_clip))
+    piped = _read_all(_open("ffmpeg", numbered_clip))
+    assert len(opencv) == len(piped)
+    # YUV -> BGR 변환만 다르다
+    assert max(np.abs(a.astype(int) - b).mean() for a, b in zip(opencv, piped)) < 2.0
+
+
+def test_ffmpeg_pipe_scales_and_adjusts(ffmpeg, numbered_clip):
+    plain = _open("ffmpeg", numbered_clip)
+    decoder = _open("ffmpeg", numbered_clip)
+    try:
+        decoder.configure((80, 80), (1.0, 0.0, 1.0))
+        assert decoder.frame_shape == (60, 80, 3)
+        assert decoder.read().shape == (60, 80, 3)
+        decoder.configure((0, 0), (1.5, 0.2, 0.0))
+        assert decoder.frame_shape == (120, 160, 3)
+        decoder.seek(10)
+        plain.seek(10)
+        adjusted, source = decoder.read().astype(int), plain.read().astype(int)
+        assert adjusted.mean() > source.mean() + 20   # brightness +0.2
+        assert np.abs(adjusted[..., 0] - adjusted[..., 2]).mean() < 3   # saturation 0 -> grey
+    finally:
+        decoder.release()
+        plain.release()
+
+
+def test_opencv_ignores_filters(numbered_clip):
+    decoder = _open("opencv", numbered_clip)
+    try:
+        assert not OpenCVDecoder.applies_filters and FFmpegPipeDecoder.applies_filters
+        decoder.configure((80, 60), (1.5, 0.2, 0.0))
+        assert decoder.read().shape == (120, 160, 3)
+    finally:
+        decoder.release()
@@ -0,0 +1,89 @@
+import struct
+import subprocess
+
+import cv2
+import numpy as np
+import pytest
+
+from SimpleVidCut import EqAdjuster
+
+SETTINGS = [(1.5, 0.1, 1.4), (0.6, -0.2, 0.5), (1.0, 0.3, 1.0), (2.0, 0.0, 0.0), (1.2, -0.1, 1.8), (0.0, -1.0, 2.0)]
+
+# BT.601 limited range: luma 16..235, chroma 16..240
+LUMA_RANGE = (16, 219.0)
+CHROMA_RANGE = (16, 224.0)
+
+
+def _c_float(value: float) -> float:
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def _vf_eq(code: int, gain: float, offset: float) -> int:
+    # libavfilter/vf_eq.c: set_contrast()/set_brightness() store av_clipf() results (C floats),
+    # check_values() skips a plane with contrast 1 and brightness 0, and process_c() works in
+    # 12-bit fixed point and clamps with (-pel) >> 31.
+    gain, offset = _c_float(gain), _c_float(offset)
+    if gain == 1.0 and offset == 0.0:
+        return code
+    contrast = int(gain * 256 * 16)
+    brightness = int(int(100.0 * offset + 100.0) * 511 / 200) - 128 - int(contrast / 32)
+    pel = ((code * contrast) >> 12) + brightness
+    return min(max(pel, 0), 255)
+
+
+def _ffmpeg_eq_yuv444(ffmpeg, planes, settings):
+    """Run limited-range YUV 4:4:4 planes through ffmpeg's eq filter and return the output planes."""
+    _, h, w = planes.shape
+    raw = subprocess.run([ffmpeg, "-v", "error", "-f", "rawvideo", "-pix_fmt", "yuv444p", "-s", f"{w}x{h}", "-i", "-",
+                          "-vf", "eq=contrast={}:brightness={}:saturation={}".format(*settings),
+                          "-f", "rawvideo", "-pix_fmt", "yuv444p", "-"],
+                         input=planes.tobytes(), check=True, stdout=subprocess.PIPE).stdout
+    return np.frombuffer(raw, np.uint8).reshape(3, h, w)
+
+
+def _to_limited(full, lo, span):
+    return np.rint(lo + full.astype(np.float64) * span / 255.0).astype(np.uint8)
+
+
+def _to_full(limited, lo, span):
+    return np.clip(np.rint((limited.astype(np.float64) - lo) * 255.0 / span), 0, 255)
+
+
+@pytest.fixture(scope="module")
+def frame():
+    rng = np.random.default_rng(6)
+    gradient = np.tile(np.arange(256, dtype=np.uint8), (64, 1))
+    noise = rng.integers(0, 256, (64, 256, 3), dtype=np.uint8)
+    return np.ascontiguousarray(np.concatenate([np.dstack([gradient] * 3), noise]))
+
+
+@pytest.mark.parametrize("gain, offset", [(1.0, 0.0), (1.5, 0.1), (0.3, -0.4), (2.0, 1.0), (1.2, -0.1), (0.6, -0.2)])
+def test_eq_table_matches_vf_eq(gain, offset):
+    table = EqAdjuster._eq_table(gain, offset)
+    assert list(table) == [_vf_eq(i, gain, offset) for i in range(256)]
+
+
+def test_in_place_and_preallocated_buffers(frame):
+    adjuster = EqAdjuster()
+    expected = adjuster.apply(frame, *SETTINGS[0])
+    work = frame.copy()
+    scratch = np.empty_like(frame)
+    out = adjuster.apply(work, *SETTINGS[0], scratch=scratch, out=work)
+    assert out is work and np.array_equal(out, expected)
+
+
+def test_identity_returns_the_frame(frame):
+    assert EqAdjuster().apply(frame, 1.0, 0.0, 1.0) is frame
+
+
+@pytest.mark.parametrize("settings", SETTINGS)
+def test_per_pixel_match_with_ffmpeg_eq(ffmpeg, frame, settings):
+    ycc = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb)
+    y, cr, cb = ycc[..., 0], ycc[..., 1], ycc[..., 2]
+    planes = np.stack([_to_limited(y, *LUMA_RANGE), _to_limited(cb, *CHROMA_RANGE), _to_limited(cr, *CHROMA_RANGE)])
+    out_y, out_cb, out_cr = _ffmpeg_eq_yuv444(ffmpeg, planes, settings)
+    lut = EqAdjuster().table(*settings)[0]
+    luma = np.abs(lut[y, 0] - _to_full(out_y, *LUMA_RANGE))
+    chroma = np.abs(np.stack([lut[cr, 1] - _to_full(out_cr, *CHROMA_RANGE), lut[cb, 2] - _to_full(out_cb, *CHROMA_RANGE)]))
+    assert np.percentile(luma, 99) <= 1 and luma.max() <= 2
+    assert np.percentile(chroma, 99) <= 1 and chroma.max() <= 2
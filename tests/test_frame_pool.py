@@ -0,0 +1,85 @@
+import gc
+import time
+
+import numpy as np
+import pytest
+from PyQt5.QtGui import QImage
+
+from SimpleVidCut import _QIMAGE_BGR888, VideoThread, _FramePool
+
+
+def _address(buffer) -> int:
+    return buffer.__array_interface__["data"][0]
+
+
+def test_released_buffers_are_reused():
+    pool = _FramePool(max_free_per_shape=2)
+    first = pool.take((120, 160, 3))
+    pool.release(first)
+    assert pool.take((120, 160, 3)) is first
+    assert pool.take((120, 160, 3)) is not first   # 빈 목록이면 새로 할당
+    assert pool.take((60, 80, 3)).shape == (60, 80, 3)
+
+
+def test_free_list_is_bounded_and_skips_views():
+    pool = _FramePool(max_free_per_shape=2)
+    buffers = [pool.take((4, 4, 3)) for _ in range(4)]
+    for buffer in buffers:
+        pool.release(buffer)
+    assert len(pool._free[(4, 4, 3)]) == 2
+    pool.release(np.zeros((8, 8, 3), np.uint8)[::2, ::2])
+    assert (4, 4, 3) in pool._free and len(pool._free) == 1
+
+
+def test_preview_frame_views_the_buffer_and_returns_it(qapp):
+    pool = _FramePool()
+    buffer = pool.take((120, 160, 3))
+    frame = pool.wrap(buffer, _QIMAGE_BGR888 or QImage.Format_RGB888)
+    assert int(frame.image.constBits()) == _address(buffer)
+    del frame
+    gc.collect()
+    assert pool.take((120, 160, 3)) is buffer
+
+
+@pytest.mark.skipif(_QIMAGE_BGR888 is None, reason="Qt without Format_BGR888 converts to RGB")
+def test_render_hands_over_the_decoded_buffer(qapp, numbered_clip):
+    thread = VideoThread(numbered_clip)
+    assert thread.open()
+    try:
+        decoded = thread._read_frame()
+        address = _address(decoded)
+        rendered = thread._render_frame(decoded)
+        assert rendered.buffer is decoded
+        assert int(rendered.image.constBits()) == address
+        # 화면 크기로 줄이면 원본 버퍼는 풀로 돌아간다
+        thread.display_size = (80, 60)
+        full = thread._read_frame()
+        full_address = _address(full)
+        small = thread._render_frame(full)
+        del full
+        assert small.buffer.shape == (60, 80, 3)
+        assert _address(thread._pool.take((120, 160, 3))) == full_address
+    finally:
+        thread.discard()
+
+
+def test_playback_recycles_a_few_buffers(qapp, numbered_clip):
+    thread = VideoThread(numbered_clip, cache_budget_mb=0)
+    addresses = set()
+    shown = []
+    thread.frameReady.connect(lambda frame, idx: (addresses.add(_address(frame.buffer)), shown.append(idx)))
+    assert thread.open()
+    thread.start()
+    try:
+        thread.seek(0)
+        thread.play()
+        end = time.monotonic() + 15
+        while (not shown or shown[-1] < 89) and time.monotonic() < end:
+            qapp.processEvents()
+            time.sleep(0.002)
+    finally:
+        thread.stop()
+        thread.wait()
+    assert len(shown) > 30
+    # 링 깊이 정도의 버퍼만 돌려 쓴다
+    assert len(addresses) <= thread.ring_depth + 4
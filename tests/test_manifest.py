@@ -0,0 +1,33 @@
+import os
+
+from vidcut_core import ExportSettings, _load_manifest, _validate_manifest
+
+
+def _write_manifest(folder, text):
+    path = os.path.join(folder, "clips.csv")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def test_row_without_unit_uses_base_unit(tmp_path, numbered_clip):
+    manifest = _write_manifest(str(tmp_path), f"file,start,duration,out\n{numbered_clip},10,2,a.mp4\n")
+    base = ExportSettings(duration_unit="frames", out_dir=str(tmp_path))
+    items, invalid = _validate_manifest(_load_manifest(manifest), base, str(tmp_path))
+    assert invalid == []
+    assert items[0]["settings"].duration_unit == "frames"
+    assert abs(items[0]["dur_sec"] - 2 / 30) < 1e-6
+
+
+def test_row_unit_overrides_base_unit(tmp_path, numbered_clip):
+    manifest = _write_manifest(str(tmp_path), f"file,start,duration,unit,out\n{numbered_clip},10,2,seconds,a.mp4\n")
+    base = ExportSettings(duration_unit="frames", out_dir=str(tmp_path))
+    items, invalid = _validate_manifest(_load_manifest(manifest), base, str(tmp_path))
+    assert invalid == []
+    assert abs(items[0]["dur_sec"] - 2.0) < 1e-6
+
+
+def test_bad_unit_is_reported(tmp_path, numbered_clip):
+    manifest = _write_manifest(str(tmp_path), f"file,start,duration,unit\n{numbered_clip},10,2,hours\n")
+    items, invalid = _validate_manifest(_load_manifest(manifest), ExportSettings(), str(tmp_path))
+    assert items == [] and "unit must be one of" in invalid[0][2]
@@ -0,0 +1,112 @@
+import os
+import subprocess
+
+import cv2
+import numpy as np
+import pytest
+
+from vidcut_core import (
+    SMART_CUT_PIECE_FORMAT, _chunked_encode_steps, _piece_encode_step, _run_export_steps, _run_ffmpeg,
+    _smart_cut_spec, _smart_cut_steps, _x264_args,
+)
+
+FPS = 30.0
+SIZE = (40, 30)
+
+
+def _gray_frames(path):
+    # OpenCV 의 자체 FFmpeg 로 순차 디코드
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), SIZE, interpolation=cv2.INTER_AREA))
+    cap.release()
+    return np.array(frames, np.int16)
+
+
+def _best_match(frame, source, around):
+    lo, hi = max(0, around - 3), min(len(source), around + 4)
+    errors = [np.abs(source[i] - frame).mean() for i in range(lo, hi)]
+    return lo + int(np.argmin(errors))
+
+
+def _check_frames(source, out, begin, end):
+    assert len(out) == end - begin
+    assert _best_match(out[0], source, begin) == begin
+    assert _best_match(out[-1], source, end - 1) == end - 1
+
+
+def _failing_fallback(ffmpeg, out_path):
+    # 계획이 None 이면 이 명령이 실패해서 테스트가 잡아낸다
+    return [ffmpeg, "-hide_banner", "-v", "error", "-i", os.devnull + ".missing", out_path]
+
+
+@pytest.fixture(scope="session")
+def ts_ffmpeg(tmp_path_factory, ffmpeg):
+    """ffmpeg, skipping when this build cannot demux MPEG-TS (some static builds crash on it)."""
+    path = str(tmp_path_factory.mktemp("ts") / "probe.ts")
+    subprocess.run([ffmpeg, "-hide_banner", "-v", "error", "-y", "-f", "lavfi", "-i", "testsrc2=duration=0.2",
+                    "-c:v", "mpeg2video", path], check=True)
+    rc = subprocess.run([ffmpeg, "-hide_banner", "-v", "error", "-i", path, "-f", "null", "-"]).returncode
+    if rc != 0:
+        pytest.skip(f"{ffmpeg} cannot read MPEG-TS (exit {rc})")
+    return ffmpeg
+
+
+def test_smart_cut_pieces_hold_the_exact_frames(tmp_path, ffmpeg, numbered_clip):
+    begin, end = 10, 75
+    work_dir = str(tmp_path)
+    steps = _smart_cut_steps(ffmpeg, numbered_clip, str(tmp_path / "smart.mp4"), begin / FPS, (end - begin) / FPS,
+                             _x264_args(), work_dir)
+    assert steps is not None and len(steps) == 4   # head, copied middle, tail, concat
+    for step in steps[:3]:
+        assert step["cmd"][step["cmd"].index("-f") + 1] == SMART_CUT_PIECE_FORMAT[0]
+        ok, err = _run_ffmpeg(step["cmd"], step["duration_us"], lambda f: None, lambda: False)
+        assert ok, err
+    source = _gray_frames(numbered_clip)
+    pieces = [_gray_frames(os.path.join(work_dir, name + SMART_CUT_PIECE_FORMAT[1]))
+              for name in ("head", "middle", "tail")]
+    assert [len(p) for p in pieces] == [20, 30, 15]   # 키프레임 30, 60 에서 나뉜다
+    _check_frames(source, np.concatenate(pieces), begin, end)
+
+
+def test_smart_cut_export(tmp_path, ts_ffmpeg, numbered_clip):
+    begin, end = 10, 75
+    out_path = str(tmp_path / "smart.mp4")
+    start_sec, dur_sec = begin / FPS, (end - begin) / FPS
+    task = {"smart": _smart_cut_spec(ts_ffmpeg, numbered_clip, start_sec, dur_sec), "out_path": out_path,
+            "cmd": _failing_fallback(ts_ffmpeg, out_path), "duration_us": int(dur_sec * 1_000_000)}
+    fractions = []
+    ok, err = _run_export_steps(task, fractions.append, lambda: False, None, None)
+    assert ok, err
+    assert fractions == sorted(fractions) and fractions[-1] == 1.0
+    _check_frames(_gray_frames(numbered_clip), _gray_frames(out_path), begin, end)
+
+
+def test_chunked_export(tmp_path, ts_ffmpeg, numbered_clip):
+    begin, end = 5, 85
+    out_path = str(tmp_path / "chunked.mp4")
+    start_sec, dur_sec = begin / FPS, (end - begin) / FPS
+    plan = _chunked_encode_steps(ts_ffmpeg, numbered_clip, out_path, start_sec, dur_sec, _x264_args(), "", 3,
+                                 str(tmp_path))
+    assert plan is not None and len(plan[0]["parallel"]) == 3
+    task = {"chunked": {"ffmpeg": ts_ffmpeg, "video_path": numbered_clip, "start_sec": start_sec,
+                        "dur_sec": dur_sec, "encode_args": _x264_args(), "vf": "", "chunks": 3},
+            "out_path": out_path, "cmd": _failing_fallback(ts_ffmpeg, out_path),
+            "duration_us": int(dur_sec * 1_000_000)}
+    ok, err = _run_export_steps(task, lambda f: None, lambda: False, None, None)
+    assert ok, err
+    _check_frames(_gray_frames(numbered_clip), _gray_frames(out_path), begin, end)
+
+
+def test_piece_failure_reports_the_error_not_the_banner(tmp_path, ffmpeg):
+    rel = np.arange(10) / FPS
+    step = _piece_encode_step(ffmpeg, str(tmp_path / "missing.mp4"), rel, 1 / FPS, 0, 5,
+                              str(tmp_path / "head.ts"), _x264_args())
+    ok, err = _run_ffmpeg(step["cmd"], step["duration_us"], lambda f: None, lambda: False)
+    assert not ok
+    assert "No such file" in err.splitlines()[-1]
+    assert "configuration:" not in err and "libavutil" not in err
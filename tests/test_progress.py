@@ -0,0 +1,41 @@
+from vidcut_core import FfmpegProgress
+
+
+def _feed_block(progress, state="continue", **values):
+    for key, value in values.items():
+        progress.feed(f"{key}={value}")
+    return progress.feed("progress=" + state)
+
+
+def test_out_time_na_keeps_last_time_and_fraction():
+    progress = FfmpegProgress(duration_us=10_000_000)
+    snap = _feed_block(progress, frame=210, out_time_us=7_000_000, out_time_ms=7_000_000,
+                       out_time="00:00:07.000000", speed="2.1x")
+    assert abs(snap["fraction"] - 0.7) < 1e-6
+    # 인코더 flush 중
+    snap = _feed_block(progress, frame=240, out_time_us="N/A", out_time_ms="N/A",
+                       out_time="N/A", speed="N/A")
+    assert snap["out_time_us"] == 7_000_000
+    assert abs(snap["fraction"] - 0.7) < 1e-6
+    snap = _feed_block(progress, frame=300, out_time_us=9_900_000, out_time_ms=9_900_000)
+    assert snap["fraction"] == 0.99
+    snap = _feed_block(progress, "end")
+    assert snap["fraction"] == 1.0 and snap["end"]
+
+
+def test_fraction_never_goes_backwards():
+    progress = FfmpegProgress(duration_us=10_000_000)
+    fractions = [
+        _feed_block(progress, out_time_us=t)["fraction"]
+        for t in (1_000_000, 5_000_000, 0, "garbage", 3_000_000, 6_000_000)
+    ]
+    assert fractions == sorted(fractions)
+    assert abs(fractions[-1] - 0.6) < 1e-6
+
+
+def test_non_progress_lines_go_to_err_tail():
+    progress = FfmpegProgress(duration_us=1_000_000)
+    progress.feed("[libx264 @ 0x1] using cpu capabilities: none")
+    progress.feed("out_time_us=500000")
+    assert progress.err_tail == ["[libx264 @ 0x1] using cpu capabilities: none"]
+    assert _feed_block(progress)["fraction"] == 0.5
@@ -0,0 +1,79 @@
+import subprocess
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from SimpleVidCut import _QIMAGE_BGR888, VideoThread
+
+
+def _opencv_frames(path):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def _ffmpeg_frames(ffmpeg, path, shape):
+    # FFmpegPipeDecoder 와 같은 변환 경로로 순차 디코드
+    raw = subprocess.run([ffmpeg, "-v", "error", "-i", path, "-map", "0:v:0", "-fps_mode", "passthrough",
+                          "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"], check=True, stdout=subprocess.PIPE).stdout
+    return list(np.frombuffer(raw, np.uint8).reshape(-1, *shape))
+
+
+class _Player:
+    def __init__(self, qapp, path, backend):
+        self.qapp = qapp
+        self.thread = VideoThread(path, backend=backend)
+        assert self.thread.open()
+        assert self.thread.packet_index.wait(30)
+        self.frames = {}
+        self.thread.frameReady.connect(self._on_frame)
+        self.thread.start()
+
+    def _on_frame(self, frame, idx):
+        pixels = frame.buffer if _QIMAGE_BGR888 is not None else frame.buffer[..., ::-1]
+        self.frames[idx] = np.array(pixels)
+
+    def shown(self, request, idx, timeout=10.0):
+        self.frames.clear()
+        request()
+        end = time.monotonic() + timeout
+        while idx not in self.frames and time.monotonic() < end:
+            self.qapp.processEvents()
+            time.sleep(0.001)
+        return self.frames.get(idx)
+
+    def close(self):
+        self.thread.stop()
+        self.thread.wait()
+
+
+SEEKS = [0, 45, 89, 31, 30, 29, 60, 59, 10, 75]
+
+
+@pytest.mark.parametrize("backend", ["opencv", "ffmpeg"])
+def test_seek_and_step_show_the_exact_frame(qapp, ffmpeg, numbered_clip, backend):
+    reference = _opencv_frames(numbered_clip)
+    if backend == "ffmpeg":
+        reference = _ffmpeg_frames(ffmpeg, numbered_clip, reference[0].shape)
+    assert len(reference) == 90
+    player = _Player(qapp, numbered_clip, backend)
+    try:
+        for target in SEEKS:
+            frame = player.shown(lambda: player.thread.seek(target), target)
+            assert frame is not None, f"no frame for seek {target}"
+            assert np.array_equal(frame, reference[target]), f"seek {target}"
+        idx = SEEKS[-1]
+        for delta in (1, 1, -1, -1, -1, 5, -12):
+            idx += delta
+            frame = player.shown(lambda: player.thread.step(delta), idx)
+            assert frame is not None and np.array_equal(frame, reference[idx]), f"step to {idx}"
+    finally:
+        player.close()
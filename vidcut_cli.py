@@ -0,0 +1,399 @@
+"""Headless batch cutter for Simple VidCut.
+
+Runs the same ffmpeg command builders and export worker pool as the desktop app
+(see vidcut_core.py) without importing PyQt5, so it can run on render nodes, under
+cron or from a job scheduler:
+
+    python vidcut_cli.py --start 300 --end 900 -j 4 "recordings/*.mp4"
+    python vidcut_cli.py --duration 2 --unit minutes --end 5400 --mode fast --out-dir cuts session1/
+    python vidcut_cli.py --manifest clips.csv -j 8
+    python vidcut_cli.py --catalog /data/recordings --query "under:subject_12 1080p unexported" --mode fast
+
+
+Start/End are frame numbers and exactly two of start/duration/end (or none, for the
+whole video) must be given, as in the app's parameter modes. A manifest (CSV or JSON,
+see vidcut_core.MANIFEST_COLUMNS) sets them per row instead, with the options as
+defaults, and per-row results go to <manifest>.results.csv. Exit status is 0 when
+every export succeeded, 1 when some failed or were invalid, 2 for invalid arguments
+and 130 when interrupted.
+"""
+import sys, os, glob, argparse, signal, shlex, subprocess, threading
+from typing import List, Optional
+
+from vidcut_core import (
+    ExportSettings, BatchExportRunner, ManifestResults, BATCH_EXPORT_WORKERS, EXPORT_MODES, DURATION_UNITS,
+    VIDEO_EXTENSIONS, _scan_video_folder, _find_ffmpeg_tool, _resolve_cut_range, _crop_filter, _output_path,
+    _build_cut_command,
+    _export_task, _export_worker_plan, _meta_tuple, _video_probe, _range_state, _parse_crop_rect, _parse_crop_size,
+    _load_manifest, _validate_manifest, _manifest_tasks, _manifest_results_path, _video_catalog,
+)
+
+
+def _expand_inputs(patterns: List[str]) -> List[str]:
+    """Files, globs and folders (their video files, not recursive) in order, without duplicates."""
+    paths: List[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            names = sorted(name for name, _, _ in _scan_video_folder(pattern))
+            paths.extend(os.path.join(pattern, f) for f in names)
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            paths.append(pattern)
+    seen = set()
+    unique = []
+    for path in paths:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def _crop_rect_arg(text: str):
+    try:
+        return _parse_crop_rect(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _crop_size_arg(text: str):
+    try:
+        return _parse_crop_size(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="vidcut_cli",
+        description="Cut videos with ffmpeg without the Simple VidCut window.",
+    )
+    parser.add_argument("inputs", nargs="*", help="video files, glob patterns or folders")
+    parser.add_argument("--manifest", metavar="FILE",
+                        help="CSV/JSON with one export per row (file, start, end, duration, unit, crop, "
+                             "crop_size, contrast, brightness, saturation, mode, out)")
+    parser.add_argument("--results", metavar="FILE", help="per-row results CSV (default: <manifest>.results.csv)")
+
+    cat = parser.add_argument_group("catalog (recursive, incremental folder index)")
+    cat.add_argument("--catalog", metavar="ROOT",
+                     help="index ROOT and its subfolders (only changed folders are relisted) and cut the files "
+                          "matching --query; with --out-dir the subfolders are kept")
+    cat.add_argument("--query", default="", metavar="TEXT",
+                     help="e.g. 'under:subject_12 1080p unexported': words match the path; also >=720p, "
+                          "codec:hevc, ext:mkv, exported/unexported")
+    cat.add_argument("--list", action="store_true", help="print the matching files instead of cutting them")
+    cat.add_argument("--rescan", action="store_true", help="restat every file, not just changed folders")
+    cat.add_argument("--ext", default="", metavar="LIST",
+                     help=f"extensions to index, comma separated (default: {','.join(e.lstrip('.') for e in VIDEO_EXTENSIONS)})")
+
+    cut = parser.add_argument_group("range (give two of start/duration/end, or none for the whole video)")
+    cut.add_argument("--start", type=int, help="start frame")
+    cut.add_argument("--end", type=int, help="end frame")
+    cut.add_argument("--duration", type=float, help="clip length, in --unit")
+    cut.add_argument("--unit", choices=DURATION_UNITS, default="seconds", help="unit of --duration (default: seconds)")
+
+    look = parser.add_argument_group("crop and adjustments (re-encode)")
+    look.add_argument("--crop", type=_crop_rect_arg, metavar="L,T,R,B",
+                      help="crop rectangle as fractions of the frame, e.g. 0.25,0,0.75,1")
+    look.add_argument("--crop-size", type=_crop_size_arg, metavar="WxH",
+                      help="fixed crop size in pixels, centred on --crop (or the frame)")
+    look.add_argument("--contrast", type=float, default=1.0, help="0..2 (default 1)")
+    look.add_argument("--brightness", type=float, default=0.0, help="-1..1 (default 0)")
+    look.add_argument("--saturation", type=float, default=1.0, help="0..2 (default 1)")
+
+    out = parser.add_argument_group("output")
+    out.add_argument("--mode", choices=EXPORT_MODES, default="accurate",
+                     help="accurate re-encodes, fast stream-copies, smart re-encodes only the edges (default: accurate)")
+    out.add_argument("--prefix", default="", help="output name prefix")
+    out.add_argument("--suffix", default="cut", help="output name suffix (default: cut)")
+    out.add_argument("--out-dir", default="", help="output folder (default: next to each input)")
+    out.add_argument("-y", "--overwrite", action="store_true", help="replace existing output files")
+
+    run = parser.add_argument_group("execution")
+    run.add_argument("-j", "--workers", type=int, default=BATCH_EXPORT_WORKERS,
+                     help="ffmpeg processes at once (default 0: pick from the CPU count)")
+    run.add_argument("--ffmpeg", default="", help="ffmpeg executable (default: bundled copy or PATH)")
+    run.add_argument("--dry-run", action="store_true", help="print the ffmpeg commands without running them")
+    run.add_argument("-q", "--quiet", action="store_true", help="only print errors and the summary")
+    return parser
+
+
+def _settings_from_args(args) -> ExportSettings:
+    state = _range_state(args.start is not None, args.duration is not None, args.end is not None)
+    if state is None:
+        raise ValueError("give exactly two of --start/--duration/--end, or none of them")
+    if not 0.0 <= args.contrast <= 2.0 or not 0.0 <= args.saturation <= 2.0 or not -1.0 <= args.brightness <= 1.0:
+        raise ValueError("adjustments out of range (contrast/saturation 0..2, brightness -1..1)")
+    crop_rect = args.crop
+    if crop_rect is None and args.crop_size is not None:
+        crop_rect = (0.0, 0.0, 1.0, 1.0)
+    return ExportSettings(
+        mode=args.mode,
+        range_state=state,
+        start_frame=args.start,
+        end_frame=args.end,
+        duration=args.duration or 0.0,
+        duration_unit=args.unit,
+        crop_rect=crop_rect,
+        crop_size=args.crop_size,
+        contrast=args.contrast,
+        brightness=args.brightness,
+        saturation=args.saturation,
+        prefix=args.prefix,
+        suffix=args.suffix,
+        out_dir=os.path.abspath(args.out_dir) if args.out_dir else "",
+    )
+
+
+def _prepare_items(settings: ExportSettings, paths: List[str], overwrite: bool, source_root: Optional[str] = None):
+    """Return (items, errors); items hold what _export_task needs for each valid input."""
+    items: List[dict] = []
+    errors: List[str] = []
+    claimed = set()
+    metas = _video_probe().probe_many(paths)
+    for path in paths:
+        name = os.path.basename(path)
+        if not os.path.isfile(path):
+            errors.append(f"{name}: file not found.")
+            continue
+        meta = _meta_tuple(metas.get(path))
+        if not meta:
+            errors.append(f"{name}: failed to read video metadata.")
+            continue
+        fps, total_frames, width, height, codec = meta
+        res, err = _resolve_cut_range(settings, fps, total_frames)
+        if err:
+            errors.append(f"{name}: {err}")
+            continue
+        _, crop_err = _crop_filter(settings, width, height)
+        if crop_err:
+            errors.append(f"{name}: {crop_err}")
+            continue
+        out_path = _output_path(settings, path, source_root)
+        key = os.path.normcase(os.path.abspath(out_path))
+        if key == os.path.normcase(os.path.abspath(path)):
+            errors.append(f"{name}: output would replace the input; set --prefix, --suffix or --out-dir.")
+            continue
+        if key in claimed:
+            errors.append(f"{name}: output {out_path} is already written by another input.")
+            continue
+        if os.path.exists(out_path) and not overwrite:
+            errors.append(f"{name}: {out_path} exists (use --overwrite).")
+            continue
+        claimed.add(key)
+        items.append({
+            "video_path": path, "out_path": out_path, "start_sec": res["start_sec"], "dur_sec": res["dur_sec"],
+            "width": width, "height": height, "fps": fps, "codec": codec,
+            "truncated": bool(res.get("duration_truncated", False)),
+        })
+    return items, errors
+
+
+class _ProgressPrinter:
+    """Progress and per-job lines on stderr; one rewritten line on a terminal, 10% steps otherwise."""
+
+    def __init__(self, total: int, quiet: bool = False):
+        self.total = total
+        self.quiet = quiet
+        self.tty = sys.stderr.isatty()
+        self._lock = threading.Lock()
+        self._pct = 0
+        self._rate = ""
+        self._last_step = -1
+
+    def progress(self, pct: int):
+        with self._lock:
+            self._pct = pct
+            self._draw()
+
+    def stats(self, totals: dict):
+        parts = []
+        if totals.get("speed"):
+            parts.append(f"{totals['speed']:.2f}x")
+        if totals.get("fps"):
+            parts.append(f"{totals['fps']:.0f} fps")
+        with self._lock:
+            self._rate = "  ".join(parts)
+            self._draw()
+
+    def result(self, task_idx: int, ok: bool, err: str, record: dict):
+        label = record.get("label") or f"item {task_idx + 1}"
+        if ok:
+            if self.quiet:
+                return
+            factor = record.get("realtime_factor")
+            line = f"ok    {label} -> {record.get('output', '')} ({record.get('wall_sec', 0):.1f}s"
+            line += f", {factor:.2f}x realtime)" if factor else ")"
+        elif record.get("status") == "canceled":
+            return
+        else:
+            tail = (err or "ffmpeg failed").strip().splitlines()
+            line = f"FAIL  {label}: {tail[-1] if tail else 'ffmpeg failed'}"
+        with self._lock:
+            if self.tty and not self.quiet:
+                sys.stderr.write("\r\033[K")
+            print(line, file=sys.stderr, flush=True)
+            self._draw()
+
+    def _draw(self):
+        if self.quiet:
+            return
+        text = f"[{self._pct:3d}%] {self.total} export(s)  {self._rate}".rstrip()
+        if self.tty:
+            sys.stderr.write("\r\033[K" + text)
+            sys.stderr.flush()
+        elif self._pct // 10 != self._last_step:
+            self._last_step = self._pct // 10
+            print(text, file=sys.stderr, flush=True)
+
+    def finish(self):
+        if self.tty and not self.quiet:
+            sys.stderr.write("\r\033[K")
+            sys.stderr.flush()
+
+
+def _catalog_files(args) -> List[dict]:
+    """Update the catalog for ``--catalog`` and return its files matching ``--query``."""
+    catalog = _video_catalog()
+    exts = [e.strip().lower() for e in args.ext.split(",") if e.strip()] if args.ext else []
+    extensions = tuple(e if e.startswith(".") else "." + e for e in exts) or VIDEO_EXTENSIONS
+    stats = catalog.scan(args.catalog, extensions=extensions, full=args.rescan)
+    probed = catalog.probe_missing(args.catalog)
+    if not args.quiet:
+        print(f"catalog  {stats['listed']} folder(s) listed, {stats['skipped']} unchanged; "
+              f"{stats['added']} added, {stats['updated']} changed, {stats['removed']} removed; "
+              f"{probed} probed", file=sys.stderr)
+    return catalog.query(args.catalog, args.query)
+
+
+def _print_catalog_files(files: List[dict]):
+    for f in files:
+        meta = f["meta"]
+        info = (f"{meta['width']}x{meta['height']}\t{meta['duration']:.1f}s\t{meta['codec']}" if meta
+                else "unreadable\t\t")
+        print(f"{f['rel']}\t{info}\t{'exported' if f['exported'] else ''}")
+
+
+def _file_tasks(args, settings: ExportSettings, ffmpeg: str, paths: List[str], source_root: Optional[str] = None):
+    """Return (tasks, workers, errors) for the given files (from the command line or the catalog)."""
+    items, errors = _prepare_items(settings, paths, args.overwrite, source_root)
+    if not items:
+        return [], 0, errors
+    # 모드(fast/accurate)는 전체에 공통이라 첫 항목으로 워커 수를 정한다
+    first = items[0]
+    _, mode = _build_cut_command(settings, ffmpeg, first["video_path"], first["out_path"], first["start_sec"],
+                                 first["dur_sec"], first["width"], first["height"])
+    workers, x264_threads = _export_worker_plan(len(items), len(items) if mode != "fast" else 0, args.workers)
+    tasks = [
+        _export_task(settings, ffmpeg, it["video_path"], it["out_path"], it["start_sec"], it["dur_sec"],
+                     it["width"], it["height"], it["fps"], it["codec"], x264_threads)
+        for it in items
+    ]
+    if not args.quiet and any(it["truncated"] for it in items):
+        print("note  the requested duration runs past the end of some videos; those clips are shorter.",
+              file=sys.stderr)
+    return tasks, workers, errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if sum(map(bool, (args.inputs, args.manifest, args.catalog))) != 1:
+        parser.error("give input files, --manifest or --catalog (one of them)")
+    if (args.query or args.list or args.rescan or args.ext) and not args.catalog:
+        parser.error("--query, --list, --rescan and --ext need --catalog")
+    if args.list:
+        _print_catalog_files(_catalog_files(args))
+        return 0
+    try:
+        settings = _settings_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    ffmpeg = args.ffmpeg or _find_ffmpeg_tool("ffmpeg")
+    if not ffmpeg:
+        print("ffmpeg not found: install it on PATH or pass --ffmpeg.", file=sys.stderr)
+        return 2
+    if settings.out_dir:
+        os.makedirs(settings.out_dir, exist_ok=True)
+
+    results_log = None
+    if args.manifest:
+        try:
+            rows = _load_manifest(args.manifest)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            return 2
+        items, invalid = _validate_manifest(rows, settings, os.path.dirname(os.path.abspath(args.manifest)),
+                                            args.overwrite)
+        tasks, workers = _manifest_tasks(items, ffmpeg, args.workers)
+        errors = [f"row {row}: {os.path.basename(file)}: {err}" for row, file, err in invalid]
+        if not args.dry_run:
+            results_log = ManifestResults(args.results or _manifest_results_path(args.manifest), tasks, invalid)
+    elif args.catalog:
+        files = _catalog_files(args)
+        tasks, workers, errors = _file_tasks(args, settings, ffmpeg, [f["path"] for f in files], args.catalog)
+    else:
+        tasks, workers, errors = _file_tasks(args, settings, ffmpeg, _expand_inputs(args.inputs))
+    for err in errors:
+        print(f"skip  {err}", file=sys.stderr)
+    if not tasks:
+        print("No valid videos to process.", file=sys.stderr)
+        if results_log:
+            results_log.close()
+        return 2
+
+    if args.dry_run:
+        for task in tasks:
+            task = dict(task["prepare"](), **task) if task.get("prepare") else task
+            note = "  # smart cut: edges re-encoded, this is the fallback" if task.get("smart") else ""
+            print(_command_line(task["cmd"]) + note)
+        return 0
+
+    printer = _ProgressPrinter(len(tasks), args.quiet)
+
+    def on_result(task_idx: int, ok: bool, err: str, record: dict):
+        printer.result(task_idx, ok, err, record)
+        if results_log:
+            results_log.on_result(task_idx, ok, err, record)
+
+    runner = BatchExportRunner(tasks, workers, on_progress=printer.progress, on_stats=printer.stats,
+                               on_result=on_result)
+    if not args.quiet:
+        print(f"{len(tasks)} export(s), {workers} at a time", file=sys.stderr)
+
+    def on_signal(signum, frame):
+        runner.stop()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, on_signal)
+
+    results: List[Optional[str]] = []
+    worker = threading.Thread(target=lambda: results.extend(runner.run()), name="BatchExport", daemon=True)
+    worker.start()
+    # 메인 스레드는 시그널을 받을 수 있도록 짧게 나눠 기다린다
+    while worker.is_alive():
+        worker.join(0.2)
+    printer.finish()
+    if results_log:
+        results_log.close()
+        print(f"Results: {results_log.path}", file=sys.stderr)
+
+    if runner.stopped:
+        print("Interrupted; unfinished outputs may be incomplete.", file=sys.stderr)
+        return 130
+    failures = [r for r in results if r]
+    total = len(tasks) + len(errors)
+    print(f"{len(tasks) - len(failures)}/{total} succeeded"
+          + (f", {len(failures)} failed" if failures else "")
+          + (f", {len(errors)} skipped" if errors else "") + ".", file=sys.stderr)
+    return 1 if failures or errors else 0
+
+
+def _command_line(cmd: List[str]) -> str:
+    return subprocess.list2cmdline(cmd) if os.name == "nt" else shlex.join(cmd)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2486 @@
+"""Qt-free export engine of Simple VidCut.
+
+Everything an export needs without a window lives here: ffmpeg lookup, the packet
+index, cut settings and the ffmpeg command builders, segmented (smart/chunked) exports
+and the worker pool that runs them. The desktop app (SimpleVidCut.py) and the headless
+command line (vidcut_cli.py) both drive exports through this module, which must not
+import PyQt5.
+"""
+import sys, os, shutil, subprocess, math, time, threading, hashlib, tempfile, fractions, collections, copy, functools
+import csv, json, platform, queue, shlex, sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Optional, List
+
+# Avoid OpenCV python-loader recursion in frozen executables (PyInstaller on Windows).
+if getattr(sys, "frozen", False):
+    os.environ.setdefault("OPENCV_SKIP_PYTHON_LOADER", "1")
+
+import cv2
+import numpy as np
+
+
+def _quiet_opencv_logging():
+    # Random access on some H.264 files can produce noisy decoder warnings on stderr.
+    try:
+        if hasattr(cv2, "utils") and hasattr(cv2.utils, "logging"):
+            log_api = cv2.utils.logging
+            if hasattr(log_api, "setLogLevel"):
+                level = getattr(log_api, "LOG_LEVEL_SILENT", None)
+                if level is None:
+                    level = getattr(log_api, "LOG_LEVEL_ERROR", None)
+                if level is not None:
+                    log_api.setLogLevel(level)
+                    return
+    except Exception:
+        pass
+    try:
+        if hasattr(cv2, "setLogLevel"):
+            level = getattr(cv2, "LOG_LEVEL_SILENT", None)
+            if level is None:
+                level = getattr(cv2, "LOG_LEVEL_ERROR", None)
+            if level is not None:
+                cv2.setLogLevel(level)
+    except Exception:
+        pass
+
+
+_quiet_opencv_logging()
+
+
+def _find_ffmpeg_tool(name: str = "ffmpeg") -> str:
+    # A copy bundled next to the executable/script wins over PATH.
+    try:
+        base = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else os.path.dirname(os.path.abspath(__file__))
+        cand = os.path.join(base, f"{name}.exe" if os.name == "nt" else name)
+        if os.path.isfile(cand):
+            return cand
+    except Exception:
+        pass
+    return shutil.which(name) or ""
+
+
+def _cache_dir(*parts: str) -> str:
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, "SimpleVidCut", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _fourcc_tag(cap) -> str:
+    code = int(cap.get(cv2.CAP_PROP_FOURCC) or 0)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ").lower()
+
+
+def _file_identity(path: str) -> str:
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha1(key.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _scan_video_folder(folder: str, should_stop=None):
+    """Yield (name, size, mtime) of the video files directly in ``folder``, in directory order.
+
+    Uses ``os.scandir`` so a folder of tens of thousands of files streams out without one
+    big listing; ``should_stop()`` ends the scan early.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if should_stop is not None and should_stop():
+                return
+            if not entry.name.lower().endswith(VIDEO_EXTENSIONS):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            yield entry.name, st.st_size, st.st_mtime
+
+
+# ------------------------------- Packet index -------------------------------
+class PacketIndex:
+    """Video packet table of one file (pts, keyframe flag, byte offset) in presentation order.
+
+    Built once in the background with ffprobe, or with ffmpeg's framecrc muxer when only
+    ffmpeg is available, and cached on disk keyed by path, size and mtime. Row ``i`` is
+    frame ``i``, so a seek can jump to the preceding keyframe and decode forward.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pts = np.zeros(0, dtype=np.float64)
+        self.keyframe = np.zeros(0, dtype=bool)
+        self.pos = np.zeros(0, dtype=np.int64)
+        self.keyframe_frames = np.zeros(0, dtype=np.int64)
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set() and self.keyframe_frames.size > 0
+
+    def build_async(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._load_or_build, name="PacketIndex", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self.build_async()
+        self._ready.wait(timeout)
+        return self.ready
+
+    def keyframe_at_or_before(self, frame_idx: int) -> Optional[int]:
+        if not self.ready:
+            return None
+        i = int(np.searchsorted(self.keyframe_frames, int(frame_idx), side="right")) - 1
+        return int(self.keyframe_frames[max(0, i)])
+
+    def _cache_path(self) -> str:
+        return os.path.join(_cache_dir("index"), _file_identity(self.path) + ".npz")
+
+    def _load_or_build(self):
+        try:
+            cache_path = self._cache_path()
+            if os.path.isfile(cache_path):
+                try:
+                    with np.load(cache_path) as data:
+                        self._set_packets(data["pts"], data["keyframe"], data["pos"])
+                    return
+                except Exception:
+                    pass
+            packets = self._probe_packets()
+            if packets is None:
+                return
+            self._set_packets(*packets)
+            tmp_path = cache_path + ".tmp.npz"
+            np.savez_compressed(tmp_path, pts=self.pts, keyframe=self.keyframe, pos=self.pos)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+        finally:
+            self._ready.set()
+
+    def _set_packets(self, pts, keyframe, pos):
+        pts = np.asarray(pts, dtype=np.float64)
+        order = np.argsort(pts, kind="stable")
+        self.pts = pts[order]
+        self.keyframe = np.asarray(keyframe, dtype=bool)[order]
+        self.pos = np.asarray(pos, dtype=np.int64)[order]
+        self.keyframe_frames = np.flatnonzero(self.keyframe).astype(np.int64)
+
+    def _probe_packets(self):
+        ffprobe = _find_ffmpeg_tool("ffprobe")
+        if ffprobe:
+            return self._probe_with_ffprobe(ffprobe)
+        ffmpeg = _find_ffmpeg_tool("ffmpeg")
+        if ffmpeg:
+            return self._probe_with_framecrc(ffmpeg)
+        return None
+
+    def _probe_with_ffprobe(self, ffprobe: str):
+        proc = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "packet=pts_time,dts_time,pos,flags",
+             "-of", "compact=p=0", self.path],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, errors="replace",
+        )
+        if proc.returncode != 0:
+            return None
+        pts, keyframe, pos = [], [], []
+        for line in proc.stdout.splitlines():
+            fields = dict(kv.split("=", 1) for kv in line.strip().split("|") if "=" in kv)
+            t = fields.get("pts_time", "N/A")
+            if t == "N/A":
+                t = fields.get("dts_time", "N/A")
+            try:
+                pts.append(float(t))
+            except ValueError:
+                continue
+            keyframe.append(fields.get("flags", "").startswith("K"))
+            try:
+                pos.append(int(fields.get("pos", "-1")))
+            except ValueError:
+                pos.append(-1)
+        return (pts, keyframe, pos) if pts else None
+
+    def _probe_with_framecrc(self, ffmpeg: str):
+        # framecrc lines: stream, dts, pts, duration, size, crc[, F=0x..]; no F= means keyframe.
+        proc = subprocess.run(
+            [ffmpeg, "-v", "error", "-i", self.path, "-map", "0:v:0", "-c", "copy", "-f", "framecrc", "-"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, errors="replace",
+        )
+        if proc.returncode != 0:
+            return None
+        timebase = None
+        pts, keyframe = [], []
+        for line in proc.stdout.splitlines():
+            if line.startswith("#tb 0:"):
+                num, _, den = line.split(":", 1)[1].strip().partition("/")
+                timebase = float(num) / float(den or 1)
+                continue
+            if line.startswith("#") or timebase is None:
+                continue
+            fields = [f.strip() for f in line.split(",")]
+            if len(fields) < 6:
+                continue
+            try:
+                pts.append(int(fields[2]) * timebase)
+            except ValueError:
+                continue
+            flags = 1
+            for extra in fields[6:]:
+                if extra.startswith("F="):
+                    flags = int(extra[2:], 16)
+            keyframe.append(bool(flags & 1))
+        return (pts, keyframe, [-1] * len(pts)) if pts else None
+
+
+# ------------------------------ Cut settings ------------------------------
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".avi", ".mov", ".m4v", ".webm", ".mts", ".m2ts", ".mpg", ".mpeg", ".wmv")
+EXPORT_MODES = ("fast", "accurate", "smart")
+DURATION_UNITS = ("seconds", "frames", "minutes")
+
+
+class ExportSettings:
+    """Export choices that are not tied to one video: range inputs, crop, adjustments, mode, naming.
+
+    ``range_state`` follows the GUI parameter modes (0 whole video, 1 start+duration,
+    2 duration+end, 3 start+end). Start/end are frame numbers, as ints or the text of the
+    GUI fields; ``duration`` is counted in ``duration_unit``. ``crop_rect`` is a normalized
+    (left, top, right, bottom) selection or None, and ``crop_size`` an optional fixed
+    (width, height) centred on it. The GUI builds one from its widgets, the CLI from its
+    arguments.
+    """
+
+    def __init__(self, mode: str = "accurate", range_state: int = 0, start_frame=None, end_frame=None,
+                 duration: float = 0.0, duration_unit: str = "seconds", crop_rect=None, crop_size=None,
+                 contrast: float = 1.0, brightness: float = 0.0, saturation: float = 1.0,
+                 prefix: str = "", suffix: str = "", out_dir: str = ""):
+        self.mode = mode
+        self.range_state = int(range_state)
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.duration = float(duration)
+        self.duration_unit = duration_unit
+        self.crop_rect = crop_rect
+        self.crop_size = crop_size
+        self.contrast = float(contrast)
+        self.brightness = float(brightness)
+        self.saturation = float(saturation)
+        self.prefix = prefix
+        self.suffix = suffix
+        self.out_dir = out_dir
+
+    def adjustments_active(self) -> bool:
+        return (abs(self.contrast - 1.0) > 1e-6 or abs(self.brightness) > 1e-6
+                or abs(self.saturation - 1.0) > 1e-6)
+
+    def eq_filter(self) -> str:
+        return f"eq=contrast={self.contrast:.3f}:brightness={self.brightness:.3f}:saturation={self.saturation:.3f}"
+
+
+def _frame_input(value) -> Optional[int]:
+    # GUI 입력칸의 빈 문자열은 "입력 없음"
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return int(value)
+
+
+def _duration_seconds(settings: ExportSettings, fps: float) -> Optional[float]:
+    unit = settings.duration_unit
+    if unit == "seconds":
+        return settings.duration
+    if unit == "minutes":
+        return settings.duration * 60.0
+    if fps <= 1e-6:
+        return None
+    return settings.duration / fps
+
+
+def _resolve_cut_range(settings: ExportSettings, fps: float, total_frames: int):
+    """Return ({start_sec, dur_sec, duration_truncated}, None) or (None, error_text)."""
+    state = settings.range_state  # 0=off, 1=S+D, 2=D+E, 3=S+E
+    have_s = state in (1, 3)
+    have_d = state in (1, 2)
+    have_e = state in (2, 3)
+    if fps <= 1e-6 or total_frames <= 0:
+        return None, "Video duration is not available."
+    total_sec = total_frames / fps
+    if total_sec <= 0:
+        return None, "Video duration is not available."
+    if state == 0:
+        return {
+            "start_sec": 0.0,
+            "dur_sec": total_sec,
+            "requested_dur_sec": total_sec,
+            "duration_truncated": False,
+        }, None
+
+    # read inputs
+    try:
+        sf = _frame_input(settings.start_frame) if have_s else None
+        ef = _frame_input(settings.end_frame) if have_e else None
+    except ValueError:
+        return None, "Start/End must be valid frame numbers."
+
+    requested_dur_sec = None
+    if have_d:
+        requested_dur_sec = _duration_seconds(settings, fps)
+        if requested_dur_sec is None:
+            return None, "FPS information is missing for frame-based duration."
+        if requested_dur_sec <= 0:
+            return None, "Duration must be larger than 0."
+
+    # compute missing
+    try:
+        if have_s and have_e:
+            if sf is None or ef is None:
+                return None, "Start/End must be provided."
+            if ef <= sf:
+                return None, "End must be larger than Start."
+            start_sec = max(0.0, min(sf / fps, total_sec))
+            end_sec = max(0.0, min(ef / fps, total_sec))
+            dur_sec = end_sec - start_sec
+            if dur_sec <= 0:
+                return None, "Invalid range after clamp."
+            return {
+                "start_sec": start_sec,
+                "dur_sec": dur_sec,
+                "requested_dur_sec": dur_sec,
+                "duration_truncated": False,
+            }, None
+        elif have_s and have_d:
+            if sf is None or requested_dur_sec is None:
+                return None, "Start/Duration must be provided."
+            start_sec = max(0.0, min(sf / fps, total_sec))
+            available = max(0.0, total_sec - start_sec)
+            dur_sec = min(requested_dur_sec, available)
+            if dur_sec <= 0:
+                return None, "Requested range starts at or beyond the video end."
+            return {
+                "start_sec": start_sec,
+                "dur_sec": dur_sec,
+                "requested_dur_sec": requested_dur_sec,
+                "duration_truncated": requested_dur_sec - dur_sec > 1e-6,
+            }, None
+        elif have_d and have_e:
+            if requested_dur_sec is None or ef is None:
+                return None, "Duration/End must be provided."
+            end_sec = max(0.0, min(ef / fps, total_sec))
+            start_sec = max(0.0, end_sec - requested_dur_sec)
+            dur_sec = end_sec - start_sec
+            if dur_sec <= 0:
+                return None, "Requested range ends at or before the video start."
+            return {
+                "start_sec": start_sec,
+                "dur_sec": dur_sec,
+                "requested_dur_sec": requested_dur_sec,
+                "duration_truncated": requested_dur_sec - dur_sec > 1e-6,
+            }, None
+        else:
+            return None, "Exactly two parameters must be selected."
+    except Exception as e:
+        return None, f"Invalid input: {e}"
+
+
+def _normalize_crop_rect(rect_norm):
+    if not rect_norm:
+        return None
+    left = max(0.0, min(1.0, min(float(rect_norm[0]), float(rect_norm[2]))))
+    top = max(0.0, min(1.0, min(float(rect_norm[1]), float(rect_norm[3]))))
+    right = max(0.0, min(1.0, max(float(rect_norm[0]), float(rect_norm[2]))))
+    bottom = max(0.0, min(1.0, max(float(rect_norm[1]), float(rect_norm[3]))))
+    if right - left <= 1e-6 or bottom - top <= 1e-6:
+        return None
+    return (left, top, right, bottom)
+
+
+def _crop_size_error(crop_size, video_width: int, video_height: int):
+    if crop_size is None:
+        return None
+    width, height = crop_size
+    if width < 4 or height < 4:
+        return 'Fixed crop width and height must be at least 4 pixels.'
+    if width % 2 or height % 2:
+        return 'Fixed crop width and height must be even for video compatibility.'
+    if video_width <= 0 or video_height <= 0:
+        return 'Fixed crop size cannot be checked until the video dimensions are available.'
+    if width > int(video_width) or height > int(video_height):
+        return f'Fixed crop {width}x{height} is larger than the video ({video_width}x{video_height}).'
+    return None
+
+
+def _validated_crop_rect(rect_norm, crop_size, video_width: int, video_height: int):
+    """Return ({x, y, w, h}, None) in even pixels for a normalized selection, or (None, error_text)."""
+    rect_norm = _normalize_crop_rect(rect_norm)
+    if rect_norm is None:
+        return None, "Crop canceled: invalid selection."
+    video_width = int(video_width)
+    video_height = int(video_height)
+    if video_width <= 1 or video_height <= 1:
+        return None, "Crop canceled: video size is unavailable."
+
+    if crop_size is not None:
+        fixed_error = _crop_size_error(crop_size, video_width, video_height)
+        if fixed_error:
+            return None, fixed_error
+        width, height = crop_size
+        center_x = ((rect_norm[0] + rect_norm[2]) / 2.0) * video_width
+        center_y = ((rect_norm[1] + rect_norm[3]) / 2.0) * video_height
+        left = int(round(center_x - width / 2.0))
+        top = int(round(center_y - height / 2.0))
+        left = max(0, min(left, video_width - width))
+        top = max(0, min(top, video_height - height))
+        left -= left % 2
+        top -= top % 2
+        return {'x': left, 'y': top, 'w': width, 'h': height}, None
+
+    left = max(0, min(int(round(rect_norm[0] * video_width)), video_width - 1))
+    top = max(0, min(int(round(rect_norm[1] * video_height)), video_height - 1))
+    right = max(left + 1, min(int(round(rect_norm[2] * video_width)), video_width))
+    bottom = max(top + 1, min(int(round(rect_norm[3] * video_height)), video_height))
+
+    if right - left < 4 or bottom - top < 4:
+        return None, "Crop canceled: selection is too small."
+
+    left_even = left + (left % 2)
+    top_even = top + (top % 2)
+    right_even = right - (right % 2)
+    bottom_even = bottom - (bottom % 2)
+    width = right_even - left_even
+    height = bottom_even - top_even
+    if width < 4 or height < 4:
+        return None, "Crop canceled: selection is too small."
+
+    return {"x": left_even, "y": top_even, "w": width, "h": height}, None
+
+
+def _crop_filter(settings: ExportSettings, video_width: int, video_height: int):
+    if settings.crop_rect is None:
+        return "", None
+    crop_rect, err = _validated_crop_rect(settings.crop_rect, settings.crop_size, video_width, video_height)
+    if err:
+        return "", err
+    return f"crop={crop_rect['w']}:{crop_rect['h']}:{crop_rect['x']}:{crop_rect['y']}", None
+
+
+def _export_filters(settings: ExportSettings, video_width: int, video_height: int) -> List[str]:
+    crop_filter, _ = _crop_filter(settings, video_width, video_height)
+    vf_parts = []
+    if crop_filter:
+        vf_parts.append(crop_filter)
+    if settings.adjustments_active():
+        vf_parts.append(settings.eq_filter())
+    return vf_parts
+
+
+def _x264_args(x264_threads: int = 0) -> List[str]:
+    args = ["-c:v", "libx264", "-preset", "medium", "-crf", "18"]
+    if x264_threads > 0:
+        args.extend(["-threads", str(x264_threads)])
+    return args
+
+
+def _output_path(settings: ExportSettings, video_path: str, source_root: Optional[str] = None) -> str:
+    """Output file of one cut; with an ``out_dir``, files under ``source_root`` keep their subfolders there."""
+    folder = settings.out_dir or os.path.dirname(video_path)
+    if settings.out_dir and source_root:
+        sub = os.path.relpath(os.path.dirname(os.path.abspath(video_path)), os.path.abspath(source_root))
+        if sub != "." and not sub.startswith(".."):
+            folder = os.path.join(settings.out_dir, sub)
+    base, ext = os.path.splitext(os.path.basename(video_path))
+    prefix = settings.prefix.strip().strip("_")
+    suffix = settings.suffix.strip().strip("_")
+    prefix_part = f"{prefix}_" if prefix else ""
+    suffix_part = f"_{suffix}" if suffix else ""
+    out_name = f"{prefix_part}{base}{suffix_part}{ext}"
+    return os.path.join(folder, out_name)
+
+
+def _build_cut_command(settings: ExportSettings, ffmpeg: str, video_path: str, out_path: str, start_sec: float,
+                       dur_sec: float, video_width: int, video_height: int, x264_threads: int = 0):
+    """Return (cmd, mode) for one cut; fast/smart fall back to accurate while filters are active."""
+    vf_parts = _export_filters(settings, video_width, video_height)
+    filters_active = bool(vf_parts)
+    progress_args = ["-progress", "pipe:2", "-nostats"]
+
+    fast_cmd = [
+        ffmpeg,
+        "-y",
+        "-ss", f"{start_sec:.6f}",
+        "-i", video_path,
+        "-t", f"{dur_sec:.6f}",
+        "-c", "copy",
+        *progress_args,
+        out_path
+    ]
+
+    accurate_cmd = [
+        ffmpeg,
+        "-y",
+        "-ss", f"{start_sec:.6f}",
+        "-i", video_path,
+        "-t", f"{dur_sec:.6f}",
+    ]
+    if filters_active:
+        accurate_cmd.extend(["-vf", ",".join(vf_parts)])
+    accurate_cmd.extend(_x264_args(x264_threads))
+    accurate_cmd.extend([
+        "-c:a", "aac",
+        "-b:a", "192k",
+        "-movflags", "+faststart",
+        *progress_args,
+        out_path
+    ])
+
+    mode = settings.mode if settings.mode in EXPORT_MODES else "accurate"
+    if filters_active and mode in ("fast", "smart"):
+        mode = "accurate"
+    # smart는 구간 정보만 넘기고 실제 명령은 워커가 키프레임을 보고 만든다 (실패 시 accurate_cmd)
+    return (fast_cmd if mode == "fast" else accurate_cmd), mode
+
+
+def _smart_cut_spec(ffmpeg: str, video_path: str, start_sec: float, dur_sec: float, x264_threads: int = 0) -> dict:
+    return {
+        "ffmpeg": ffmpeg,
+        "video_path": video_path,
+        "start_sec": start_sec,
+        "dur_sec": dur_sec,
+        "encode_args": _x264_args(x264_threads),
+    }
+
+
+def _chunked_encode_spec(settings: ExportSettings, ffmpeg: str, video_path: str, start_sec: float, dur_sec: float,
+                         video_width: int, video_height: int, chunks: int) -> dict:
+    return {
+        "ffmpeg": ffmpeg,
+        "video_path": video_path,
+        "start_sec": start_sec,
+        "dur_sec": dur_sec,
+        "encode_args": _x264_args(),
+        "vf": ",".join(_export_filters(settings, video_width, video_height)),
+        "chunks": chunks,
+    }
+
+
+def _build_multi_range_command(settings: ExportSettings, ffmpeg: str, video_path: str, ranges: List[tuple],
+                               out_paths: List[str], video_width: int, video_height: int, fps: float,
+                               packet_index: Optional[PacketIndex] = None):
+    """Build one ffmpeg command that writes every (start_sec, end_sec) range to its own file.
+
+    Re-encoding decodes the source once, from the first range start to the last range
+    end, splits the decoded video/audio and trims each branch before crop/eq run.
+    Stream copy has nothing to decode, so each range gets its own keyframe-seeked
+    ``-ss/-t`` input in the same process, matching the single fast cut. In both cases a
+    null output that sees the whole pass comes first, so the ``frame`` count ``-progress``
+    reports (first output) covers every clip. Returns (cmd, mode, pass_sec).
+    """
+    vf_parts = _export_filters(settings, video_width, video_height)
+    mode = "fast" if (settings.mode == "fast" and not vf_parts) else "accurate"
+    half = 0.5 / (fps if fps > 1e-6 else 30.0)
+    ranges = [(float(a), float(b)) for a, b in ranges]
+
+    if mode == "fast" and packet_index is not None and packet_index.ready:
+        # 단일 fast 컷과 같게: 시작점을 그 앞 키프레임으로 당긴다
+        rel = packet_index.pts - packet_index.pts[0]
+        snapped = []
+        for a, b in ranges:
+            idx = max(0, int(np.searchsorted(rel, a + half, side="right")) - 1)
+            key = packet_index.keyframe_at_or_before(idx)
+            snapped.append((float(rel[key]) if key is not None else a, b))
+        ranges = snapped
+
+    pass_start = min(a for a, _ in ranges)
+    pass_sec = max(b for _, b in ranges) - pass_start
+    cmd = [ffmpeg, "-y", "-ss", f"{pass_start:.6f}", "-t", f"{pass_sec + half:.6f}", "-i", video_path,
+           "-progress", "pipe:2", "-nostats"]
+
+    if mode == "fast":
+        for a, b in ranges:
+            cmd.extend(["-ss", f"{a:.6f}", "-t", f"{b - a:.6f}", "-i", video_path])
+        cmd.extend(["-map", "0:v:0", "-c", "copy", "-f", "null", "-"])
+        for i, out_path in enumerate(out_paths, start=1):
+            cmd.extend(["-map", f"{i}:v:0", "-map", f"{i}:a:0?", "-c", "copy", out_path])
+        return cmd, mode, pass_sec
+
+    has_audio = _probe_streams(ffmpeg, video_path)["has_audio"]
+    # filter_complex 출력은 입력 프레임레이트를 모르므로(기본 25) 원본 값을 명시한다
+    rate = str(fractions.Fraction(fps if fps > 1e-6 else 30.0).limit_denominator(1001))
+    n = len(ranges)
+    vf = "," + ",".join(vf_parts) if vf_parts else ""
+    graph = ["[0:v:0]split={}{}".format(n + 1, "".join(f"[vs{i}]" for i in range(n + 1)))]
+    if has_audio:
+        graph.append("[0:a:0]asplit={}{}".format(n, "".join(f"[as{i}]" for i in range(n))))
+    for i, (a, b) in enumerate(ranges):
+        start, end = a - pass_start - half, b - pass_start - half
+        graph.append(f"[vs{i}]trim=start={start:.6f}:end={end:.6f},setpts=PTS-STARTPTS{vf}[v{i}]")
+        if has_audio:
+            graph.append(f"[as{i}]atrim=start={a - pass_start:.6f}:end={b - pass_start:.6f},asetpts=PTS-STARTPTS[a{i}]")
+    cmd.extend(["-filter_complex", ";".join(graph), "-map", f"[vs{n}]", "-f", "null", "-"])
+    for i, out_path in enumerate(out_paths):
+        cmd.extend(["-map", f"[v{i}]"])
+        if has_audio:
+            cmd.extend(["-map", f"[a{i}]", "-c:a", "aac", "-b:a", "192k"])
+        cmd.extend([*_x264_args(), "-r", rate, "-movflags", "+faststart", out_path])
+    return cmd, mode, pass_sec
+
+
+def _read_video_meta(video_path: str):
+    """Return (fps, total_frames, width, height, codec), or None if the file cannot be opened.
+
+    Goes through the shared metadata cache (see ``VideoProbe``).
+    """
+    return _meta_tuple(_video_probe().probe(video_path))
+
+
+# ----------------------------- Metadata probes -----------------------------
+META_PROBE_WORKERS = max(2, min(8, os.cpu_count() or 2))
+META_CACHE_MAX_ENTRIES = 20000
+META_GOP_PACKETS = 300   # packets read from the start of a file to measure the keyframe interval
+
+
+def _meta_tuple(meta: Optional[dict]):
+    if not meta:
+        return None
+    return meta["fps"], meta["frames"], meta["width"], meta["height"], meta["codec"]
+
+
+def _probe_keyframe_interval(video_path: str) -> int:
+    """Median distance in frames between keyframes among the first packets; 0 when unknown."""
+    ffprobe = _find_ffmpeg_tool("ffprobe")
+    ffmpeg = None if ffprobe else _find_ffmpeg_tool("ffmpeg")
+    if ffprobe:
+        cmd = [ffprobe, "-v", "error", "-select_streams", "v:0", "-read_intervals", f"%+#{META_GOP_PACKETS}",
+               "-show_entries", "packet=flags", "-of", "csv=p=0", video_path]
+    elif ffmpeg:
+        cmd = [ffmpeg, "-v", "error", "-nostdin", "-i", video_path, "-map", "0:v:0", "-c", "copy",
+               "-frames:v", str(META_GOP_PACKETS), "-f", "framecrc", "-"]
+    else:
+        return 0
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, errors="replace",
+                              timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return 0
+    keyframes = []
+    for i, line in enumerate(l for l in proc.stdout.splitlines() if l.strip() and not l.startswith("#")):
+        # ffprobe: "K_" flags; framecrc: no F= field, or an odd F= value, marks a keyframe
+        if ffprobe:
+            is_key = line.strip().startswith("K")
+        else:
+            flags = [f.strip() for f in line.split(",")[6:] if f.strip().startswith("F=")]
+            is_key = not flags or bool(int(flags[0][2:], 16) & 1)
+        if is_key:
+            keyframes.append(i)
+    if len(keyframes) < 2:
+        return 0
+    return int(np.median(np.diff(keyframes)))
+
+
+def _probe_video_file(video_path: str) -> Optional[dict]:
+    """Read fps, frame count, size, codec, duration and keyframe interval of one file."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap or not cap.isOpened():
+        return None
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        fps = float(fps) if fps > 1e-3 else 30.0
+        meta = {
+            "fps": fps,
+            "frames": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or 0,
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 0,
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 0,
+            "codec": _fourcc_tag(cap),
+        }
+    finally:
+        cap.release()
+    meta["duration"] = round(meta["frames"] / fps, 3)
+    meta["keyframe_interval"] = _probe_keyframe_interval(video_path)
+    return meta
+
+
+class VideoProbe:
+    """Video metadata (see ``_probe_video_file``) with a persistent cache keyed by path, size and mtime.
+
+    ``probe_many`` reads the files that are not cached on a pool of threads; the work itself
+    runs in OpenCV, which releases the GIL, and in ffprobe/ffmpeg child processes. The cache
+    is a JSON file in the cache directory, written after each batch of probes. Unreadable
+    files are remembered as such until they change. Safe to use from several threads.
+    """
+
+    def __init__(self, path: Optional[str] = None, workers: int = META_PROBE_WORKERS):
+        self.path = path or os.path.join(_cache_dir("meta"), "video_meta.json")
+        self.workers = max(1, int(workers))
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f).get("files", {})
+        except Exception:
+            self._entries = {}
+
+    @staticmethod
+    def _key(video_path: str):
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return None, None
+        return os.path.normcase(os.path.abspath(video_path)), (st.st_size, st.st_mtime_ns)
+
+    def _lookup(self, video_path: str):
+        """(hit, metadata) from the cache; a hit can carry None for an unreadable file."""
+        key, stamp = self._key(video_path)
+        if key is None:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and (entry.get("size"), entry.get("mtime_ns")) == stamp:
+            return True, dict(entry["meta"]) if entry["meta"] else None
+        return False, None
+
+    def cached(self, video_path: str) -> Optional[dict]:
+        """Cached metadata of an unchanged file, or None."""
+        return self._lookup(video_path)[1]
+
+    def _store(self, video_path: str, meta: Optional[dict]):
+        key, stamp = self._key(video_path)
+        if key is None:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {"size": stamp[0], "mtime_ns": stamp[1], "meta": meta}
+            # 가장 오래전에 기록된 항목부터 버린다
+            for stale in list(self._entries)[:max(0, len(self._entries) - META_CACHE_MAX_ENTRIES)]:
+                del self._entries[stale]
+            self._dirty = True
+
+    def probe(self, video_path: str) -> Optional[dict]:
+        """Metadata of one file, probed now if it is not cached."""
+        hit, meta = self._lookup(video_path)
+        if not hit and os.path.isfile(video_path):
+            meta = _probe_video_file(video_path)
+            self._store(video_path, meta)
+            self.save()
+        return meta
+
+    def probe_many(self, paths: List[str], on_result=None, should_stop=None) -> dict:
+        """Metadata (or None) for each distinct path, probing the uncached ones in parallel.
+
+        ``on_result(path, meta)`` is called as each path is resolved, cached ones first,
+        from the calling thread. ``should_stop()`` cancels the probes not started yet.
+        """
+        results = {}
+        missing = []
+        for path in dict.fromkeys(paths):
+            hit, meta = self._lookup(path)
+            if not hit and os.path.isfile(path):
+                missing.append(path)
+                continue
+            results[path] = meta
+            if on_result:
+                on_result(path, meta)
+        if not missing:
+            return results
+        pool = ThreadPoolExecutor(max_workers=min(self.workers, len(missing)), thread_name_prefix="VideoProbe")
+        try:
+            futures = {pool.submit(_probe_video_file, p): p for p in missing}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    meta = future.result()
+                except Exception:
+                    meta = None
+                self._store(path, meta)
+                results[path] = meta
+                if on_result:
+                    on_result(path, meta)
+                if should_stop and should_stop():
+                    break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            self.save()
+        return results
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"files": self._entries}, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                pass
+
+
+_video_probe_instance: Optional[VideoProbe] = None
+_video_probe_lock = threading.Lock()
+
+
+def _video_probe() -> VideoProbe:
+    global _video_probe_instance
+    with _video_probe_lock:
+        if _video_probe_instance is None:
+            _video_probe_instance = VideoProbe()
+        return _video_probe_instance
+
+
+# ---------------------------- Segmented exports ----------------------------
+SMART_CUT_COPY_WEIGHT = 0.05   # stream copy/concat cost relative to encoding the same span
+SMART_CUT_PIECE_FORMAT = ("mpegts", ".ts")   # Annex B pieces keep SPS/PPS in-band across the joins
+PIECE_QUIET_ARGS = ["-hide_banner", "-v", "error"]   # piece failures report the error, not the build banner
+EXPORT_CHUNKS_MAX = 16
+
+
+def _probe_streams(ffmpeg: str, video_path: str) -> dict:
+    """Read codec and pix_fmt of the first video stream, and whether audio exists, from ffmpeg's input banner."""
+    info = {"codec": "", "pix_fmt": "", "has_audio": False}
+    try:
+        proc = subprocess.run([ffmpeg, "-hide_banner", "-nostdin", "-i", video_path],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace")
+    except Exception:
+        return info
+    for line in proc.stderr.splitlines():
+        if "Audio: " in line:
+            info["has_audio"] = True
+        _, sep, rest = line.partition("Video: ")
+        if not sep or info["codec"]:
+            continue
+        info["codec"] = rest.split(None, 1)[0].rstrip(",")
+        parts = [p.strip() for p in rest.split(",")]
+        info["pix_fmt"] = parts[1].split("(", 1)[0].strip() if len(parts) > 1 else ""
+    return info
+
+
+def _index_frame_range(index: PacketIndex, start_sec: float, dur_sec: float):
+    """Map a time range onto frame rows of a ready PacketIndex.
+
+    Returns (rel_pts, frame_sec, start_idx, end_idx) with ``end_idx`` exclusive, or None.
+    """
+    rel = index.pts - index.pts[0]
+    if rel.size < 2:
+        return None
+    frame_sec = max(1e-6, float(np.median(np.diff(rel[: min(rel.size, 240)]))))
+    half = 0.5 * frame_sec
+    start_idx = int(np.searchsorted(rel, start_sec - half, side="left"))
+    end_idx = int(np.searchsorted(rel, start_sec + dur_sec - half, side="left"))
+    if end_idx <= start_idx:
+        return None
+    return rel, frame_sec, start_idx, end_idx
+
+
+def _piece_encode_step(ffmpeg: str, video_path: str, rel, frame_sec: float, begin: int, end: int, path: str,
+                       encode_args: List[str], vf: str = "", pix_fmt: str = "") -> dict:
+    """Re-encode frames [begin, end) of the source, video only, into one concat piece."""
+    cmd = [ffmpeg, *PIECE_QUIET_ARGS, "-y", "-ss", f"{max(0.0, rel[begin] - 0.5 * frame_sec):.6f}", "-i", video_path,
+           "-map", "0:v:0", "-an", "-sn", "-frames:v", str(end - begin)]
+    if vf:
+        cmd.extend(["-vf", vf])
+    cmd.extend(encode_args)
+    if pix_fmt:
+        cmd.extend(["-pix_fmt", pix_fmt])
+    cmd.extend(["-f", SMART_CUT_PIECE_FORMAT[0], "-progress", "pipe:2", "-nostats", path])
+    return {"cmd": cmd, "duration_us": max(1, int((end - begin) * frame_sec * 1_000_000.0)), "weight": float(end - begin)}
+
+
+def _concat_pieces_step(ffmpeg: str, pieces: List[str], work_dir: str, video_path: str, out_path: str,
+                        start_sec: float, dur_sec: float, weight: float) -> dict:
+    """Join video pieces with the concat demuxer and add the range's audio, re-encoded once."""
+    list_path = os.path.join(work_dir, "pieces.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in pieces:
+            escaped = path.replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    return {
+        "cmd": [ffmpeg, *PIECE_QUIET_ARGS, "-y", "-f", "concat", "-safe", "0", "-i", list_path,
+                "-ss", f"{start_sec:.6f}", "-t", f"{dur_sec:.6f}", "-i", video_path,
+                "-map", "0:v:0", "-map", "1:a:0?", "-c:v", "copy",
+                "-c:a", "aac", "-b:a", "192k", "-movflags", "+faststart",
+                "-progress", "pipe:2", "-nostats", out_path],
+        "duration_us": max(1, int(dur_sec * 1_000_000.0)),
+        "weight": weight,
+    }
+
+
+def _smart_cut_steps(ffmpeg: str, video_path: str, out_path: str, start_sec: float, dur_sec: float,
+                     encode_args: List[str], work_dir: str):
+    """Plan a frame-accurate cut that re-encodes only the partial GOPs at both ends.
+
+    Returns a list of step dicts (cmd, duration_us, weight), or None when the source cannot
+    be smart-cut (not H.264 4:2:0, no packet index, or no whole GOP inside the range) and
+    the caller should re-encode the full clip instead. Pieces are written as MPEG-TS so each
+    keeps its SPS/PPS in-band, then joined with the concat demuxer; audio is re-encoded in
+    the final step from the exact range.
+    """
+    streams = _probe_streams(ffmpeg, video_path)
+    pix_fmt = streams["pix_fmt"]
+    if streams["codec"] != "h264" or pix_fmt not in ("yuv420p", "yuvj420p"):
+        return None
+    index = PacketIndex(video_path)
+    if not index.wait():
+        return None
+    frame_range = _index_frame_range(index, start_sec, dur_sec)
+    if frame_range is None:
+        return None
+    rel, frame_sec, start_idx, end_idx = frame_range
+    keys = index.keyframe_frames
+    first = int(np.searchsorted(keys, start_idx, side="left"))
+    last = int(np.searchsorted(keys, end_idx, side="right")) - 1
+    if first >= keys.size or last < 0:
+        return None
+    head_end, tail_start = int(keys[first]), int(keys[last])
+    if tail_start <= head_end:
+        return None
+
+    piece_format, piece_ext = SMART_CUT_PIECE_FORMAT
+    pieces: List[str] = []
+    steps: List[dict] = []
+
+    def encode(begin: int, end: int, name: str):
+        path = os.path.join(work_dir, name + piece_ext)
+        pieces.append(path)
+        steps.append(_piece_encode_step(ffmpeg, video_path, rel, frame_sec, begin, end, path, encode_args,
+                                        pix_fmt=pix_fmt))
+
+    if head_end > start_idx:
+        encode(start_idx, head_end, "head")
+    mid_path = os.path.join(work_dir, "middle" + piece_ext)
+    pieces.append(mid_path)
+    steps.append({
+        # 키프레임에서 시작하는 입력 seek이라 복사 구간은 head_end 프레임부터 정확히 시작한다
+        "cmd": [ffmpeg, *PIECE_QUIET_ARGS, "-y", "-ss", f"{rel[head_end] + 0.5 * frame_sec:.6f}", "-i", video_path,
+                "-map", "0:v:0", "-an", "-sn", "-frames:v", str(tail_start - head_end),
+                "-c", "copy", "-f", piece_format, "-progress", "pipe:2", "-nostats", mid_path],
+        "duration_us": max(1, int((tail_start - head_end) * frame_sec * 1_000_000.0)),
+        "weight": (tail_start - head_end) * SMART_CUT_COPY_WEIGHT,
+    })
+    if end_idx > tail_start:
+        encode(tail_start, end_idx, "tail")
+    steps.append(_concat_pieces_step(ffmpeg, pieces, work_dir, video_path, out_path, start_sec, dur_sec,
+                                     (end_idx - start_idx) * SMART_CUT_COPY_WEIGHT))
+    return steps
+
+
+def _chunked_encode_steps(ffmpeg: str, video_path: str, out_path: str, start_sec: float, dur_sec: float,
+                          encode_args: List[str], vf: str, chunks: int, work_dir: str):
+    """Plan an accurate re-encode split at keyframes into ``chunks`` pieces encoded in parallel.
+
+    Returns [parallel group step, concat step], or None when the packet index is missing
+    or the range holds fewer than two chunks' worth of keyframes. Every chunk runs the same
+    filters and x264 settings with ``-threads`` sized to share the CPUs.
+    """
+    index = PacketIndex(video_path)
+    if chunks < 2 or not index.wait():
+        return None
+    frame_range = _index_frame_range(index, start_sec, dur_sec)
+    if frame_range is None:
+        return None
+    rel, frame_sec, start_idx, end_idx = frame_range
+    keys = index.keyframe_frames
+    inner = keys[(keys > start_idx) & (keys < end_idx)]
+    if inner.size == 0:
+        return None
+    # 구간을 균등하게 나눈 지점에서 가장 가까운 키프레임을 경계로 쓴다
+    targets = start_idx + (end_idx - start_idx) * np.arange(1, chunks) / chunks
+    picks = np.searchsorted(inner, targets)
+    bounds = set()
+    for target, pick in zip(targets, picks):
+        near = [int(inner[i]) for i in (pick - 1, pick) if 0 <= i < inner.size]
+        bounds.add(min(near, key=lambda k: abs(k - target)))
+    edges = [start_idx] + sorted(bounds) + [end_idx]
+    if len(edges) < 3:
+        return None
+
+    threads = max(1, (os.cpu_count() or 1) // (len(edges) - 1))
+    args = [a for a in encode_args]
+    if "-threads" in args:
+        i = args.index("-threads")
+        del args[i:i + 2]
+    args.extend(["-threads", str(threads)])
+    pieces: List[str] = []
+    group: List[dict] = []
+    for n, (begin, end) in enumerate(zip(edges[:-1], edges[1:])):
+        path = os.path.join(work_dir, f"chunk{n:03d}{SMART_CUT_PIECE_FORMAT[1]}")
+        pieces.append(path)
+        group.append(_piece_encode_step(ffmpeg, video_path, rel, frame_sec, begin, end, path, args, vf=vf))
+    parallel = {"parallel": group, "weight": float(end_idx - start_idx)}
+    concat = _concat_pieces_step(ffmpeg, pieces, work_dir, video_path, out_path, start_sec, dur_sec,
+                                 (end_idx - start_idx) * SMART_CUT_COPY_WEIGHT)
+    return [parallel, concat]
+
+
+# ------------------------------ Export workers ------------------------------
+EXPORT_SPEED_HISTORY = 20   # measured samples kept per export profile
+
+
+def _export_profile(mode: str, codec: str, width: int, height: int, fps: float) -> str:
+    return f"{mode}|{(codec or '?').lower()}|{int(width)}x{int(height)}|{float(fps):.2f}"
+
+
+class ExportSpeedModel:
+    """Measured export throughput of this host (media seconds per wall second) per export profile.
+
+    A profile is ``mode|codec|WxH|fps`` (see ``_export_profile``). The last few samples of
+    each are kept in a JSON file in the cache directory, under the host name, and the
+    median is used. A profile with no history borrows the closest measured profile of the
+    same mode, scaled by pixel rate; ``speed()`` returns None when there is nothing to go on.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(_cache_dir("stats"), "export_speed.json")
+        self.host = platform.node() or "localhost"
+        self._lock = threading.Lock()
+        self._hosts = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._hosts = json.load(f).get("hosts", {})
+        except Exception:
+            self._hosts = {}
+        self._profiles = self._hosts.setdefault(self.host, {})
+
+    def record(self, profile: str, media_sec: float, wall_sec: float):
+        if media_sec <= 0 or wall_sec <= 0.05:
+            return
+        with self._lock:
+            samples = self._profiles.setdefault(profile, [])
+            samples.append(round(media_sec / wall_sec, 4))
+            del samples[:-EXPORT_SPEED_HISTORY]
+            try:
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"hosts": self._hosts}, f, indent=1, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                pass
+
+    def speed(self, profile: str) -> Optional[float]:
+        with self._lock:
+            samples = self._profiles.get(profile)
+            if samples:
+                return float(np.median(samples))
+            mode, _, width, height, fps = self._parse(profile)
+            target = width * height * fps
+            best = None
+            for key, samples in self._profiles.items():
+                k_mode, _, k_width, k_height, k_fps = self._parse(key)
+                rate = k_width * k_height * k_fps
+                if k_mode != mode or not samples or rate <= 0 or target <= 0:
+                    continue
+                distance = abs(math.log(rate / target))
+                if best is None or distance < best[0]:
+                    best = (distance, float(np.median(samples)) * rate / target)
+            return best[1] if best else None
+
+    @staticmethod
+    def _parse(profile: str):
+        try:
+            mode, codec, size, fps = profile.split("|")
+            width, height = size.split("x")
+            return mode, codec, int(width), int(height), float(fps)
+        except ValueError:
+            return profile, "", 0, 0, 0.0
+
+
+_export_speed_model_instance: Optional[ExportSpeedModel] = None
+_export_speed_model_lock = threading.Lock()
+
+
+def _export_speed_model() -> ExportSpeedModel:
+    global _export_speed_model_instance
+    with _export_speed_model_lock:
+        if _export_speed_model_instance is None:
+            _export_speed_model_instance = ExportSpeedModel()
+        return _export_speed_model_instance
+
+
+EXPORT_STATS_INTERVAL = 0.5          # seconds between live throughput updates of one export
+EXPORT_LOG_MAX_BYTES = 4 * 1024 * 1024  # export_log.jsonl rolls over to .1 past this size
+_export_log_lock = threading.Lock()
+
+
+def _progress_number(value: str) -> Optional[float]:
+    # "1.23x", "2431.2kbits/s", "N/A" 같은 -progress 값
+    value = (value or "").strip().rstrip("x")
+    if value.endswith("kbits/s"):
+        value = value[:-len("kbits/s")]
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class FfmpegProgress:
+    """Incremental parser for ffmpeg's ``-progress`` key=value blocks.
+
+    ``feed(line)`` takes one stderr line and returns a snapshot dict when a block ends
+    (``progress=continue|end``), otherwise None. Snapshots carry ``fraction`` (from
+    ``out_time`` or, with ``total_frames``, the first output's ``frame``), ``frame``, ``fps``,
+    ``speed``, ``bitrate_kbps``, ``total_size``, ``out_time_us``, ``elapsed`` and ``end``.
+    Other lines are kept in ``err_tail`` for error messages.
+    """
+
+    def __init__(self, duration_us: int, total_frames: int = 0):
+        self.duration_us = max(1, int(duration_us))
+        self.total_frames = max(0, int(total_frames))
+        self.started = time.monotonic()
+        self.values = {}
+        self.err_tail: List[str] = []
+        self._fraction = 0.0
+
+    def feed(self, line: str) -> Optional[dict]:
+        line = (line or "").strip()
+        if not line:
+            return None
+        key, sep, value = line.partition("=")
+        if not sep or not key or " " in key:
+            self.err_tail.append(line)
+            if len(self.err_tail) > 120:
+                del self.err_tail[:-120]
+            return None
+        if key != "progress":
+            # 인코더가 남은 프레임을 flush 하는 동안 out_time 은 N/A 로 온다 -> 마지막 값 유지
+            if key in ("out_time_us", "out_time_ms") and _progress_number(value) is None:
+                return None
+            self.values[key] = value
+            return None
+        return self.snapshot(value == "end")
+
+    def snapshot(self, end: bool = False) -> dict:
+        get = lambda key: _progress_number(self.values.get(key, ""))
+        # out_time_ms 도 실제로는 마이크로초 단위다
+        out_time_us = int(max(0.0, get("out_time_us") or get("out_time_ms") or 0.0))
+        frame = int(get("frame") or 0)
+        if self.total_frames > 0:
+            fraction = frame / self.total_frames
+        else:
+            fraction = out_time_us / self.duration_us
+        # 진행률은 뒤로 가지 않는다
+        self._fraction = 1.0 if end else max(self._fraction, min(0.99, fraction))
+        return {
+            "fraction": self._fraction,
+            "frame": frame,
+            "fps": get("fps"),
+            "speed": get("speed"),
+            "bitrate_kbps": get("bitrate"),
+            "total_size": int(get("total_size") or 0),
+            "out_time_us": out_time_us,
+            "elapsed": round(time.monotonic() - self.started, 3),
+            "end": end,
+        }
+
+
+class ExportMeter:
+    """Folds snapshots of the ffmpeg processes behind one export into throttled totals.
+
+    ``update(key, snap)`` returns the combined figures (summed ``speed``/``fps``/``total_size``
+    of the running processes) at most every ``interval`` seconds, None in between; ``drop(key)``
+    forgets a process that exited.
+    """
+
+    def __init__(self, interval: float = EXPORT_STATS_INTERVAL):
+        self.interval = interval
+        self._live = {}
+        self._last_emit = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, key, snap: dict) -> Optional[dict]:
+        with self._lock:
+            self._live[key] = snap
+            now = time.monotonic()
+            if now - self._last_emit < self.interval:
+                return None
+            self._last_emit = now
+            live = list(self._live.values())
+        return {
+            "speed": sum(s["speed"] or 0.0 for s in live),
+            "fps": sum(s["fps"] or 0.0 for s in live),
+            "bitrate_kbps": sum(s["bitrate_kbps"] or 0.0 for s in live),
+            "total_size": sum(s["total_size"] for s in live),
+            "processes": len(live),
+        }
+
+    def drop(self, key):
+        with self._lock:
+            self._live.pop(key, None)
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _log_export_job(record: dict, path: Optional[str] = None):
+    """Append one JSON-lines record to ``export_log.jsonl`` in the stats cache directory."""
+    path = path or os.path.join(_cache_dir("stats"), "export_log.jsonl")
+    line = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    with _export_log_lock:
+        try:
+            if _file_size(path) > EXPORT_LOG_MAX_BYTES:
+                os.replace(path, path + ".1")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except Exception:
+            pass
+
+
+def _run_ffmpeg(cmd: List[str], duration_us: int, on_fraction, should_stop, track=None, total_frames: int = 0,
+                on_stats=None):
+    """Run one ffmpeg command that reports ``-progress pipe:2``; returns (ok, error_text).
+
+    ``on_fraction`` gets this command's progress in 0..1 once per progress block (see
+    FfmpegProgress), and ``on_stats(proc, snapshot)`` the full parsed block. ``should_stop`` is
+    polled per line, and ``track(proc, running)`` lets the caller terminate the child on cancel.
+    """
+    proc = None
+    progress = FfmpegProgress(duration_us, total_frames)
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            universal_newlines=True,
+            errors="replace",
+            bufsize=1,
+        )
+        if track:
+            track(proc, True)
+        if proc.stderr:
+            for raw in proc.stderr:
+                if should_stop():
+                    _terminate_process(proc)
+                    return False, ""
+                snap = progress.feed(raw)
+                if snap is None:
+                    continue
+                on_fraction(snap["fraction"])
+                if on_stats:
+                    on_stats(proc, snap)
+        rc = proc.wait()
+        if should_stop():
+            return False, ""
+        if rc != 0:
+            err_tail = progress.err_tail
+            msg = "\n".join(err_tail[-60:]) if err_tail else f"ffmpeg exited with code {rc}"
+            return False, msg
+        on_fraction(1.0)
+        return True, ""
+    except Exception as e:
+        if should_stop():
+            return False, ""
+        return False, f"Failed to run ffmpeg: {e}"
+    finally:
+        if proc is not None and track:
+            track(proc, False)
+
+
+def _terminate_process(proc):
+    if proc is None or proc.poll() is not None:
+        return
+    try:
+        proc.terminate()
+    except Exception:
+        pass
+
+
+def _run_parallel_steps(group: List[dict], on_fraction, should_stop, track=None, on_stats=None):
+    """Run step dicts concurrently; the first failure stops the rest. Returns (ok, error_text)."""
+    weights = [max(1e-6, float(step["weight"])) for step in group]
+    weight_total = sum(weights)
+    fractions = [0.0] * len(group)
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def stopped() -> bool:
+        return should_stop() or bool(errors)
+
+    def report(i: int, fraction: float):
+        with lock:
+            fractions[i] = fraction
+            done = sum(f * w for f, w in zip(fractions, weights))
+        on_fraction(done / weight_total)
+
+    def run(i: int, step: dict):
+        ok, err = _run_ffmpeg(step["cmd"], step["duration_us"], lambda f: report(i, f), stopped, track,
+                              on_stats=on_stats)
+        if not ok and not should_stop():
+            with lock:
+                errors.append(err or "ffmpeg failed")
+
+    workers = [threading.Thread(target=run, args=(i, step), name=f"ExportChunk-{i}", daemon=True)
+               for i, step in enumerate(group)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    if errors:
+        return False, errors[0]
+    return not should_stop(), ""
+
+
+def _run_export_steps(task: dict, on_fraction, should_stop, track, on_stats):
+    smart = task.get("smart")
+    chunked = task.get("chunked")
+    work_dir = ""
+    try:
+        steps = None
+        if smart or chunked:
+            work_dir = tempfile.mkdtemp(prefix="svc_parts_", dir=os.path.dirname(task["out_path"]) or None)
+        if smart:
+            steps = _smart_cut_steps(smart["ffmpeg"], smart["video_path"], task["out_path"],
+                                     smart["start_sec"], smart["dur_sec"], smart["encode_args"], work_dir)
+        elif chunked:
+            steps = _chunked_encode_steps(chunked["ffmpeg"], chunked["video_path"], task["out_path"],
+                                          chunked["start_sec"], chunked["dur_sec"], chunked["encode_args"],
+                                          chunked["vf"], chunked["chunks"], work_dir)
+        if steps is None:
+            steps = [{"cmd": task["cmd"], "duration_us": int(task["duration_us"]), "weight": 1.0,
+                      "total_frames": int(task.get("progress_frames", 0))}]
+        weight_total = sum(s["weight"] for s in steps) or 1.0
+        done = 0.0
+        for step in steps:
+            if should_stop():
+                return False, ""
+            base, span = done / weight_total, step["weight"] / weight_total
+            step_fraction = lambda f, base=base, span=span: on_fraction(base + f * span)
+            if "parallel" in step:
+                ok, err = _run_parallel_steps(step["parallel"], step_fraction, should_stop, track, on_stats)
+            else:
+                ok, err = _run_ffmpeg(step["cmd"], step["duration_us"], step_fraction,
+                                      should_stop, track, step.get("total_frames", 0), on_stats)
+            if not ok:
+                return False, err
+            done += step["weight"]
+        return True, ""
+    except Exception as e:
+        if should_stop():
+            return False, ""
+        return False, f"Failed to run ffmpeg: {e}"
+    finally:
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _run_export_task(task: dict, on_fraction, should_stop, track=None, on_stats=None, stats: Optional[dict] = None):
+    """Run one export task dict: a single ``cmd``, or a ``smart``/``chunked`` plan with ``cmd`` as fallback.
+
+    A task with a ``prepare`` callable gets its remaining keys (``cmd``, plans, ``profile``)
+    from it right before it runs, so long batches do not hold every command up front.
+    Temporary pieces of a plan live in a work directory next to the output, removed
+    however the task ends. Every task, finished or not, appends a record to the export log
+    and to the VideoCatalog export history;
+    a finished task with a ``profile`` also feeds its speed to the ExportSpeedModel.
+    ``on_stats(proc, snapshot)`` sees each ffmpeg progress block, and ``stats`` receives the
+    logged record plus ``samples`` of (elapsed_sec, out_time_us, speed).
+    """
+    if task.get("prepare"):
+        task = dict(task["prepare"](), **{k: v for k, v in task.items() if k != "prepare"})
+    started = time.monotonic()
+    samples: list = []
+    procs: list = []
+
+    def tracked(proc, running: bool):
+        if running:
+            procs.append(proc)
+        if track:
+            track(proc, running)
+
+    def collect(proc, snap: dict):
+        samples.append((snap["elapsed"], snap["out_time_us"], snap["speed"]))
+        if on_stats:
+            on_stats(proc, snap)
+
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(task["out_path"])), exist_ok=True)
+    except OSError:
+        pass   # ffmpeg 가 쓰기 실패로 알려 준다
+    ok, err = _run_export_steps(task, on_fraction, should_stop, tracked, collect)
+    wall_sec = time.monotonic() - started
+    media_sec = int(task["duration_us"]) / 1_000_000.0
+    canceled = bool(should_stop())
+    # 취소로 종료된 프로세스는 returncode 가 없을 수 있다
+    failed_codes = [p.returncode for p in procs if p.returncode not in (None, 0)]
+    out_paths = task.get("out_paths") or [task["out_path"]]
+    profile = task.get("profile") or ""
+    record = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node() or "localhost",
+        "label": task.get("label", ""),
+        "mode": profile.split("|", 1)[0],
+        "profile": profile,
+        "input": task.get("input_path", ""),
+        "output": task["out_path"],
+        "input_bytes": _file_size(task.get("input_path", "")),
+        "output_bytes": sum(_file_size(path) for path in out_paths) if ok else 0,
+        "media_sec": round(media_sec, 3),
+        "wall_sec": round(wall_sec, 3),
+        "realtime_factor": round(media_sec / wall_sec, 3) if ok and wall_sec > 0 else None,
+        "processes": len(procs),
+        "exit_code": failed_codes[0] if failed_codes else (0 if ok else None),
+        "status": "ok" if ok else ("canceled" if canceled else "failed"),
+    }
+    _log_export_job(record)
+    try:
+        _video_catalog().record_export(record)
+    except (sqlite3.Error, OSError):
+        pass
+    if stats is not None:
+        stats.update(record, samples=samples)
+    if ok and profile:
+        _export_speed_model().record(profile, media_sec, wall_sec)
+    return ok, err
+
+
+BATCH_EXPORT_WORKERS = 0          # 0 = pick from the CPU count and the kind of work
+BATCH_COPY_WORKERS = 4            # stream-copy jobs are I/O bound; a few overlap well
+BATCH_X264_THREADS_PER_WORKER = 4  # libx264 stops scaling well past a handful of threads
+
+
+def _export_worker_plan(task_count: int, reencode_count: int, requested: int = 0):
+    """Return (workers, x264_threads) for a batch; x264_threads 0 leaves ffmpeg's default."""
+    cpus = os.cpu_count() or 1
+    if requested > 0:
+        workers = requested
+    elif reencode_count > 0:
+        workers = max(1, cpus // BATCH_X264_THREADS_PER_WORKER)
+    else:
+        workers = BATCH_COPY_WORKERS
+    workers = max(1, min(workers, task_count))
+    x264_threads = max(1, cpus // workers) if reencode_count > 0 and workers > 1 else 0
+    return workers, x264_threads
+
+
+def _export_task(settings: ExportSettings, ffmpeg: str, video_path: str, out_path: str, start_sec: float,
+                 dur_sec: float, video_width: int, video_height: int, fps: float, codec: str,
+                 x264_threads: int = 0) -> dict:
+    """Build the task dict one batch item runs (see ``_run_export_task``)."""
+    cmd, mode = _build_cut_command(settings, ffmpeg, video_path, out_path, start_sec, dur_sec,
+                                   video_width, video_height, x264_threads)
+    return {
+        "cmd": cmd,
+        "out_path": out_path,
+        "duration_us": max(1, int(max(0.001, float(dur_sec)) * 1_000_000.0)),
+        "label": os.path.basename(video_path),
+        "input_path": video_path,
+        "smart": _smart_cut_spec(ffmpeg, video_path, start_sec, dur_sec, x264_threads) if mode == "smart" else None,
+        "profile": _export_profile(mode, codec, video_width, video_height, fps),
+    }
+
+
+class BatchExportRunner:
+    """Run export task dicts (see ``_run_export_task``) on a pool of ``workers`` threads.
+
+    Callbacks are optional and run on the worker threads: ``on_progress(pct)`` with the
+    duration-weighted overall percentage whenever it changes, ``on_item(started, total, label)``
+    as a task starts, ``on_stats(totals)`` with throttled ExportMeter totals, and
+    ``on_result(task_idx, ok, error_text, record)`` with the export log record as a task ends.
+    ``run()`` blocks and returns an error text or None per task; ``stop()`` cancels from any thread.
+    """
+
+    def __init__(self, tasks: List[dict], workers: int = 1, on_progress=None, on_item=None, on_stats=None,
+                 on_result=None):
+        self.tasks = list(tasks)
+        self.workers = max(1, min(int(workers), len(self.tasks) or 1))
+        self.on_progress = on_progress
+        self.on_item = on_item
+        self.on_stats = on_stats
+        self.on_result = on_result
+        self._procs = set()
+        self._lock = threading.Lock()
+        self._next_task = 0
+        self._started = 0
+        # 작업별 진행률(0..1)을 길이로 가중해 전체 진행률 하나로 합친다
+        self._fractions = [0.0] * len(self.tasks)
+        self._weights = [max(1, int(t.get("duration_us", 1))) for t in self.tasks]
+        self._weight_total = float(sum(self._weights)) or 1.0
+        self._meter = ExportMeter()
+        self._last_pct = -1
+        self._stop = False
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop
+
+    def _set_fraction(self, task_idx: int, fraction: float):
+        with self._lock:
+            self._fractions[task_idx] = fraction
+            done = sum(f * w for f, w in zip(self._fractions, self._weights))
+            pct = max(0, min(100, int(done * 100 / self._weight_total)))
+            if pct == self._last_pct:
+                return
+            self._last_pct = pct
+        if self.on_progress:
+            self.on_progress(pct)
+
+    def _on_stats(self, proc, snap: dict):
+        totals = self._meter.update(proc.pid, snap)
+        if totals is not None and self.on_stats:
+            self.on_stats(totals)
+
+    def _track(self, proc, running: bool):
+        with self._lock:
+            if running:
+                self._procs.add(proc)
+            else:
+                self._procs.discard(proc)
+        if not running:
+            self._meter.drop(proc.pid)
+        if running and self._stop:
+            _terminate_process(proc)
+
+    def _run_one(self, task_idx: int, task: dict):
+        record: dict = {}
+        ok, err = _run_export_task(task, lambda f: self._set_fraction(task_idx, min(0.99, f)),
+                                   lambda: self._stop, self._track, self._on_stats, record)
+        # 실패한 작업도 전체 진행률에서는 끝난 것으로 친다
+        if not self._stop:
+            self._set_fraction(task_idx, 1.0)
+        if self.on_result:
+            self.on_result(task_idx, ok, err, record)
+        return ok, err
+
+    def _worker(self, results: List[Optional[str]]):
+        total = len(self.tasks)
+        while not self._stop:
+            with self._lock:
+                task_idx = self._next_task
+                if task_idx >= total:
+                    return
+                self._next_task += 1
+                self._started += 1
+                started = self._started
+            task = self.tasks[task_idx]
+            label = task.get("label", f"item {task_idx + 1}")
+            if self.on_item:
+                self.on_item(started, total, label)
+            ok, err = self._run_one(task_idx, task)
+            results[task_idx] = None if ok else f"[{label}] {err}"
+
+    def run(self) -> List[Optional[str]]:
+        results: List[Optional[str]] = [None] * len(self.tasks)
+        pool = [threading.Thread(target=self._worker, args=(results,), name=f"BatchExport-{i}", daemon=True)
+                for i in range(self.workers)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        return results
+
+    def stop(self):
+        self._stop = True
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            _terminate_process(proc)
+
+
+# --------------------------------- Proxies ---------------------------------
+PROXY_MAX_HEIGHT = 540
+PROXY_GOP = 8                               # any proxy frame is at most PROXY_GOP - 1 decodes from a keyframe
+PROXY_CACHE_MAX_BYTES = 8 * 1024 ** 3
+PROXY_HEAVY_PIXEL_RATE = 1920 * 1080 * 60   # decoded pixels per second above which a source gets a proxy
+PROXY_HEAVY_BITRATE = 60_000_000            # bits per second
+PROXY_HEAVY_CODECS = ("hevc", "hev1", "hvc1", "h265", "x265", "av01", "av1", "vp09", "vp9", "apch", "apcn", "ap4h")
+
+
+def _proxy_recommended(video_path: str, meta: Optional[dict]) -> bool:
+    """Whether previewing ``video_path`` from a proxy is worth it: high pixel rate, heavy codec or bitrate."""
+    if not meta or meta.get("height", 0) <= PROXY_MAX_HEIGHT:
+        return False
+    if meta["width"] * meta["height"] * meta["fps"] > PROXY_HEAVY_PIXEL_RATE:
+        return True
+    if (meta.get("codec") or "").lower() in PROXY_HEAVY_CODECS:
+        return True
+    try:
+        bitrate = os.path.getsize(video_path) * 8 / max(1e-3, meta.get("duration", 0))
+    except OSError:
+        return False
+    return bitrate > PROXY_HEAVY_BITRATE
+
+
+def _proxy_command(ffmpeg: str, video_path: str, out_path: str) -> List[str]:
+    # 원본과 프레임이 1:1 로 대응해야 하므로 passthrough 로 프레임을 더하거나 빼지 않는다
+    return [
+        ffmpeg, "-y", "-hide_banner", "-nostdin", "-i", video_path,
+        "-map", "0:v:0", "-an", "-sn", "-dn",
+        "-vf", f"scale=-2:'min({PROXY_MAX_HEIGHT},ih)':flags=bilinear", "-fps_mode", "passthrough",
+        "-c:v", "libx264", "-preset", "veryfast", "-tune", "fastdecode", "-crf", "26",
+        "-g", str(PROXY_GOP), "-bf", "0", "-pix_fmt", "yuv420p", "-movflags", "+faststart",
+        "-progress", "pipe:2", "-nostats", out_path,
+    ]
+
+
+def _evict_lru(folder: str, max_bytes: int, matches, keep: List[str]):
+    """Delete files of ``folder`` whose name ``matches``, least recently modified first, down to ``max_bytes``.
+
+    Files sharing a stem (``abc.thumbs.npy``/``abc.flags.npy``) count and go together.
+    """
+    groups = {}
+    for entry in os.scandir(folder):
+        if entry.is_file() and matches(entry.name):
+            st = entry.stat()
+            group = groups.setdefault(entry.name.split(".", 1)[0], [0.0, 0, []])
+            group[0] = max(group[0], st.st_mtime)
+            group[1] += st.st_size
+            group[2].append(entry.path)
+    kept = {os.path.normcase(p) for p in keep}
+    total = sum(g[1] for g in groups.values())
+    for _, size, paths in sorted(groups.values()):
+        if total <= max_bytes:
+            break
+        if any(os.path.normcase(p) in kept for p in paths):
+            continue
+        try:
+            for path in paths:
+                os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+class ProxyCache:
+    """Low-resolution, short-GOP copies of heavy sources, used for preview only.
+
+    A proxy has exactly the frames of its source (same count and order), so frame
+    indices, crop rectangles and export commands keep referring to the original. Files
+    are named by ``_file_identity`` of the source and evicted least recently used first
+    once the folder exceeds ``max_bytes``.
+    """
+
+    def __init__(self, folder: Optional[str] = None, max_bytes: int = PROXY_CACHE_MAX_BYTES):
+        self.folder = folder or _cache_dir("proxy")
+        self.max_bytes = int(max_bytes)
+
+    def path_for(self, video_path: str) -> str:
+        return os.path.join(self.folder, _file_identity(video_path) + ".mp4")
+
+    def ready_path(self, video_path: str) -> Optional[str]:
+        """Proxy of an unchanged source if one was built, marking it as recently used."""
+        try:
+            path = self.path_for(video_path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def build(self, ffmpeg: str, video_path: str, on_fraction, should_stop, track=None):
+        """Encode the proxy of ``video_path``; returns (proxy_path or None, error_text)."""
+        meta = _video_probe().probe(video_path)
+        if not meta:
+            return None, "failed to read video metadata."
+        path = self.path_for(video_path)
+        tmp_path = path[:-len(".mp4")] + ".part.mp4"
+        duration_us = max(1, int(meta["duration"] * 1_000_000))
+        ok, err = _run_ffmpeg(_proxy_command(ffmpeg, video_path, tmp_path), duration_us, on_fraction,
+                              should_stop, track, total_frames=meta["frames"])
+        if ok:
+            proxy = _probe_video_file(tmp_path)
+            if not proxy or abs(proxy["frames"] - meta["frames"]) > 1:
+                ok, err = False, "proxy frame count does not match the source."
+        if not ok:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None, err
+        try:
+            os.replace(tmp_path, path)
+        except OSError as e:
+            return None, str(e)
+        self.evict(keep=path)
+        return path, ""
+
+    def evict(self, keep: Optional[str] = None):
+        _evict_lru(self.folder, self.max_bytes, lambda name: name.endswith(".mp4") and not name.endswith(".part.mp4"),
+                   [keep] if keep else [])
+
+
+# ----------------------------- Thumbnail store -----------------------------
+THUMB_STORE_WIDTH = 256
+THUMB_STORE_MAX_MB = 384        # per video; the stride grows until a long video fits
+THUMB_CACHE_MAX_MB = 4096       # all stores together, least recently used evicted first
+THUMB_EMPTY, THUMB_FILLED, THUMB_PAST_END, THUMB_KEYFRAME = 0, 1, 2, 3
+THUMB_BUILD_NICE = 10           # background decoders yield the CPU to the preview
+
+
+class ThumbnailStore:
+    """Small BGR frames of one video in an on-disk numpy memmap, for scrubbing without a decoder.
+
+    Slot ``s`` holds frame ``s * stride``; ``stride`` is 1 unless the video would not fit in
+    ``THUMB_STORE_MAX_MB``. ``build_keyframes()`` first drops the keyframes into their slots for a
+    coarse overview; ``build()`` then fills every slot in one ffmpeg pass and can be stopped and
+    resumed later. ``frame_at()`` may be called from other threads while it runs: a slot's
+    flag is set only after its pixels are written. Files are keyed by ``_file_identity``.
+    """
+
+    def __init__(self, video_path: str, frames: int, width: int, height: int, folder: Optional[str] = None):
+        self.folder = folder or _cache_dir("thumbs")
+        base = os.path.join(self.folder, _file_identity(video_path))
+        self.width = max(2, min(THUMB_STORE_WIDTH, width) // 2 * 2)
+        self.height = max(2, int(round(height * self.width / float(max(1, width)) / 2.0)) * 2)
+        frame_bytes = self.width * self.height * 3
+        self.stride = max(1, math.ceil(max(1, frames) * frame_bytes / (THUMB_STORE_MAX_MB * 1024 * 1024)))
+        self.slots = max(1, math.ceil(max(1, frames) / self.stride))
+        shape = (self.slots, self.height, self.width, 3)
+        self.pixels_path = base + ".thumbs.npy"
+        self.flags_path = base + ".flags.npy"
+        try:
+            self.pixels = np.load(self.pixels_path, mmap_mode="r+")
+            self.flags = np.load(self.flags_path, mmap_mode="r+")
+            if self.pixels.shape != shape or self.flags.shape != (self.slots,):
+                raise ValueError("thumbnail store layout changed")
+            os.utime(self.flags_path)
+        except Exception:
+            _evict_lru(self.folder, THUMB_CACHE_MAX_MB * 1024 * 1024 - self.slots * frame_bytes,
+                       lambda name: name.endswith(".npy"), [])
+            self.pixels = np.lib.format.open_memmap(self.pixels_path, mode="w+", dtype=np.uint8, shape=shape)
+            self.flags = np.lib.format.open_memmap(self.flags_path, mode="w+", dtype=np.uint8, shape=(self.slots,))
+
+    @property
+    def complete(self) -> bool:
+        return not bool(((self.flags == THUMB_EMPTY) | (self.flags == THUMB_KEYFRAME)).any())
+
+    @property
+    def has_keyframes(self) -> bool:
+        return bool(np.count_nonzero(self.flags))
+
+    @property
+    def fraction(self) -> float:
+        """Share of slots holding their exact frame (or known to lie past the end)."""
+        return float(np.count_nonzero((self.flags == THUMB_FILLED) | (self.flags == THUMB_PAST_END))) / self.slots
+
+    def frame_at(self, frame_idx: int, nearest: bool = False):
+        """(frame index, BGR thumbnail view) of the stored frame at or before ``frame_idx``, or None.
+
+        With ``nearest`` the closest earlier slot holding anything, a keyframe from
+        ``build_keyframes()`` included, is used instead of only the exact slot.
+        """
+        slot = int(frame_idx) // self.stride
+        if not 0 <= slot < self.slots:
+            return None
+        if self.flags[slot] == THUMB_FILLED:
+            return slot * self.stride, self.pixels[slot]
+        if not nearest:
+            return None
+        usable = np.flatnonzero((self.flags[:slot + 1] == THUMB_FILLED) | (self.flags[:slot + 1] == THUMB_KEYFRAME))
+        if not len(usable):
+            return None
+        slot = int(usable[-1])
+        return slot * self.stride, self.pixels[slot]
+
+    def _start_decoder(self, cmd: List[str], track, on_stderr_line=None):
+        """Start a background ffmpeg below normal priority; returns (proc, stderr tail, stderr thread)."""
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = getattr(subprocess, "BELOW_NORMAL_PRIORITY_CLASS", 0)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
+        if os.name != "nt":
+            try:
+                os.setpriority(os.PRIO_PROCESS, proc.pid, THUMB_BUILD_NICE)
+            except (AttributeError, OSError):
+                pass
+        if track:
+            track(proc, True)
+        err_tail = collections.deque(maxlen=20)
+
+        def drain():
+            # stderr 가 가득 차 ffmpeg 가 멈추지 않도록 따로 비운다
+            for line in proc.stderr:
+                if on_stderr_line is None or not on_stderr_line(line):
+                    err_tail.append(line)
+
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        return proc, err_tail, reader
+
+    def _read_frame(self, proc, target: memoryview) -> bool:
+        got = 0
+        while got < len(target):
+            n = proc.stdout.readinto(target[got:])
+            if not n:
+                return False
+            got += n
+        return True
+
+    @staticmethod
+    def _error_text(proc, err_tail) -> str:
+        msg = b"".join(err_tail).decode("utf-8", "replace").strip()
+        return msg or f"ffmpeg exited with code {proc.returncode}"
+
+    def _rawvideo_command(self, ffmpeg: str, decode_path: str, input_args: List[str], vf: str) -> List[str]:
+        return [ffmpeg, "-nostdin", *input_args, "-i", decode_path, "-map", "0:v:0", "-an", "-sn",
+                "-vf", f"{vf}scale={self.width}:{self.height}:flags=area", "-fps_mode", "passthrough",
+                "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"]
+
+    def build_keyframes(self, ffmpeg: str, decode_path: str, fps: float, should_stop, track=None):
+        """Quick first pass: decode only the keyframes, each into the empty slot it falls in.
+
+        Keyframes are a few percent of the frames, so a coarse picture of the whole video is
+        ready long before ``build()`` reaches the end. Returns (ok, error_text).
+        """
+        cmd = self._rawvideo_command(ffmpeg, decode_path, ["-v", "info", "-skip_frame", "nokey"], "showinfo,")
+        times = queue.Queue()
+
+        def on_line(line: bytes) -> bool:
+            pos = line.find(b"pts_time:")
+            if pos < 0 or b"showinfo" not in line:
+                return False
+            try:
+                times.put(float(line[pos + 9:].split()[0]))
+            except (ValueError, IndexError):
+                times.put(None)
+            return True
+
+        scratch = bytearray(self.width * self.height * 3)
+        proc = None
+        first_time = None
+        try:
+            proc, err_tail, reader = self._start_decoder(cmd, track, on_line)
+            while not should_stop() and self._read_frame(proc, memoryview(scratch)):
+                try:
+                    pts_time = times.get(timeout=5.0)
+                except queue.Empty:
+                    break
+                if pts_time is None:
+                    continue
+                if first_time is None:
+                    first_time = pts_time
+                slot = int(round((pts_time - first_time) * fps)) // self.stride
+                if 0 <= slot < self.slots and self.flags[slot] == THUMB_EMPTY:
+                    self.pixels[slot] = np.frombuffer(scratch, np.uint8).reshape(self.height, self.width, 3)
+                    self.flags[slot] = THUMB_KEYFRAME
+            if should_stop():
+                _terminate_process(proc)
+                return False, ""
+            proc.wait()
+            reader.join(1.0)
+            if proc.returncode not in (0, None):
+                return False, self._error_text(proc, err_tail)
+            return True, ""
+        except Exception as e:
+            if proc is not None:
+                _terminate_process(proc)
+            return False, str(e)
+        finally:
+            self.pixels.flush()
+            self.flags.flush()
+            if proc is not None and track:
+                track(proc, False)
+
+    def build(self, ffmpeg: str, decode_path: str, should_stop, on_fraction=None, track=None):
+        """Decode ``decode_path`` (the source, or its proxy: same frames) into the slots not yet filled.
+
+        Returns (ok, error_text). Filled slots are read past, not rewritten; keyframe slots are
+        replaced by the exact frame.
+        """
+        select = f"select='not(mod(n,{self.stride}))'," if self.stride > 1 else ""
+        cmd = self._rawvideo_command(ffmpeg, decode_path, ["-v", "error"], select)
+        scratch = bytearray(self.width * self.height * 3)
+        proc = None
+        slot = 0
+        try:
+            proc, err_tail, reader = self._start_decoder(cmd, track)
+            last_report = -1
+            while slot < self.slots and not should_stop():
+                done = self.flags[slot] in (THUMB_FILLED, THUMB_PAST_END)
+                if not done:
+                    self.flags[slot] = THUMB_EMPTY   # 덮어쓰는 동안 키프레임 그림을 읽지 않게 한다
+                target = memoryview(scratch) if done else memoryview(self.pixels[slot]).cast("B")
+                if not self._read_frame(proc, target):
+                    break
+                if not done:
+                    self.flags[slot] = THUMB_FILLED
+                slot += 1
+                pct = slot * 100 // self.slots
+                if on_fraction and pct != last_report:
+                    last_report = pct
+                    on_fraction(slot / self.slots)
+            if should_stop():
+                _terminate_process(proc)
+                return False, ""
+            if slot >= self.slots:
+                _terminate_process(proc)   # 프레임 수 추정치보다 긴 영상: 나머지는 필요 없다
+            proc.wait()
+            reader.join(1.0)
+            if slot < self.slots and proc.returncode not in (0, None):
+                return False, self._error_text(proc, err_tail)
+            # 프레임 수 추정치보다 영상이 짧으면 남은 칸은 끝 이후로 표시해 다시 만들지 않는다
+            rest = self.flags[slot:]
+            rest[(rest == THUMB_EMPTY) | (rest == THUMB_KEYFRAME)] = THUMB_PAST_END
+            return True, ""
+        except Exception as e:
+            if proc is not None:
+                _terminate_process(proc)
+            return False, str(e)
+        finally:
+            self.pixels.flush()
+            self.flags.flush()
+            if proc is not None and track:
+                track(proc, False)
+
+
+# ------------------------------ Video catalog ------------------------------
+CATALOG_WRITE_BATCH = 500       # files written per transaction (and per lock hold) during a scan or probe
+
+
+def _parse_catalog_query(text: str) -> dict:
+    """Parse a catalog query: words match anywhere in the relative path, and these narrow it down:
+
+    ``1080p`` (also ``>=720p``, ``<1080p``), ``under:subject_12`` (a folder at any depth, or a
+    relative path prefix like ``2024-05/subject_12``), ``codec:hevc``, ``ext:mkv``, and
+    ``exported`` / ``unexported`` for the export history.
+    """
+    try:
+        tokens = shlex.split(text or "")
+    except ValueError:
+        tokens = (text or "").split()
+    query = {"words": [], "height": [], "under": [], "codec": [], "ext": [], "exported": None}
+    for token in tokens:
+        low = token.lower()
+        key, sep, value = low.partition(":")
+        op = next((o for o in (">=", "<=", ">", "<", "=") if low.startswith(o)), "")
+        number = low[len(op):]
+        if number.endswith("p") and number[:-1].isdigit():
+            query["height"].append((op or "=", int(number[:-1])))
+        elif sep and value and key in ("under", "codec", "ext"):
+            if key == "under":
+                value = token.partition(":")[2].replace("\\", "/").strip("/").lower()
+            query[key].append(value.lstrip(".") if key == "ext" else value)
+        elif low in ("exported", "unexported"):
+            query["exported"] = low == "exported"
+        else:
+            query["words"].append(low)
+    return query
+
+
+def _catalog_match(query: dict, rel_path: str, meta: Optional[dict], exported: bool) -> bool:
+    """Whether one file (path relative to the listed folder) satisfies a parsed catalog query."""
+    rel = rel_path.replace("\\", "/").lower()
+    if any(word not in rel for word in query["words"]):
+        return False
+    if query["exported"] is not None and exported != query["exported"]:
+        return False
+    folder = "/" + rel.rsplit("/", 1)[0] + "/" if "/" in rel else "/"
+    for under in query["under"]:
+        if not (rel.startswith(under + "/") or f"/{under}/" in folder):
+            return False
+    if query["ext"] and os.path.splitext(rel)[1].lstrip(".") not in query["ext"]:
+        return False
+    if query["codec"] or query["height"]:
+        if not meta:
+            return False
+        codec = (meta.get("codec") or "").lower()
+        if query["codec"] and not any(codec.startswith(c) for c in query["codec"]):
+            return False
+        height = int(meta.get("height") or 0)
+        checks = {"=": height.__eq__, ">=": height.__ge__, "<=": height.__le__, ">": height.__gt__, "<": height.__lt__}
+        if not all(checks[op](value) for op, value in query["height"]):
+            return False
+    return True
+
+
+class VideoCatalog:
+    """Persistent sqlite catalog of the video files under scanned folders, with metadata and export history.
+
+    ``scan()`` walks a folder tree and only lists directories whose modification time changed
+    since the last scan (a file added, removed or renamed in it); unchanged directories are
+    skipped and their subdirectories taken from the catalog. A file rewritten in place keeps
+    its directory's time, so ``full=True`` restats everything. ``probe_missing()`` fills the
+    metadata columns through the shared VideoProbe, and every finished export is recorded by
+    ``record_export()`` (called from ``_run_export_task``). Safe to use from several threads.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER, exts TEXT)",
+        "CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent)",
+        "CREATE TABLE IF NOT EXISTS videos (path TEXT PRIMARY KEY, dir TEXT, size INTEGER, mtime_ns INTEGER,"
+        " probed INTEGER DEFAULT 0, width INTEGER, height INTEGER, fps REAL, frames INTEGER, duration REAL,"
+        " codec TEXT)",
+        "CREATE INDEX IF NOT EXISTS videos_dir ON videos(dir)",
+        "CREATE TABLE IF NOT EXISTS exports (id INTEGER PRIMARY KEY, input TEXT, output TEXT, mode TEXT,"
+        " time TEXT, status TEXT)",
+        "CREATE INDEX IF NOT EXISTS exports_input ON exports(input)",
+    )
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(_cache_dir("catalog"), "catalog.sqlite3")
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        with self._lock, self._db:
+            for statement in self.SCHEMA:
+                self._db.execute(statement)
+
+    @staticmethod
+    def _under(column: str, root: str):
+        """SQL condition (and its arguments) for rows of ``column`` inside folder ``root``."""
+        prefix = os.path.join(root, "")
+        return f"({column} = ? OR substr({column}, 1, ?) = ?)", (root, len(prefix), prefix)
+
+    def _forget_tree(self, folder: str):
+        cond, args = self._under("path", folder)
+        self._db.execute(f"DELETE FROM dirs WHERE {cond}", args)
+        cond, args = self._under("dir", folder)
+        self._db.execute(f"DELETE FROM videos WHERE {cond}", args)
+
+    def scan(self, root: str, recursive: bool = True, extensions=VIDEO_EXTENSIONS, full: bool = False,
+             should_stop=None, on_progress=None, on_files=None) -> dict:
+        """Bring the catalog up to date for ``root``; returns counts of listed/skipped dirs and file changes.
+
+        ``on_progress(dirs_done)`` is called after each directory, and ``on_files(folder, entries)``
+        with every batch of (path, size, mtime_ns) as it is written, so callers can show a
+        first listing while it runs; skipped directories hand over their cataloged files.
+        Folders are listed without the lock, which is only held per batch of writes, so
+        ``record_export()`` never waits long. Symlinked folders are not followed.
+        """
+        root = os.path.abspath(root)
+        exts = ",".join(sorted(e.lower() for e in extensions))
+        stats = {"listed": 0, "skipped": 0, "added": 0, "updated": 0, "removed": 0}
+        stopped = lambda: bool(should_stop and should_stop())
+        pending = [root]
+        while pending and not stopped():
+            self._scan_dir(pending.pop(), exts, full, recursive, pending, stats, stopped, on_files)
+            if on_progress:
+                on_progress(stats["listed"] + stats["skipped"])
+        return stats
+
+    def _scan_dir(self, folder: str, exts: str, full: bool, recursive: bool, pending: list, stats: dict,
+                  stopped, on_files):
+        db = self._db
+        try:
+            st = os.stat(folder)
+        except OSError:
+            with self._lock, db:
+                self._forget_tree(folder)
+            return
+        with self._lock:
+            known = db.execute("SELECT mtime_ns, exts FROM dirs WHERE path = ?", (folder,)).fetchone()
+            children = [row[0] for row in db.execute("SELECT path FROM dirs WHERE parent = ?", (folder,))]
+            skip = known == (st.st_mtime_ns, exts) and not full
+            old = {}
+            if not skip or on_files:
+                old = {path: (size, mtime) for path, size, mtime in
+                       db.execute("SELECT path, size, mtime_ns FROM videos WHERE dir = ?", (folder,))}
+        if skip:
+            stats["skipped"] += 1
+            entries = [(path, size, mtime) for path, (size, mtime) in old.items()]
+            for i in range(0, len(entries), CATALOG_WRITE_BATCH):
+                on_files(folder, entries[i:i + CATALOG_WRITE_BATCH])
+            if recursive:
+                pending.extend(children)
+            return
+
+        seen, subdirs, batch = set(), [], []
+        suffixes = tuple(exts.split(","))
+
+        def flush():
+            writes = [(path, size, mtime) for path, size, mtime in batch if old.get(path) != (size, mtime)]
+            if writes:
+                with self._lock, db:
+                    for path, size, mtime in writes:
+                        if path not in old:
+                            db.execute("INSERT INTO videos (path, dir, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                                       (path, folder, size, mtime))
+                            stats["added"] += 1
+                        else:
+                            # 내용이 바뀐 파일은 메타데이터를 다시 읽는다
+                            db.execute("UPDATE videos SET size = ?, mtime_ns = ?, probed = 0, width = NULL,"
+                                       " height = NULL, fps = NULL, frames = NULL, duration = NULL, codec = NULL"
+                                       " WHERE path = ?", (size, mtime, path))
+                            stats["updated"] += 1
+            if on_files:
+                on_files(folder, list(batch))
+            batch.clear()
+
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                            est = entry.stat()
+                            batch.append((entry.path, est.st_size, est.st_mtime_ns))
+                            seen.add(entry.path)
+                    except OSError:
+                        continue
+                    if len(batch) >= CATALOG_WRITE_BATCH:
+                        flush()
+                        if stopped():
+                            # 다 훑지 못한 폴더는 시간을 기록하지 않아 다음 스캔에서 다시 나열된다
+                            return
+        except OSError:
+            return
+        flush()
+        with self._lock, db:
+            for path in old.keys() - seen:
+                db.execute("DELETE FROM videos WHERE path = ?", (path,))
+                stats["removed"] += 1
+            for gone in set(children) - set(subdirs):
+                self._forget_tree(gone)
+            # 아직 훑지 않은 하위 폴더도 자리를 만들어 두어, 나중의 재귀 스캔이 찾아갈 수 있게 한다
+            db.executemany("INSERT OR IGNORE INTO dirs (path, parent) VALUES (?, ?)", [(d, folder) for d in subdirs])
+            db.execute("INSERT OR REPLACE INTO dirs (path, parent, mtime_ns, exts) VALUES (?, ?, ?, ?)",
+                       (folder, os.path.dirname(folder), st.st_mtime_ns, exts))
+        stats["listed"] += 1
+        if recursive:
+            pending.extend(subdirs)
+
+    def is_indexed(self, root: str) -> bool:
+        """Whether ``root`` itself was listed by an earlier scan (its files can be shown before rescanning)."""
+        with self._lock:
+            row = self._db.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (os.path.abspath(root),)).fetchone()
+        return bool(row and row[0] is not None)
+
+    def probe_missing(self, root: str, recursive: bool = True, on_result=None, should_stop=None) -> int:
+        """Read metadata of the cataloged files under ``root`` that have none yet; returns how many were read.
+
+        ``on_result(path, meta)`` as in ``VideoProbe.probe_many``.
+        """
+        root = os.path.abspath(root)
+        cond, args = self._under("dir", root) if recursive else ("dir = ?", (root,))
+        with self._lock:
+            paths = [row[0] for row in self._db.execute(f"SELECT path FROM videos WHERE probed = 0 AND {cond}", args)]
+        if not paths:
+            return 0
+
+        pending = []
+
+        def flush():
+            # 배치마다 커밋해 다른 연결(과 record_export)이 쓰기 잠금을 기다리지 않게 한다
+            if pending:
+                with self._lock, self._db:
+                    self._db.executemany("UPDATE videos SET probed = 1, width = ?, height = ?, fps = ?, frames = ?,"
+                                         " duration = ?, codec = ? WHERE path = ?", pending)
+                pending.clear()
+
+        def store(path: str, meta):
+            values = (meta["width"], meta["height"], meta["fps"], meta["frames"], meta.get("duration"),
+                      meta.get("codec")) if meta else (None,) * 6
+            pending.append((*values, path))
+            if len(pending) >= CATALOG_WRITE_BATCH:
+                flush()
+            if on_result:
+                on_result(path, meta)
+
+        try:
+            _video_probe().probe_many(paths, store, should_stop)
+        finally:
+            flush()
+        return len(paths)
+
+    def files(self, root: str, recursive: bool = True) -> List[dict]:
+        """Cataloged files under ``root``: path, rel (to root), size, mtime, meta (None if unread/unreadable), exported."""
+        root = os.path.abspath(root)
+        cond, args = self._under("v.dir", root) if recursive else ("v.dir = ?", (root,))
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT v.path, v.size, v.mtime_ns, v.probed, v.width, v.height, v.fps, v.frames, v.duration, v.codec,"
+                " EXISTS (SELECT 1 FROM exports e WHERE e.input = v.path AND e.status = 'ok')"
+                f" FROM videos v WHERE {cond} ORDER BY v.path", args).fetchall()
+        out = []
+        for path, size, mtime_ns, probed, width, height, fps, frames, duration, codec, exported in rows:
+            meta = None
+            if probed and width:
+                meta = {"width": width, "height": height, "fps": fps, "frames": frames,
+                        "duration": duration or 0.0, "codec": codec or ""}
+            out.append({"path": path, "rel": os.path.relpath(path, root), "size": size, "mtime": mtime_ns / 1e9,
+                        "meta": meta, "probed": bool(probed), "exported": bool(exported)})
+        return out
+
+    def query(self, root: str, text: str, recursive: bool = True) -> List[dict]:
+        """``files()`` filtered by a catalog query (see ``_parse_catalog_query``)."""
+        query = _parse_catalog_query(text)
+        return [f for f in self.files(root, recursive) if _catalog_match(query, f["rel"], f["meta"], f["exported"])]
+
+    def exported_under(self, root: str) -> set:
+        """Paths under ``root`` (any depth) with at least one successful export on record."""
+        cond, args = self._under("input", os.path.abspath(root))
+        with self._lock:
+            return {row[0] for row in self._db.execute(
+                f"SELECT DISTINCT input FROM exports WHERE status = 'ok' AND {cond}", args)}
+
+    def record_export(self, record: dict):
+        """Add one export log record (see ``_run_export_task``) to the history."""
+        if not record.get("input"):
+            return
+        with self._lock, self._db:
+            self._db.execute("INSERT INTO exports (input, output, mode, time, status) VALUES (?, ?, ?, ?, ?)",
+                             (os.path.abspath(record["input"]), record.get("output", ""), record.get("mode", ""),
+                              record.get("time", ""), record.get("status", "")))
+
+
+_video_catalog_instance: Optional[VideoCatalog] = None
+_video_catalog_lock = threading.Lock()
+
+
+def _video_catalog() -> VideoCatalog:
+    global _video_catalog_instance
+    with _video_catalog_lock:
+        if _video_catalog_instance is None:
+            _video_catalog_instance = VideoCatalog()
+        return _video_catalog_instance
+
+
+# -------------------------------- Manifests --------------------------------
+MANIFEST_COLUMNS = ("file", "start", "end", "duration", "unit", "crop", "crop_size",
+                    "contrast", "brightness", "saturation", "mode", "out")
+MANIFEST_RESULT_COLUMNS = ("row", "file", "output", "status", "error", "wall_sec", "realtime_factor",
+                           "output_bytes")
+
+
+def _range_state(has_start: bool, has_duration: bool, has_end: bool) -> Optional[int]:
+    """ExportSettings.range_state for the given inputs, or None unless exactly two (or none) are set."""
+    states = {(False, False, False): 0, (True, True, False): 1, (False, True, True): 2, (True, False, True): 3}
+    return states.get((has_start, has_duration, has_end))
+
+
+def _parse_numbers(text: str, count: int, what: str) -> List[float]:
+    parts = [p for p in str(text).replace("x", ",").replace(":", ",").split(",") if p.strip()]
+    if len(parts) != count:
+        raise ValueError(f"{what} needs {count} values, got {text!r}")
+    try:
+        return [float(p) for p in parts]
+    except ValueError:
+        raise ValueError(f"{what} must be numbers, got {text!r}")
+
+
+def _parse_crop_rect(text: str):
+    """"L,T,R,B" as fractions of the frame -> normalized crop rect."""
+    rect = tuple(_parse_numbers(text, 4, "crop"))
+    if not all(0.0 <= v <= 1.0 for v in rect):
+        raise ValueError("crop values are fractions of the frame between 0 and 1")
+    return rect
+
+
+def _parse_crop_size(text: str):
+    """"WxH" in pixels -> (width, height)."""
+    width, height = _parse_numbers(text, 2, "crop size")
+    return int(width), int(height)
+
+
+def _manifest_frame(value: str, fps: float) -> int:
+    # 숫자만 있으면 프레임 번호, "12.5s" 처럼 s 가 붙으면 초
+    text = str(value).strip().lower()
+    if text.endswith("s"):
+        return int(round(float(text[:-1]) * fps))
+    return int(float(text))
+
+
+def _load_manifest(path: str) -> List[dict]:
+    """Rows of a CSV (with a header) or JSON (a list of objects, or {"rows": [...]}) manifest.
+
+    Keys are lower-cased and empty values dropped; see MANIFEST_COLUMNS for what a row may set.
+    Raises ValueError for unreadable files or unknown columns.
+    """
+    try:
+        if path.lower().endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            raw_rows = data.get("rows", []) if isinstance(data, dict) else data
+            if not isinstance(raw_rows, list) or not all(isinstance(r, dict) for r in raw_rows):
+                raise ValueError("a JSON manifest is a list of objects or {\"rows\": [...]}")
+        else:
+            with open(path, "r", encoding="utf-8-sig", newline="") as f:
+                raw_rows = list(csv.DictReader(f))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError, csv.Error) as e:
+        raise ValueError(f"Cannot read manifest: {e}")
+    rows = []
+    for raw in raw_rows:
+        row = {str(k).strip().lower(): v for k, v in raw.items() if k is not None}
+        rows.append({k: v for k, v in row.items() if v is not None and str(v).strip() != ""})
+    unknown = sorted({k for row in rows for k in row} - set(MANIFEST_COLUMNS))
+    if unknown:
+        raise ValueError(f"Unknown manifest column(s): {', '.join(unknown)} "
+                         f"(expected {', '.join(MANIFEST_COLUMNS)})")
+    return rows
+
+
+def _row_settings(row: dict, base: ExportSettings, fps: float) -> ExportSettings:
+    """Settings for one manifest row; columns it leaves out keep the ``base`` values. Raises ValueError."""
+    settings = copy.copy(base)
+    has = [key in row for key in ("start", "duration", "end")]
+    if any(has):
+        state = _range_state(*has)
+        if state is None:
+            raise ValueError("give exactly two of start/duration/end")
+        settings.range_state = state
+        settings.start_frame = _manifest_frame(row["start"], fps) if "start" in row else None
+        settings.end_frame = _manifest_frame(row["end"], fps) if "end" in row else None
+        settings.duration = float(row.get("duration", 0.0))
+        settings.duration_unit = row.get("unit") or base.duration_unit
+        if settings.duration_unit not in DURATION_UNITS:
+            raise ValueError(f"unit must be one of {', '.join(DURATION_UNITS)}")
+    if "crop" in row:
+        settings.crop_rect = _parse_crop_rect(row["crop"])
+    if "crop_size" in row:
+        settings.crop_size = _parse_crop_size(row["crop_size"])
+        if settings.crop_rect is None:
+            settings.crop_rect = (0.0, 0.0, 1.0, 1.0)
+    for key in ("contrast", "brightness", "saturation"):
+        if key in row:
+            setattr(settings, key, float(row[key]))
+    if not (0.0 <= settings.contrast <= 2.0 and 0.0 <= settings.saturation <= 2.0 and -1.0 <= settings.brightness <= 1.0):
+        raise ValueError("adjustments out of range (contrast/saturation 0..2, brightness -1..1)")
+    if "mode" in row:
+        settings.mode = str(row["mode"]).strip().lower()
+        if settings.mode not in EXPORT_MODES:
+            raise ValueError(f"mode must be one of {', '.join(EXPORT_MODES)}")
+    return settings
+
+
+def _manifest_files(rows: List[dict], manifest_dir: str) -> List[str]:
+    """Input path of each row, resolved against the manifest folder; "" where the row has none."""
+    return [os.path.normpath(os.path.join(manifest_dir, str(r["file"]))) if r.get("file") else "" for r in rows]
+
+
+def _validate_manifest(rows: List[dict], base: ExportSettings, manifest_dir: str, overwrite: bool = False):
+    """Check every row before anything runs. Returns (items, invalid).
+
+    ``items`` are light dicts (row, file, settings, out_path, range and video metadata) for the
+    rows that can run; ``invalid`` lists (row, file, error). Rows are numbered from 1 as in the
+    file. Relative paths resolve against the manifest folder. A row without ``out`` is named
+    like any batch output; when several rows would get the same name, the row number is added.
+    """
+    files = _manifest_files(rows, manifest_dir)
+    metas = {p: _meta_tuple(m) for p, m in _video_probe().probe_many([f for f in files if f]).items()}
+    items: List[dict] = []
+    invalid: List[tuple] = []
+    for n, (row, path) in enumerate(zip(rows, files), start=1):
+        if not path:
+            invalid.append((n, "", "missing file column"))
+            continue
+        if not os.path.isfile(path):
+            invalid.append((n, path, "file not found"))
+            continue
+        meta = metas.get(path)
+        if not meta:
+            invalid.append((n, path, "failed to read video metadata"))
+            continue
+        fps, total_frames, width, height, codec = meta
+        try:
+            settings = _row_settings(row, base, fps)
+        except ValueError as e:
+            invalid.append((n, path, str(e)))
+            continue
+        res, err = _resolve_cut_range(settings, fps, total_frames)
+        if not err:
+            _, err = _crop_filter(settings, width, height)
+        if err:
+            invalid.append((n, path, err))
+            continue
+        out_path = row.get("out")
+        if out_path:
+            out_path = os.path.normpath(os.path.join(settings.out_dir or manifest_dir, out_path))
+        items.append({
+            "row": n, "file": path, "settings": settings, "out_path": out_path or _output_path(settings, path),
+            "named": bool(out_path), "start_sec": res["start_sec"], "dur_sec": res["dur_sec"],
+            "width": width, "height": height, "fps": fps, "codec": codec,
+        })
+
+    # 같은 이름이 겹치는 자동 이름에는 행 번호를 붙인다
+    counts = collections.Counter(os.path.normcase(it["out_path"]) for it in items)
+    for it in items:
+        if not it["named"] and counts[os.path.normcase(it["out_path"])] > 1:
+            base_name, ext = os.path.splitext(it["out_path"])
+            it["out_path"] = f"{base_name}_r{it['row']}{ext}"
+    valid: List[dict] = []
+    claimed = set()
+    for it in items:
+        key = os.path.normcase(os.path.abspath(it["out_path"]))
+        if key == os.path.normcase(os.path.abspath(it["file"])):
+            invalid.append((it["row"], it["file"], "output would replace the input"))
+        elif key in claimed:
+            invalid.append((it["row"], it["file"], f"output {it['out_path']} is already used by another row"))
+        elif os.path.exists(it["out_path"]) and not overwrite:
+            invalid.append((it["row"], it["file"], f"{it['out_path']} exists"))
+        else:
+            claimed.add(key)
+            valid.append(it)
+    invalid.sort()
+    return valid, invalid
+
+
+def _manifest_tasks(items: List[dict], ffmpeg: str, requested_workers: int = BATCH_EXPORT_WORKERS):
+    """Return (tasks, workers) for validated manifest items.
+
+    Tasks carry only what the runner needs for scheduling and progress; the ffmpeg
+    command of each is built by its ``prepare`` callable right before it runs.
+    """
+    reencode_count = 0
+    for it in items:
+        mode = it["settings"].mode
+        if mode != "fast" or _export_filters(it["settings"], it["width"], it["height"]):
+            reencode_count += 1
+    workers, x264_threads = _export_worker_plan(len(items), reencode_count, requested_workers)
+    tasks = []
+    for it in items:
+        tasks.append({
+            "out_path": it["out_path"],
+            "duration_us": max(1, int(max(0.001, float(it["dur_sec"])) * 1_000_000.0)),
+            "label": f"row {it['row']}: {os.path.basename(it['file'])}",
+            "row": it["row"],
+            "input_path": it["file"],
+            "prepare": functools.partial(
+                _export_task, it["settings"], ffmpeg, it["file"], it["out_path"], it["start_sec"], it["dur_sec"],
+                it["width"], it["height"], it["fps"], it["codec"], x264_threads,
+            ),
+        })
+    return tasks, workers
+
+
+def _manifest_results_path(manifest_path: str) -> str:
+    base, _ = os.path.splitext(manifest_path)
+    return base + ".results.csv"
+
+
+class ManifestResults:
+    """Per-row results of a manifest batch, appended to a CSV as rows finish (MANIFEST_RESULT_COLUMNS).
+
+    Rows rejected by validation are written up front with status ``invalid``. Safe to call from
+    the runner's worker threads; ``counts`` tallies the statuses written so far.
+    """
+
+    def __init__(self, path: str, tasks: List[dict], invalid: List[tuple]):
+        self.path = path
+        self._rows = {i: task for i, task in enumerate(tasks)}
+        self._lock = threading.Lock()
+        self.counts = collections.Counter()
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(MANIFEST_RESULT_COLUMNS)
+        for row, file, error in invalid:
+            self._write([row, file, "", "invalid", error, "", "", ""])
+        self._file.flush()
+
+    def on_result(self, task_idx: int, ok: bool, err: str, record: dict):
+        task = self._rows[task_idx]
+        status = record.get("status") or ("ok" if ok else "failed")
+        error = "" if ok else ((err or "").strip().splitlines() or [""])[-1]
+        with self._lock:
+            self._write([task["row"], task["input_path"], task["out_path"], status, error,
+                         record.get("wall_sec", ""), record.get("realtime_factor") or "",
+                         record.get("output_bytes", "")])
+            self._file.flush()
+
+    def _write(self, values: list):
+        self._writer.writerow(values)
+        self.counts[values[3]] += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()